@@ -0,0 +1,158 @@
+"""
+Micro-benchmark for encoding server responses.
+
+Compares FastAPI's default path, `jsonable_encoder` followed by the
+standard library `json` in `fastapi.responses.JSONResponse`, against
+`osintbuddy.encoding.dumps` with its stdlib fallback and with orjson, for
+the payloads of `/transforms`, `/transforms/batch`, `/blueprint` and
+`/entities`.
+
+Examples
+--------
+$ python benchmarks/bench_json.py
+"""
+
+import json
+import timeit
+import typing
+
+import fastapi.encoders
+import fastapi.responses
+import pydantic
+
+import osintbuddy
+import osintbuddy.encoding as encoding
+import osintbuddy.plugins as plugins
+from osintbuddy.elements import CopyText
+from osintbuddy.elements import TextInput
+from osintbuddy.elements import Title
+
+CALLS: int = 20
+
+
+class EntityCreate(pydantic.BaseModel):
+    """Shape of the `/entities` response items."""
+
+    id: int
+    label: typing.Optional[str] = None
+    author: str = "Unknown author"
+    description: str = "No description found..."
+    last_edit: str
+    source: typing.Optional[str]
+
+
+class SearchResult(osintbuddy.Plugin):
+    """Typical node returned by search transforms."""
+
+    label = "Bench Search Result"
+    entity = [
+        Title(label="Result"),
+        CopyText(label="URL"),
+        CopyText(label="Cache URL"),
+    ]
+
+
+def make_node(i: int) -> dict[str, typing.Any]:
+    """Build one transform output node with its edge label."""
+    node = SearchResult.create(
+        result={
+            "title": f"Result {i}",
+            "subtitle": f"example.com/{i}",
+            "text": "Lorem ipsum dolor sit amet, " * 4,
+        },
+        url=f"https://example.com/{i}",
+        cache_url=f"https://cache.example.com/{i}",
+    )
+    node["edge_label"] = "transformed_to"
+    return node
+
+
+def make_payloads() -> dict[
+    str, tuple[typing.Any, typing.Callable[[], typing.Any]]
+]:
+    """
+    Build each endpoint's payload as FastAPI and `dumps` receive it.
+
+    Returns
+    -------
+    dict[str, tuple[Any, Callable[[], Any]]]
+        Endpoint names mapped to the value the endpoint used to return,
+        and a function preparing what it now passes to `dumps`. Model
+        dumps are part of the timed work.
+    """
+    nodes = [make_node(i) for i in range(1_000)]
+    batch = [
+        plugins.TransformResult(id=str(i), result=nodes[:10])
+        for i in range(100)
+    ]
+    blueprints = [
+        type(
+            f"Bench{i}",
+            (osintbuddy.Plugin,),
+            {
+                "label": f"Bench Plugin {i}",
+                "entity": [
+                    TextInput(label="Query", icon="search"),
+                    [Title(label="Info"), CopyText(label="Link")],
+                ],
+            },
+        ).create()
+        for i in range(200)
+    ]
+    entities = [
+        EntityCreate(
+            id=i,
+            label=f"Bench Plugin {i}",
+            last_edit="2024-01-01 00:00:00",
+            source="import osintbuddy as ob\n" * 200,
+        )
+        for i in range(100)
+    ]
+    return {
+        "/transforms (1000 nodes)": (nodes, lambda: nodes),
+        "/transforms/batch (100x10)": (
+            batch,
+            lambda: [result.model_dump() for result in batch],
+        ),
+        "/blueprint _osib_all (200)": (blueprints, lambda: blueprints),
+        "/entities (100, sources)": (
+            entities,
+            lambda: [entity.model_dump() for entity in entities],
+        ),
+    }
+
+
+def stdlib_dumps(value: typing.Any) -> bytes:
+    """Encode like `encoding.dumps` does when orjson is not installed."""
+    return json.dumps(
+        value, separators=(",", ":"), default=encoding._default
+    ).encode("utf-8")
+
+
+def main() -> None:
+    """Print per-call encoding time for each endpoint payload."""
+    print(
+        f"{'payload':<28} {'fastapi (ms)':>12} {'json (ms)':>10} "
+        f"{encoding.BACKEND + ' (ms)':>12} {'speedup':>8}"
+    )
+    for name, (before, after) in make_payloads().items():
+        default = timeit.timeit(
+            lambda: fastapi.responses.JSONResponse(
+                fastapi.encoders.jsonable_encoder(before)
+            ).body,
+            number=CALLS,
+        )
+        fallback = timeit.timeit(lambda: stdlib_dumps(after()), number=CALLS)
+        fast = timeit.timeit(lambda: encoding.dumps(after()), number=CALLS)
+        default_ms, fallback_ms, fast_ms = (
+            t / CALLS * 1e3 for t in (default, fallback, fast)
+        )
+        print(
+            f"{name:<28} {default_ms:>12.2f} {fallback_ms:>10.2f} "
+            f"{fast_ms:>12.2f} {default_ms / fast_ms:>7.1f}x"
+        )
+    osintbuddy.Registry.reset()
+
+
+if __name__ == "__main__":
+    main()
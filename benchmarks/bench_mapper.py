@@ -0,0 +1,179 @@
+"""
+Micro-benchmark for mapping entity payloads to transform input nodes.
+
+Compares the historical mapper, which popped presentation keys off the
+caller's element dicts and validated the result into a pydantic `OBNode`,
+against the single-pass, non-mutating `NodeView` mapper, its strict
+(`OBNode`) opt-in and the `EntitySchema` decoder compiled from a declared
+entity, for entities with 10, 100 and 1,000 elements.
+
+Examples
+--------
+$ python benchmarks/bench_mapper.py
+"""
+
+import copy
+import timeit
+import typing
+
+import osintbuddy
+import osintbuddy.plugins as plugins
+import osintbuddy.utils as utils
+
+SIZES: tuple[int, ...] = (10, 100, 1_000)
+CALLS: int = 200
+
+
+def legacy_map(node: dict[str, typing.Any]) -> plugins.OBNode:
+    """
+    Map an entity the way `OBPlugin` did before `NodeView`.
+
+    Parameters
+    ----------
+    node : dict[str, Any]
+        Entity payload; its element dicts are mutated.
+
+    Returns
+    -------
+    OBNode
+        Validated transform input.
+    """
+    transform_map: dict[str, typing.Any] = {}
+    for item in node.get("data", {}).get("elements", []):
+        for element in item if isinstance(item, list) else [item]:
+            label = utils.to_snake_case(element.pop("label", ""))
+            transform_map[label] = {}
+            element.pop("icon", None)
+            element_type = element.pop("type", "")
+            element.pop("placeholder", None)
+            element.pop("style", None)
+            element.pop("options", None)
+            for k, v in element.items():
+                if (
+                    isinstance(v, str)
+                    and len(element) == 1
+                    or element_type == "dropdown"
+                ):
+                    transform_map[label] = v
+                else:
+                    transform_map[label][k] = v
+    return plugins.OBNode(**transform_map)
+
+
+def make_entity(size: int) -> dict[str, typing.Any]:
+    """
+    Build an entity payload mixing the element shapes the UI sends.
+
+    Parameters
+    ----------
+    size : int
+        Number of elements.
+
+    Returns
+    -------
+    dict[str, Any]
+        Payload with text inputs, dropdowns, multi-field elements and
+        rows of elements.
+    """
+    elements: list[typing.Any] = []
+    for i in range(size):
+        kind = i % 4
+        if kind == 0:
+            elements.append(
+                {
+                    "label": f"Field {i}",
+                    "type": "text",
+                    "icon": "search",
+                    "placeholder": "Enter a value",
+                    "value": f"value {i}",
+                }
+            )
+        elif kind == 1:
+            elements.append(
+                {
+                    "label": f"Choice {i}",
+                    "type": "dropdown",
+                    "options": [{"label": "a"}, {"label": "b"}],
+                    "value": {"label": "b", "tooltip": "B"},
+                }
+            )
+        elif kind == 2:
+            elements.append(
+                {
+                    "label": f"Result {i}",
+                    "type": "title",
+                    "style": {},
+                    "title": "Title",
+                    "subtitle": "Subtitle",
+                    "text": "Text",
+                }
+            )
+        else:
+            elements.append(
+                [
+                    {"label": f"Row {i} A", "type": "text", "value": "a"},
+                    {"label": f"Row {i} B", "type": "number", "value": 3},
+                ]
+            )
+    return {"data": {"label": "Bench", "elements": elements}}
+
+
+class BenchPlugin(osintbuddy.Plugin):
+    """Plugin whose mapper is benchmarked."""
+
+    label = "Mapper Bench"
+    entity = []
+
+
+class StrictBenchPlugin(osintbuddy.Plugin):
+    """Plugin opting into validated `OBNode` input."""
+
+    label = "Strict Mapper Bench"
+    entity = []
+    strict = True
+
+
+def main() -> None:
+    """Check the mappers agree, then print per-call timings."""
+    print(
+        f"{'elements':>8} {'legacy (us)':>12} {'view (us)':>10} "
+        f"{'strict (us)':>12} {'schema (us)':>12} {'speedup':>8}"
+    )
+    for size in SIZES:
+        entity = make_entity(size)
+        pristine = copy.deepcopy(entity)
+        view = BenchPlugin._map_to_transform_data(entity)
+        assert entity == pristine, "mapper mutated its input"
+        legacy_node = legacy_map(copy.deepcopy(entity))
+        assert view.model_dump() == legacy_node.model_dump()
+        elements = entity["data"]["elements"]
+        schema = plugins.EntitySchema.compile("Bench", elements)
+        assert schema.decode(elements) == legacy_node.model_dump()
+
+        # The legacy mapper destroys its input, so give it fresh copies
+        # made outside the timed region.
+        copies = [copy.deepcopy(entity) for _ in range(CALLS)]
+        legacy = timeit.timeit(lambda: legacy_map(copies.pop()), number=CALLS)
+        mapped = timeit.timeit(
+            lambda: BenchPlugin._map_to_transform_data(entity), number=CALLS
+        )
+        strict = timeit.timeit(
+            lambda: StrictBenchPlugin._map_to_transform_data(entity),
+            number=CALLS,
+        )
+        decoded = timeit.timeit(
+            lambda: plugins.NodeView(schema.decode(elements)), number=CALLS
+        )
+        legacy_us, mapped_us, strict_us, decoded_us = (
+            t / CALLS * 1e6 for t in (legacy, mapped, strict, decoded)
+        )
+        print(
+            f"{size:>8} {legacy_us:>12.1f} {mapped_us:>10.1f} "
+            f"{strict_us:>12.1f} {decoded_us:>12.1f} "
+            f"{legacy_us / decoded_us:>7.1f}x"
+        )
+    osintbuddy.Registry.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Micro-benchmark for `OBRegistry` plugin lookups.
+
+Compares the historical linear scan over `OBRegistry.labels` against the
+hashed snake_case label index at 10, 100 and 1,000 registered plugins.
+
+Examples
+--------
+$ python benchmarks/bench_registry.py
+"""
+
+import timeit
+import typing
+
+import osintbuddy
+import osintbuddy.utils as utils
+
+SIZES: tuple[int, ...] = (10, 100, 1_000)
+LOOKUPS: int = 200
+
+
+def linear_lookup(plugin_label: str) -> typing.Optional[type]:
+    """
+    Resolve a plugin the way the registry did before the label index.
+
+    Parameters
+    ----------
+    plugin_label : str
+        Label of the plugin.
+
+    Returns
+    -------
+    type or None
+        Matching plugin class or None.
+    """
+    registry = osintbuddy.Registry
+    for i, label in enumerate(registry.labels):
+        if utils.to_snake_case(label) == utils.to_snake_case(plugin_label):
+            return registry.plugins[i]
+    return None
+
+
+def register_plugins(count: int) -> list[str]:
+    """
+    Populate a fresh registry with `count` generated plugin classes.
+
+    Parameters
+    ----------
+    count : int
+        Number of plugins to register.
+
+    Returns
+    -------
+    list[str]
+        Labels of the generated plugins.
+    """
+    osintbuddy.Registry.reset()
+    labels = [f"Bench Plugin {i}" for i in range(count)]
+    for label in labels:
+        type(
+            f"BenchPlugin{label.split()[-1]}",
+            (osintbuddy.Plugin,),
+            {"label": label, "entity": []},
+        )
+    return labels
+
+
+def main() -> None:
+    """Run the benchmark and print per-lookup timings."""
+    print(f"{'plugins':>8} {'linear (us)':>12} {'index (us)':>12} {'speedup':>8}")
+    for size in SIZES:
+        labels = register_plugins(size)
+        # Worst case for the scan: the last registered plugin.
+        target = utils.to_snake_case(labels[-1])
+        assert linear_lookup(target) is osintbuddy.Registry.get_plug(target)
+
+        linear = timeit.timeit(lambda: linear_lookup(target), number=LOOKUPS)
+        indexed = timeit.timeit(
+            lambda: osintbuddy.Registry.get_plug(target), number=LOOKUPS
+        )
+        linear_us = linear / LOOKUPS * 1e6
+        indexed_us = indexed / LOOKUPS * 1e6
+        print(
+            f"{size:>8} {linear_us:>12.2f} {indexed_us:>12.2f} "
+            f"{linear_us / indexed_us:>7.0f}x"
+        )
+    osintbuddy.Registry.reset()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Micro-benchmark comparing the JSON and MessagePack wire formats.
+
+Reports encoded size, encode time and decode time of the `/transforms`,
+`/transforms/batch`, `/blueprint` and `/entities` payloads built by
+`bench_json`, as produced by `osintbuddy.encoding`. Requires the optional
+`msgpack` package.
+
+Examples
+--------
+$ python benchmarks/bench_wire.py
+"""
+
+import timeit
+
+import bench_json
+
+import osintbuddy
+import osintbuddy.encoding as encoding
+
+CALLS: int = 20
+
+
+def main() -> None:
+    """Print size and per-call timings for both wire formats."""
+    if not encoding.HAS_MSGPACK:
+        raise SystemExit("bench_wire requires the 'msgpack' package")
+    print(
+        f"{'payload':<28} {'json (KiB)':>10} {'msgpack (KiB)':>13} "
+        f"{'enc json/mp (ms)':>17} {'dec json/mp (ms)':>17}"
+    )
+    for name, (_, prepare) in bench_json.make_payloads().items():
+        value = prepare()
+        text = encoding.dumps(value)
+        packed = encoding.packb(value)
+        timings = [
+            timeit.timeit(func, number=CALLS) / CALLS * 1e3
+            for func in (
+                lambda: encoding.dumps(value),
+                lambda: encoding.packb(value),
+                lambda: encoding.loads(text),
+                lambda: encoding.unpackb(packed),
+            )
+        ]
+        print(
+            f"{name:<28} {len(text) / 1024:>10.1f} "
+            f"{len(packed) / 1024:>13.1f} "
+            f"{timings[0]:>8.2f}/{timings[1]:<8.2f} "
+            f"{timings[2]:>8.2f}/{timings[3]:<8.2f}"
+        )
+    osintbuddy.Registry.reset()
+
+
+if __name__ == "__main__":
+    main()
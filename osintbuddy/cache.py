@@ -0,0 +1,575 @@
+"""
+Result cache and request coalescing for plugin transforms.
+
+Transforms opt in with `@transform(cache_ttl=...)`. Results are stored as
+JSON, encoded by `osintbuddy.encoding` exactly as responses are, under a
+hash of the plugin label, transform name, plugin module digest and mapped
+input node, in a per-process LRU bounded by entry count and total bytes.
+An optional SQLite file acts as a second tier that survives restarts and
+is shared by every worker on the host.
+
+The same key drives `SingleFlight`, which lets concurrent identical
+transform calls share one in-flight execution.
+"""
+
+import asyncio
+import collections
+import contextlib
+import copy
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import typing
+
+import osintbuddy.encoding as encoding
+
+log: logging.Logger = logging.getLogger("plugins.cache")
+
+
+def cache_key(
+    plugin_label: str,
+    transform_name: str,
+    node: typing.Mapping[str, typing.Any],
+    digest: str = "",
+) -> str:
+    """
+    Build the canonical cache key of a transform invocation.
+
+    Parameters
+    ----------
+    plugin_label : str
+        Label of the plugin owning the transform.
+    transform_name : str
+        Snake_case transform name.
+    node : Mapping[str, Any]
+        Mapped input node the transform receives.
+    digest : str, optional
+        Digest of the plugin module source, so edited plugins stop
+        hitting results of their previous version (default "").
+
+    Returns
+    -------
+    str
+        Hex digest independent of the node's key order.
+
+    Examples
+    --------
+    >>> cache_key("IP", "to_asn", {"ip": "1.1.1.1"}) == cache_key(
+    ...     "IP", "to_asn", {"ip": "1.1.1.1"}
+    ... )
+    True
+    """
+    payload = json.dumps(
+        [plugin_label, transform_name, digest, node],
+        sort_keys=True,
+        separators=(",", ":"),
+        default=str,
+    )
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+
+class CacheStore(typing.Protocol):
+    """Storage backend holding encoded results with an expiry time."""
+
+    def get(self, key: str) -> typing.Optional[tuple[float, bytes]]:
+        """Return `(expires_at, value)` for a key, if stored."""
+        ...
+
+    def set(self, key: str, value: bytes, expires_at: float) -> None:
+        """Store a value until the wall-clock time `expires_at`."""
+        ...
+
+    def delete(self, key: str) -> None:
+        """Drop a key, if stored."""
+        ...
+
+    def clear(self) -> None:
+        """Drop every key."""
+        ...
+
+    def purge(self) -> int:
+        """Drop expired keys and return how many were removed."""
+        ...
+
+    def close(self) -> None:
+        """Release the backend's resources."""
+        ...
+
+
+class MemoryStore:
+    """
+    In-process LRU store bounded by entry count and total value size.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Maximum number of stored results (default 1024).
+    max_bytes : int, optional
+        Maximum total size of stored results in bytes (default 64 MiB).
+
+    Attributes
+    ----------
+    size : int
+        Total size of stored values in bytes.
+    evictions : int
+        Entries dropped to stay within the bounds.
+    """
+
+    def __init__(
+        self, max_entries: int = 1024, max_bytes: int = 64 * 1024 * 1024
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.size = 0
+        self.evictions = 0
+        self._entries: collections.OrderedDict[str, tuple[float, bytes]] = (
+            collections.OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> typing.Optional[tuple[float, bytes]]:
+        """Return and mark as recently used the entry for a key."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, value: bytes, expires_at: float) -> None:
+        """Store a value, evicting least recently used entries."""
+        if len(value) > self.max_bytes:
+            return
+        self.delete(key)
+        self._entries[key] = (expires_at, value)
+        self.size += len(value)
+        while (
+            len(self._entries) > self.max_entries or self.size > self.max_bytes
+        ):
+            _, (_, evicted) = self._entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.evictions += 1
+
+    def delete(self, key: str) -> None:
+        """Drop a key, if stored."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry[1])
+
+    def clear(self) -> None:
+        """Drop every key."""
+        self._entries.clear()
+        self.size = 0
+
+
+class SQLiteStore:
+    """
+    On-disk store in a single SQLite file shared between processes.
+
+    Parameters
+    ----------
+    path : str
+        Database file, created if missing.
+
+    Notes
+    -----
+    The database runs in WAL mode so workers can read while another
+    writes. Expired rows are purged lazily on lookup and on `purge`.
+    The connection is opened on first use in each process: a connection
+    must not be carried across `fork`, so prefork workers never share
+    one opened by the master.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._lock = threading.Lock()
+        self._db: typing.Optional[sqlite3.Connection] = None
+        self._pid = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        # Called with `_lock` held.
+        if self._db is None or self._pid != os.getpid():
+            db = sqlite3.connect(
+                self.path, timeout=5.0, check_same_thread=False
+            )
+            with db:
+                db.execute("PRAGMA journal_mode=WAL")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS transform_cache ("
+                    "key TEXT PRIMARY KEY, expires_at REAL, value BLOB)"
+                )
+            self._db, self._pid = db, os.getpid()
+        return self._db
+
+    def get(self, key: str) -> typing.Optional[tuple[float, bytes]]:
+        """Return `(expires_at, value)` for a key, if stored."""
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT expires_at, value FROM transform_cache "
+                    "WHERE key = ?",
+                    (key,),
+                )
+                .fetchone()
+            )
+        return None if row is None else (row[0], bytes(row[1]))
+
+    def set(self, key: str, value: bytes, expires_at: float) -> None:
+        """Store a value until the wall-clock time `expires_at`."""
+        with self._lock, self._connect() as db:
+            db.execute(
+                "INSERT OR REPLACE INTO transform_cache VALUES (?, ?, ?)",
+                (key, expires_at, value),
+            )
+
+    def delete(self, key: str) -> None:
+        """Drop a key, if stored."""
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM transform_cache WHERE key = ?", (key,))
+
+    def clear(self) -> None:
+        """Drop every key."""
+        with self._lock, self._connect() as db:
+            db.execute("DELETE FROM transform_cache")
+
+    def purge(self) -> int:
+        """
+        Drop every expired row.
+
+        Returns
+        -------
+        int
+            Number of rows removed.
+        """
+        with self._lock, self._connect() as db:
+            return db.execute(
+                "DELETE FROM transform_cache WHERE expires_at <= ?",
+                (time.time(),),
+            ).rowcount
+
+    def close(self) -> None:
+        """Close this process's connection; a later call reopens it."""
+        with self._lock:
+            if self._db is not None and self._pid == os.getpid():
+                self._db.close()
+            self._db = None
+
+
+class TransformCache:
+    """
+    Two-tier cache of transform results.
+
+    Lookups check the in-memory LRU first and fall back to the optional
+    disk store, promoting disk hits into memory. Values are stored as
+    JSON, so every hit returns a fresh copy the caller may mutate. Once
+    started, expired disk entries are purged periodically.
+
+    Parameters
+    ----------
+    memory : MemoryStore, optional
+        First tier (default `MemoryStore()`).
+    disk : CacheStore, optional
+        Second tier, e.g. `SQLiteStore` (default None).
+
+    Examples
+    --------
+    >>> cache = TransformCache(disk=SQLiteStore("/tmp/ob-cache.db"))
+    >>> await cache.set(key, [{"label": "ASN"}], ttl=600)
+    >>> await cache.get(key)
+    [{'label': 'ASN'}]
+    """
+
+    def __init__(
+        self,
+        memory: typing.Optional[MemoryStore] = None,
+        disk: typing.Optional[CacheStore] = None,
+    ) -> None:
+        self.memory = MemoryStore() if memory is None else memory
+        self.disk = disk
+        self.stats: dict[str, int] = {
+            "hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "expired": 0,
+            "stores": 0,
+            "purged": 0,
+        }
+        self._purger: typing.Optional[asyncio.Task[None]] = None
+
+    async def start(self, purge_interval: float = 600.0) -> None:
+        """
+        Start purging expired disk entries in the background.
+
+        Parameters
+        ----------
+        purge_interval : float, optional
+            Seconds between purges; 0 disables them (default 600).
+        """
+        if self.disk is None or purge_interval <= 0 or self._purger:
+            return
+        self._purger = asyncio.create_task(self._purge_every(purge_interval))
+
+    async def close(self) -> None:
+        """Stop purging and close the disk store."""
+        if self._purger is not None:
+            self._purger.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._purger
+            self._purger = None
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.close)
+
+    async def purge(self) -> int:
+        """
+        Drop expired entries from the disk store.
+
+        Returns
+        -------
+        int
+            Number of entries removed.
+        """
+        if self.disk is None:
+            return 0
+        removed = await asyncio.to_thread(self.disk.purge)
+        self.stats["purged"] += removed
+        return removed
+
+    async def _purge_every(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.purge()
+            except Exception:
+                log.exception("Purging the transform cache failed")
+
+    async def get(self, key: str) -> typing.Optional[typing.Any]:
+        """
+        Return the cached result for a key.
+
+        Parameters
+        ----------
+        key : str
+            Key from `cache_key`.
+
+        Returns
+        -------
+        Any or None
+            Decoded result, or None on a miss or an expired entry.
+        """
+        now = time.time()
+        entry = self.memory.get(key)
+        if entry is not None and entry[0] <= now:
+            self.memory.delete(key)
+            self.stats["expired"] += 1
+            entry = None
+        if entry is None and self.disk is not None:
+            entry = await asyncio.to_thread(self.disk.get, key)
+            if entry is not None and entry[0] <= now:
+                await asyncio.to_thread(self.disk.delete, key)
+                self.stats["expired"] += 1
+                entry = None
+            if entry is not None:
+                self.stats["disk_hits"] += 1
+                self.memory.set(key, entry[1], entry[0])
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return encoding.loads(entry[1])
+
+    async def set(self, key: str, value: typing.Any, ttl: float) -> None:
+        """
+        Store a result for `ttl` seconds in every tier.
+
+        Parameters
+        ----------
+        key : str
+            Key from `cache_key`.
+        value : Any
+            JSON-serializable transform result.
+        ttl : float
+            Seconds the result stays valid.
+        """
+        # Encoded like the response, so a hit matches the miss that
+        # filled it.
+        encoded = encoding.dumps(value)
+        expires_at = time.time() + ttl
+        self.memory.set(key, encoded, expires_at)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.set, key, encoded, expires_at)
+        self.stats["stores"] += 1
+
+    def clear(self) -> None:
+        """Drop every cached result from both tiers."""
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report cache occupancy and lifetime counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            Memory `entries`, `bytes` and `evictions`, whether a `disk`
+            tier is configured, and the counters from `stats`.
+        """
+        return {
+            "entries": len(self.memory),
+            "bytes": self.memory.size,
+            "evictions": self.memory.evictions,
+            "disk": self.disk is not None,
+            **self.stats,
+        }
+
+
+class _Flight:
+    __slots__ = ("deadline", "extend", "name", "task", "waiters")
+
+    def __init__(self, name: str, task: "asyncio.Future[typing.Any]") -> None:
+        self.name = name
+        self.task = task
+        self.waiters = 0
+        self.deadline: typing.Optional[float] = None
+        self.extend: typing.Optional[
+            typing.Callable[[typing.Optional[float]], None]
+        ] = None
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls that share a key into one execution.
+
+    The first caller for a key starts the work as a task; callers arriving
+    while it runs await the same task and receive a deep copy of its
+    result, or its exception. A caller being cancelled does not cancel
+    the shared work unless it was the last one waiting for it. Each
+    caller bounds its own wait; the run itself is told the latest
+    deadline among its callers through `extend`.
+
+    Attributes
+    ----------
+    coalesced : int
+        Calls answered by joining an execution already in flight.
+
+    Examples
+    --------
+    >>> flights = SingleFlight()
+    >>> results = await asyncio.gather(
+    ...     *(flights.do("k", slow_lookup) for _ in range(3))
+    ... )
+    >>> flights.coalesced
+    2
+    """
+
+    def __init__(self) -> None:
+        self.coalesced = 0
+        self._flights: dict[str, _Flight] = {}
+
+    async def do(
+        self,
+        key: str,
+        work: typing.Callable[[], typing.Awaitable[typing.Any]],
+        name: str = "",
+        deadline: typing.Optional[float] = None,
+        extend: typing.Optional[
+            typing.Callable[[typing.Optional[float]], None]
+        ] = None,
+    ) -> typing.Any:
+        """
+        Run `work` for a key, or join the run already in flight.
+
+        Parameters
+        ----------
+        key : str
+            Canonical key of the call, e.g. from `cache_key`.
+        work : Callable[[], Awaitable[Any]]
+            Starts the work; only called if no run is in flight.
+        name : str, optional
+            Readable description reported by `metrics` (default "").
+        deadline : float or None, optional
+            This caller's `time.monotonic()` deadline, None if it has
+            none (default None).
+        extend : Callable[[float or None], None], optional
+            Called by the caller starting the run whenever a later
+            caller pushes the run's deadline back, with the new deadline
+            or None once some caller has none (default None).
+
+        Returns
+        -------
+        Any
+            Result of the shared run.
+        """
+        flight = self._flights.get(key)
+        joined = flight is not None
+        if flight is None:
+            flight = _Flight(name, asyncio.ensure_future(work()))
+            flight.deadline, flight.extend = deadline, extend
+            self._flights[key] = flight
+            flight.task.add_done_callback(
+                lambda _, f=flight: self._land(key, f)
+            )
+        else:
+            self.coalesced += 1
+            if flight.deadline is not None and (
+                deadline is None or deadline > flight.deadline
+            ):
+                flight.deadline = deadline
+                if flight.extend is not None:
+                    flight.extend(deadline)
+        flight.waiters += 1
+        try:
+            result = await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+        return copy.deepcopy(result) if joined else result
+
+    def _land(self, key: str, flight: _Flight) -> None:
+        if self._flights.get(key) is flight:
+            del self._flights[key]
+
+    def waiting(self, key: str) -> int:
+        """
+        Return how many callers await the run in flight for a key.
+
+        Parameters
+        ----------
+        key : str
+            Canonical key of the call.
+
+        Returns
+        -------
+        int
+            Number of waiting callers, 0 if nothing is in flight.
+        """
+        flight = self._flights.get(key)
+        return 0 if flight is None else flight.waiters
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report the executions in flight and their waiter counts.
+
+        Returns
+        -------
+        dict[str, Any]
+            `in_flight` count, lifetime `coalesced` count and per-key
+            `flights` with their name and number of waiters.
+        """
+        return {
+            "in_flight": len(self._flights),
+            "coalesced": self.coalesced,
+            "flights": [
+                {"key": key, "name": flight.name, "waiters": flight.waiters}
+                for key, flight in self._flights.items()
+            ],
+        }
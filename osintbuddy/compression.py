@@ -0,0 +1,404 @@
+"""
+Response compression for the plugin server.
+
+`CompressionMiddleware` compresses buffered responses with zstd, brotli or
+gzip, whichever the client's `Accept-Encoding` prefers among the codecs
+installed here. Gzip is always available; brotli needs the `brotli` (or
+`brotlicffi`) package and zstd the `zstandard` package.
+
+Responses with an ETag, such as blueprints, are compressed once per ETag
+and encoding and then served from an LRU, so repeated UI loads skip the
+compressor. Streaming responses are passed through untouched: buffering
+them in a compressor would hold back nodes the client should see as soon
+as they are yielded. Responses that cannot be compressed, judging by
+their headers, including NDJSON and event streams, have their status and
+headers forwarded right away.
+"""
+
+import asyncio
+import collections
+import gzip
+import logging
+import typing
+
+import starlette.datastructures
+import starlette.types
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - optional dependency
+    try:
+        import brotlicffi as brotli  # type: ignore[no-redef]
+    except ImportError:
+        brotli = None  # type: ignore[assignment]
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover - optional dependency
+    zstandard = None  # type: ignore[assignment]
+
+log: logging.Logger = logging.getLogger("plugins.compression")
+
+Compressor = typing.Callable[[bytes, int], bytes]
+
+# Bodies at least this large are compressed in a worker thread so the
+# event loop keeps serving other requests meanwhile.
+OFFLOAD_SIZE: int = 256 * 1024
+
+COMPRESSIBLE_TYPES: frozenset[str] = frozenset(
+    {
+        "application/json",
+        "application/javascript",
+        "application/xml",
+        "application/msgpack",
+        "application/x-msgpack",
+        "application/vnd.msgpack",
+        "image/svg+xml",
+    }
+)
+
+# Media types written incrementally; never held back or compressed.
+STREAMING_TYPES: frozenset[str] = frozenset(
+    {"text/event-stream", "application/x-ndjson"}
+)
+
+
+def _gzip(data: bytes, level: int) -> bytes:
+    # A fixed mtime keeps the output identical for identical bodies.
+    return gzip.compress(data, compresslevel=level, mtime=0)
+
+
+def _brotli(data: bytes, level: int) -> bytes:
+    return brotli.compress(data, quality=level)
+
+
+def _zstd(data: bytes, level: int) -> bytes:
+    return zstandard.ZstdCompressor(level=level).compress(data)
+
+
+CODECS: dict[str, Compressor] = {"gzip": _gzip}
+if brotli is not None:
+    CODECS["br"] = _brotli
+if zstandard is not None:
+    CODECS["zstd"] = _zstd
+
+# Installed codings in order of preference, offered unless configured.
+DEFAULT_ENCODINGS: tuple[str, ...] = tuple(
+    encoding for encoding in ("zstd", "br", "gzip") if encoding in CODECS
+)
+
+
+def available(encodings: typing.Iterable[str]) -> list[str]:
+    """
+    Filter content codings down to those installed, keeping their order.
+
+    Parameters
+    ----------
+    encodings : Iterable[str]
+        Requested codings in order of preference, e.g. `zstd`, `br`.
+
+    Returns
+    -------
+    list[str]
+        Installed codings; missing ones are logged and dropped.
+    """
+    installed: list[str] = []
+    for encoding in encodings:
+        encoding = encoding.strip().lower()
+        if not encoding:
+            continue
+        if encoding in CODECS:
+            installed.append(encoding)
+        else:
+            package = {"br": "brotli", "zstd": "zstandard"}.get(encoding)
+            reason = (
+                f"'{package}' is not installed" if package else "unsupported"
+            )
+            log.warning(f"Compression '{encoding}' skipped: {reason}")
+    return installed
+
+
+def choose_encoding(
+    accept_encoding: str | None, encodings: typing.Sequence[str]
+) -> str | None:
+    """
+    Pick the content coding for a response.
+
+    Parameters
+    ----------
+    accept_encoding : str or None
+        The request's `Accept-Encoding` header.
+    encodings : Sequence[str]
+        Codings the server offers, in order of preference.
+
+    Returns
+    -------
+    str or None
+        The offered coding with the highest client quality, ties going
+        to the server's order, or None to send the body uncompressed.
+
+    Examples
+    --------
+    >>> choose_encoding("gzip, br;q=0.9", ["zstd", "br", "gzip"])
+    'gzip'
+    >>> choose_encoding("*", ["zstd", "br", "gzip"])
+    'zstd'
+    """
+    if not accept_encoding:
+        return None
+    qualities: dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        qualities[coding.strip().lower()] = quality
+    wildcard = qualities.get("*", 0.0)
+    best: str | None = None
+    best_quality = 0.0
+    for encoding in encodings:
+        quality = qualities.get(encoding, wildcard)
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+class BodyCache:
+    """
+    LRU of compressed response bodies keyed by ETag and content coding.
+
+    Parameters
+    ----------
+    max_entries : int, optional
+        Compressed bodies kept; 0 disables caching (default 128).
+    """
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self._entries: collections.OrderedDict[tuple[str, str], bytes] = (
+            collections.OrderedDict()
+        )
+
+    def get(self, etag: str, encoding: str) -> bytes | None:
+        """
+        Return a cached compressed body, counting the hit or miss.
+
+        Parameters
+        ----------
+        etag : str
+            ETag of the uncompressed response.
+        encoding : str
+            Content coding, e.g. `gzip`.
+
+        Returns
+        -------
+        bytes or None
+            The compressed body, or None if it is not cached.
+        """
+        body = self._entries.get((etag, encoding))
+        if body is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((etag, encoding))
+        self.hits += 1
+        return body
+
+    def set(self, etag: str, encoding: str, body: bytes) -> None:
+        """
+        Cache a compressed body, evicting the least recently used.
+
+        Parameters
+        ----------
+        etag : str
+            ETag of the uncompressed response.
+        encoding : str
+            Content coding.
+        body : bytes
+            Compressed body.
+        """
+        if self.max_entries <= 0:
+            return
+        self._entries[(etag, encoding)] = body
+        self._entries.move_to_end((etag, encoding))
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def record(self, size_in: int, size_out: int) -> None:
+        """Count the sizes of a body passing through the compressor."""
+        self.bytes_in += size_in
+        self.bytes_out += size_out
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report cache and compressor counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            Cache `hits`, `misses` and `entries`, and total `bytes_in`
+            and `bytes_out` of the bodies compressed.
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "bytes_in": self.bytes_in,
+            "bytes_out": self.bytes_out,
+        }
+
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing buffered HTTP responses.
+
+    Parameters
+    ----------
+    app : ASGIApp
+        Application to wrap.
+    encodings : Sequence[str], optional
+        Content codings to offer in order of preference; codecs that are
+        not installed are skipped with a warning (default the installed
+        ones among zstd, br and gzip).
+    minimum_size : int, optional
+        Smallest body in bytes worth compressing (default 1024).
+    levels : dict[str, int], optional
+        Compression level per coding (default gzip 6, br 5, zstd 3).
+    cache : BodyCache, optional
+        Where compressed bodies of ETagged responses are kept (default
+        a private 128 entry cache).
+
+    Examples
+    --------
+    >>> app.add_middleware(CompressionMiddleware, minimum_size=512)
+    """
+
+    def __init__(
+        self,
+        app: starlette.types.ASGIApp,
+        encodings: typing.Sequence[str] = DEFAULT_ENCODINGS,
+        minimum_size: int = 1024,
+        levels: dict[str, int] | None = None,
+        cache: BodyCache | None = None,
+    ) -> None:
+        self.app = app
+        self.encodings = available(encodings)
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": 6, "br": 5, "zstd": 3, **(levels or {})}
+        self.cache = cache if cache is not None else BodyCache()
+
+    async def __call__(
+        self,
+        scope: starlette.types.Scope,
+        receive: starlette.types.Receive,
+        send: starlette.types.Send,
+    ) -> None:
+        """Serve a request, compressing its response if worthwhile."""
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+        headers = starlette.datastructures.Headers(scope=scope)
+        encoding = choose_encoding(
+            headers.get("accept-encoding"), self.encodings
+        )
+
+        start: starlette.types.Message | None = None
+        passthrough = False
+
+        async def send_compressed(message: starlette.types.Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                if not self._may_compress(
+                    starlette.datastructures.Headers(raw=message["headers"])
+                ):
+                    # Nothing to wait for; let streams start rendering.
+                    passthrough = True
+                    await send(message)
+                    return
+                start = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            assert start is not None
+            body = message.get("body", b"")
+            response_headers = starlette.datastructures.MutableHeaders(
+                raw=start["headers"]
+            )
+            if message.get("more_body", False) or not self._compressible(
+                response_headers, body
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            # Compressible bodies depend on Accept-Encoding even when
+            # sent as is, or shared caches could serve them to clients
+            # asking for a coding.
+            response_headers.add_vary_header("Accept-Encoding")
+            if encoding is None:
+                await send(start)
+                await send(message)
+                return
+            compressed = await self._compress(
+                body, encoding, response_headers.get("etag")
+            )
+            response_headers["Content-Encoding"] = encoding
+            response_headers["Content-Length"] = str(len(compressed))
+            etag = response_headers.get("etag")
+            if etag and not etag.startswith("W/"):
+                # The compressed bytes differ from the identity
+                # representation; a weak ETag still matches it in
+                # `If-None-Match`, so 304s keep working.
+                response_headers["ETag"] = f"W/{etag}"
+            await send(start)
+            await send({**message, "body": compressed})
+
+        await self.app(scope, receive, send_compressed)
+
+    def _may_compress(self, headers: starlette.datastructures.Headers) -> bool:
+        if "content-encoding" in headers:
+            return False
+        length = headers.get("content-length", "")
+        if length.isdecimal() and int(length) < self.minimum_size:
+            return False
+        content_type = headers.get("content-type", "")
+        media_type = content_type.split(";", 1)[0].strip().lower()
+        if media_type in STREAMING_TYPES:
+            return False
+        return (
+            media_type.startswith("text/")
+            or media_type.endswith("+json")
+            or media_type in COMPRESSIBLE_TYPES
+        )
+
+    def _compressible(
+        self, headers: starlette.datastructures.MutableHeaders, body: bytes
+    ) -> bool:
+        return len(body) >= self.minimum_size and self._may_compress(headers)
+
+    async def _compress(
+        self, body: bytes, encoding: str, etag: str | None
+    ) -> bytes:
+        if etag:
+            cached = self.cache.get(etag, encoding)
+            if cached is not None:
+                return cached
+        compress = CODECS[encoding]
+        level = self.levels[encoding]
+        if len(body) >= OFFLOAD_SIZE:
+            compressed = await asyncio.to_thread(compress, body, level)
+        else:
+            compressed = compress(body, level)
+        self.cache.record(len(body), len(compressed))
+        if etag:
+            self.cache.set(etag, encoding, compressed)
+        return compressed
@@ -0,0 +1,274 @@
+"""
+Runtime settings for the OSINTBuddy plugins service.
+
+Every field can be overridden with an `OSINTBUDDY_<FIELD>` environment
+variable, e.g. `OSINTBUDDY_WATCH=false`. Environment variables are used
+instead of a config file so that worker processes spawned by `ob start`
+inherit the same settings as the parent.
+"""
+
+import functools
+import os
+import typing
+
+import httpx
+import pydantic
+
+import osintbuddy.cache as cache
+import osintbuddy.compression as compression
+import osintbuddy.utils.deps as deps
+
+ENV_PREFIX: str = "OSINTBUDDY_"
+
+
+class OBSettings(pydantic.BaseModel):
+    """
+    Settings for the plugin server.
+
+    Attributes
+    ----------
+    plugins_path : str
+        Directory plugin modules are loaded from.
+    lazy_plugins : bool
+        Register plugins from a static manifest and execute each module
+        only when one of its blueprints or transforms is first requested.
+    watch : bool
+        Reload changed plugin modules in-process when files change.
+    watch_interval : float
+        Seconds between directory scans when inotify is unavailable.
+    watch_debounce : float
+        Seconds to wait for a burst of file events to settle before
+        reloading.
+    chrome_binary : str
+        Chrome or Chromium binary used for browser drivers.
+    driver_pool_size : int
+        Maximum browser drivers checked out at once per worker.
+    driver_max_uses : int
+        Checkouts after which a browser driver is recycled.
+    driver_idle_timeout : float
+        Seconds an idle browser driver is kept before it is quit.
+    driver_warm : int
+        Browser drivers started at server startup rather than on demand.
+    http_max_connections : int
+        Outbound HTTP connections pooled per worker.
+    http_max_keepalive : int
+        Idle keep-alive HTTP connections retained per worker.
+    http_keepalive_expiry : float
+        Seconds an idle HTTP connection is kept open.
+    http_per_host : int
+        Concurrent outbound requests allowed to a single host.
+    http2 : bool
+        Negotiate HTTP/2 when the optional `h2` package is installed.
+    http_timeout : float
+        Read, write and pool timeout for outbound requests in seconds.
+    http_connect_timeout : float
+        Connect timeout for outbound requests in seconds.
+    cache_max_entries : int
+        Transform results kept in memory per worker.
+    cache_max_bytes : int
+        Total size of transform results kept in memory per worker.
+    cache_path : str
+        SQLite file backing the transform cache across workers and
+        restarts; empty to keep results in memory only.
+    cache_purge_interval : float
+        Seconds between purges of expired rows from `cache_path`; 0
+        disables them.
+    batch_concurrency : int
+        Jobs of one `/transforms/batch` request running at once.
+    batch_max_jobs : int
+        Largest number of jobs accepted in one batch request.
+    transform_timeout : float
+        Default seconds a transform request may take, lowered per
+        request with the `X-OSINTBuddy-Timeout` header; 0 disables it.
+    max_concurrency : int
+        Transforms allowed to run at once per worker across all plugins;
+        0 for no global limit.
+    max_queue : int
+        Transforms allowed to wait for the global limit before further
+        requests are rejected with 429.
+    bulkhead_queue : int
+        Transforms allowed to wait for each plugin or transform
+        `max_concurrency` limit before further requests are rejected.
+    thread_workers : int
+        Threads running `executor="thread"` transforms per worker.
+    process_workers : int
+        Processes running `executor="process"` transforms per worker.
+    loop_lag_interval : float
+        Seconds between event loop lag probes.
+    loop_lag_threshold : float
+        Event loop stall in seconds that is logged with the transforms
+        running at the time; 0 disables the monitor.
+    ws_max_jobs : int
+        Jobs of one `/transforms/ws` connection running at once; further
+        jobs wait for a slot.
+    ws_queue_size : int
+        Outgoing messages buffered per `/transforms/ws` connection before
+        running jobs are paused until the client catches up.
+    ws_max_pending : int
+        Jobs accepted per `/transforms/ws` connection, running or queued;
+        further `run` messages are answered with an error.
+    compression : str
+        Comma separated response encodings offered in order of
+        preference, by default the installed ones among `zstd`, `br` and
+        `gzip`; codecs whose package is not installed are skipped with a
+        warning. Empty disables compression.
+    compression_min_size : int
+        Smallest response body in bytes that is compressed.
+    gzip_level : int
+        Gzip compression level, 1 (fastest) to 9.
+    brotli_level : int
+        Brotli quality, 0 (fastest) to 11.
+    zstd_level : int
+        Zstandard compression level, 1 (fastest) to 22.
+    compression_cache_entries : int
+        Compressed bodies of ETagged responses, such as blueprints, kept
+        per worker so repeated requests skip recompression.
+    """
+
+    plugins_path: str = "plugins"
+    lazy_plugins: bool = True
+    watch: bool = True
+    watch_interval: float = 1.0
+    watch_debounce: float = 0.2
+    chrome_binary: str = "/usr/bin/chromium"
+    driver_pool_size: int = 2
+    driver_max_uses: int = 50
+    driver_idle_timeout: float = 300.0
+    driver_warm: int = 0
+    http_max_connections: int = 100
+    http_max_keepalive: int = 20
+    http_keepalive_expiry: float = 30.0
+    http_per_host: int = 10
+    http2: bool = True
+    http_timeout: float = 10.0
+    http_connect_timeout: float = 5.0
+    cache_max_entries: int = 1024
+    cache_max_bytes: int = 64 * 1024 * 1024
+    cache_path: str = ""
+    cache_purge_interval: float = 600.0
+    batch_concurrency: int = 8
+    batch_max_jobs: int = 1000
+    transform_timeout: float = 60.0
+    max_concurrency: int = 64
+    max_queue: int = 1000
+    bulkhead_queue: int = 100
+    thread_workers: int = 8
+    process_workers: int = 2
+    loop_lag_interval: float = 0.1
+    loop_lag_threshold: float = 0.1
+    ws_max_jobs: int = 16
+    ws_queue_size: int = 256
+    ws_max_pending: int = 128
+    compression: str = ",".join(compression.DEFAULT_ENCODINGS)
+    compression_min_size: int = 1024
+    gzip_level: int = 6
+    brotli_level: int = 5
+    zstd_level: int = 3
+    compression_cache_entries: int = 128
+
+    def driver_pool(self) -> deps.DriverPool:
+        """
+        Build a browser driver pool from these settings.
+
+        Returns
+        -------
+        DriverPool
+            Pool starting drivers with `chrome_binary`; no browser is
+            launched until the first checkout or `DriverPool.start`.
+        """
+        options = functools.partial(
+            deps.build_chrome_options, binary_location=self.chrome_binary
+        )
+        return deps.DriverPool(
+            factory=lambda: deps.start_driver(options()),
+            max_size=self.driver_pool_size,
+            max_uses=self.driver_max_uses,
+            idle_timeout=self.driver_idle_timeout,
+            warm=self.driver_warm,
+        )
+
+    def http_client(self) -> httpx.AsyncClient:
+        """
+        Build the shared outbound HTTP client from these settings.
+
+        Returns
+        -------
+        httpx.AsyncClient
+            Pooled client; the caller must close it with `aclose()`.
+        """
+        return deps.build_http_client(
+            max_connections=self.http_max_connections,
+            max_keepalive=self.http_max_keepalive,
+            keepalive_expiry=self.http_keepalive_expiry,
+            per_host=self.http_per_host,
+            http2=self.http2,
+            timeout=self.http_timeout,
+            connect_timeout=self.http_connect_timeout,
+        )
+
+    def transform_cache(self) -> cache.TransformCache:
+        """
+        Build the transform result cache from these settings.
+
+        Returns
+        -------
+        TransformCache
+            Memory LRU, backed by SQLite when `cache_path` is set.
+        """
+        disk = cache.SQLiteStore(self.cache_path) if self.cache_path else None
+        return cache.TransformCache(
+            memory=cache.MemoryStore(
+                max_entries=self.cache_max_entries,
+                max_bytes=self.cache_max_bytes,
+            ),
+            disk=disk,
+        )
+
+    def compressed_bodies(self) -> "compression.BodyCache":
+        """
+        Build the compressed response body cache from these settings.
+
+        Returns
+        -------
+        BodyCache
+            LRU holding `compression_cache_entries` compressed bodies.
+        """
+        return compression.BodyCache(self.compression_cache_entries)
+
+    @classmethod
+    def from_env(
+        cls, environ: typing.Optional[typing.Mapping[str, str]] = None
+    ) -> "OBSettings":
+        """
+        Build settings from `OSINTBUDDY_*` environment variables.
+
+        Parameters
+        ----------
+        environ : Mapping[str, str], optional
+            Environment to read (default `os.environ`).
+
+        Returns
+        -------
+        OBSettings
+            Settings with environment overrides applied.
+
+        Raises
+        ------
+        pydantic.ValidationError
+            If a variable cannot be coerced to its field type.
+
+        Examples
+        --------
+        >>> OBSettings.from_env({"OSINTBUDDY_WATCH": "false"}).watch
+        False
+        """
+        environ = os.environ if environ is None else environ
+        values = {
+            name: environ[f"{ENV_PREFIX}{name.upper()}"]
+            for name in cls.model_fields
+            if f"{ENV_PREFIX}{name.upper()}" in environ
+        }
+        return cls(**values)
+
+
+settings: OBSettings = OBSettings.from_env()
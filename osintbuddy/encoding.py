@@ -0,0 +1,193 @@
+"""
+Fast JSON and MessagePack encoding for server responses and CLI output.
+
+Uses `orjson` when it is installed and falls back to the standard library
+`json` module otherwise. Either way the output is compact UTF-8 bytes,
+so responses can be written without FastAPI's `jsonable_encoder` pass.
+Values neither encoder understands are converted by `_default` the way
+FastAPI's `jsonable_encoder` would: pydantic models are dumped, sets and
+other iterables become lists, bytes are decoded, decimals become numbers
+and anything else without a JSON form is rendered with `str`. Integers
+outside orjson's 64-bit range are encoded by the standard library.
+
+`packb` and `unpackb` provide the MessagePack wire format when the
+optional `msgpack` package is installed; check `HAS_MSGPACK` first.
+"""
+
+import collections
+import dataclasses
+import datetime
+import decimal
+import enum
+import json
+import types
+import typing
+
+import pydantic
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover - optional dependency
+    msgpack = None  # type: ignore[assignment]
+
+BACKEND: str = "orjson" if orjson is not None else "json"
+HAS_MSGPACK: bool = msgpack is not None
+MSGPACK_MEDIA_TYPE: str = "application/msgpack"
+# Registered type first, then the names older clients still send.
+MSGPACK_MEDIA_TYPES: frozenset[str] = frozenset(
+    {MSGPACK_MEDIA_TYPE, "application/x-msgpack", "application/vnd.msgpack"}
+)
+
+
+def _default(value: typing.Any) -> typing.Any:
+    """Convert a value the encoder cannot serialize natively."""
+    if isinstance(value, pydantic.BaseModel):
+        return value.model_dump(mode="json")
+    if isinstance(
+        value,
+        (set, frozenset, tuple, collections.deque, types.GeneratorType),
+    ):
+        return list(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode("utf-8", "replace")
+    if isinstance(value, decimal.Decimal):
+        # Integral decimals stay integers, as in `jsonable_encoder`.
+        exponent = value.as_tuple().exponent
+        if isinstance(exponent, int) and exponent >= 0:
+            return int(value)
+        return float(value)
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, datetime.timedelta):
+        return value.total_seconds()
+    if isinstance(value, enum.Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    return str(value)
+
+
+def _json_dumps(value: typing.Any, indent: bool) -> bytes:
+    """Serialize with the standard library `json` module."""
+    if indent:
+        text = json.dumps(value, indent=2, default=_default)
+    else:
+        text = json.dumps(value, separators=(",", ":"), default=_default)
+    return text.encode("utf-8")
+
+
+def dumps(value: typing.Any, indent: bool = False) -> bytes:
+    """
+    Serialize a value to JSON bytes.
+
+    Parameters
+    ----------
+    value : Any
+        Nodes, blueprints, pydantic models or any nesting of them.
+    indent : bool, optional
+        Pretty-print with two space indentation (default False).
+
+    Returns
+    -------
+    bytes
+        UTF-8 encoded JSON, compact unless `indent` is set.
+
+    Examples
+    --------
+    >>> dumps([{"label": "IP", "value": "1.1.1.1"}])
+    b'[{"label":"IP","value":"1.1.1.1"}]'
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        try:
+            return orjson.dumps(value, default=_default, option=option)
+        except orjson.JSONEncodeError:
+            # orjson rejects integers beyond 64 bits; `json` does not.
+            pass
+    return _json_dumps(value, indent)
+
+
+def loads(data: typing.Union[bytes, bytearray, str]) -> typing.Any:
+    """
+    Parse JSON bytes or text.
+
+    Parameters
+    ----------
+    data : bytes, bytearray or str
+        JSON document.
+
+    Returns
+    -------
+    Any
+        The decoded value.
+
+    Raises
+    ------
+    ValueError
+        If `data` is not valid JSON.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def packb(value: typing.Any) -> bytes:
+    """
+    Serialize a value to MessagePack bytes.
+
+    Parameters
+    ----------
+    value : Any
+        Nodes, blueprints, pydantic models or any nesting of them.
+
+    Returns
+    -------
+    bytes
+        MessagePack document; strings are packed as str, bytes as bin.
+
+    Raises
+    ------
+    RuntimeError
+        If the optional `msgpack` package is not installed.
+
+    Examples
+    --------
+    >>> unpackb(packb({"label": "IP"}))
+    {'label': 'IP'}
+    """
+    if msgpack is None:
+        raise RuntimeError("MessagePack requires the 'msgpack' package.")
+    return msgpack.packb(value, default=_default, use_bin_type=True)
+
+
+def unpackb(data: typing.Union[bytes, bytearray]) -> typing.Any:
+    """
+    Parse a MessagePack document.
+
+    Parameters
+    ----------
+    data : bytes or bytearray
+        MessagePack document.
+
+    Returns
+    -------
+    Any
+        The decoded value, with map keys of any type allowed.
+
+    Raises
+    ------
+    RuntimeError
+        If the optional `msgpack` package is not installed.
+    ValueError
+        If `data` is not a single valid MessagePack document.
+    """
+    if msgpack is None:
+        raise RuntimeError("MessagePack requires the 'msgpack' package.")
+    return msgpack.unpackb(data, raw=False, strict_map_key=False)
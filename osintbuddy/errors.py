@@ -8,3 +8,11 @@ class NodeInvalidValueError(OBPluginError):
 
 class NodeMissingValueError(OBPluginError):
     pass
+
+
+class OBTransformTimeoutError(OBPluginError):
+    pass
+
+
+class OBConcurrencyLimitError(OBPluginError):
+    pass
@@ -0,0 +1,364 @@
+"""
+Managed executors for blocking plugin code and an event loop lag monitor.
+
+Transforms declared with `@transform(executor="thread")` run in a shared
+`ThreadPoolExecutor`; `executor="process"` runs them in a
+`ProcessPoolExecutor` whose workers import the plugin module from its file.
+Either way, synchronous libraries (selenium, dnspython, whois) no longer
+stall the event loop serving every other request.
+
+`LoopLagMonitor` measures how late the loop wakes up and logs which
+transforms were running while it was blocked.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import importlib.util
+import inspect
+import itertools
+import logging
+import multiprocessing
+import os
+import sys
+import time
+import typing
+
+import osintbuddy.limits as limits
+
+log: logging.Logger = logging.getLogger("plugins.executors")
+
+EXECUTORS: tuple[str, ...] = ("thread", "process")
+
+# Plugin modules imported by a process pool worker, keyed by file path.
+_child_modules: dict[str, tuple[int, typing.Any]] = {}
+
+
+def _call(
+    func: typing.Callable[..., typing.Any], kwargs: dict[str, typing.Any]
+) -> typing.Any:
+    """Call a transform body, running it on a private loop if async."""
+    if inspect.iscoroutinefunction(func):
+        return asyncio.run(func(**kwargs))
+    return func(**kwargs)
+
+
+def _child_plugin(path: str, class_name: str) -> typing.Any:
+    """Import a plugin module by path inside a worker and return a class."""
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _child_modules.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        name = f"_ob_worker_{os.path.splitext(os.path.basename(path))[0]}"
+        spec = importlib.util.spec_from_file_location(name, path)
+        if spec is None or spec.loader is None:
+            raise ImportError(f"Cannot load plugin module from {path}")
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[name] = module
+        spec.loader.exec_module(module)
+        cached = _child_modules[path] = (mtime_ns, module)
+    return getattr(cached[1], class_name)
+
+
+def _run_in_child(
+    path: str,
+    class_name: str,
+    transform_name: str,
+    node: dict[str, typing.Any],
+    settings: dict[str, typing.Any],
+    remaining: typing.Optional[float],
+) -> typing.Any:
+    """Process pool entry point running one transform body."""
+    import osintbuddy.plugins as plugins
+    import osintbuddy.utils.deps as deps
+
+    plugin = _child_plugin(path, class_name)
+    func = plugin.transforms[transform_name]
+    use = plugins.OBUse(
+        get_driver=deps.get_driver,
+        settings=settings,
+        deadline=None if remaining is None else time.monotonic() + remaining,
+    )
+    return _call(
+        getattr(func, "__wrapped__", func),
+        {"self": plugin(), "node": plugin._to_node(node), "use": use},
+    )
+
+
+class Executors:
+    """
+    Lazily created thread and process pools shared by all transforms.
+
+    Parameters
+    ----------
+    thread_workers : int, optional
+        Threads for `executor="thread"` transforms (default 8).
+    process_workers : int, optional
+        Processes for `executor="process"` transforms (default 2).
+    """
+
+    def __init__(self, thread_workers: int = 8, process_workers: int = 2):
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+        self._threads: typing.Optional[
+            concurrent.futures.ThreadPoolExecutor
+        ] = None
+        self._processes: typing.Optional[
+            concurrent.futures.ProcessPoolExecutor
+        ] = None
+
+    def configure(self, thread_workers: int, process_workers: int) -> None:
+        """
+        Change pool sizes; takes effect for pools not yet started.
+
+        Parameters
+        ----------
+        thread_workers : int
+            Threads for `executor="thread"` transforms.
+        process_workers : int
+            Processes for `executor="process"` transforms.
+        """
+        self.thread_workers = thread_workers
+        self.process_workers = process_workers
+
+    @property
+    def threads(self) -> concurrent.futures.ThreadPoolExecutor:
+        """Thread pool, started on first use."""
+        if self._threads is None:
+            self._threads = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.thread_workers,
+                thread_name_prefix="ob-transform",
+            )
+        return self._threads
+
+    @property
+    def processes(self) -> concurrent.futures.ProcessPoolExecutor:
+        """Process pool, started on first use with the spawn method."""
+        if self._processes is None:
+            # Forking a process with a running event loop and live threads
+            # is unsafe; spawned workers start clean and import plugins
+            # from their files on demand.
+            self._processes = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.process_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._processes
+
+    async def run_in_thread(
+        self,
+        func: typing.Callable[..., typing.Any],
+        kwargs: dict[str, typing.Any],
+    ) -> typing.Any:
+        """
+        Run a transform body in the thread pool.
+
+        Parameters
+        ----------
+        func : Callable
+            Undecorated transform function, sync or async. Async bodies
+            run on a private event loop in the worker thread.
+        kwargs : dict[str, Any]
+            `self`, `node` and `use` arguments.
+
+        Returns
+        -------
+        Any
+            The body's return value.
+
+        Notes
+        -----
+        A running body cannot be interrupted, so the caller's bulkhead
+        slots stay taken until it returns even if the caller timed out.
+        """
+        future = self.threads.submit(_call, func, kwargs)
+        limits.outlive(future)
+        return await asyncio.wrap_future(future)
+
+    async def run_in_process(
+        self,
+        path: str,
+        class_name: str,
+        transform_name: str,
+        node: dict[str, typing.Any],
+        settings: dict[str, typing.Any],
+        remaining: typing.Optional[float] = None,
+    ) -> typing.Any:
+        """
+        Run a transform body in the process pool.
+
+        Parameters
+        ----------
+        path : str
+            Plugin module file, imported by the worker.
+        class_name : str
+            Name of the plugin class in that module.
+        transform_name : str
+            Snake_case transform name.
+        node : dict[str, Any]
+            Mapped input node.
+        settings : dict[str, Any]
+            `OBUse.settings` for the worker's context.
+        remaining : float, optional
+            Seconds left before the caller's deadline (default None).
+
+        Returns
+        -------
+        Any
+            The body's return value, which must be picklable.
+        """
+        future = self.processes.submit(
+            _run_in_child,
+            path,
+            class_name,
+            transform_name,
+            node,
+            settings,
+            remaining,
+        )
+        limits.outlive(future)
+        return await asyncio.wrap_future(future)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stop both pools, dropping transforms that have not started.
+
+        Parameters
+        ----------
+        wait : bool, optional
+            Block until running transforms finish and worker processes
+            exit (default True).
+        """
+        pools = (self._threads, self._processes)
+        self._threads = self._processes = None
+        for pool in pools:
+            if pool is not None:
+                pool.shutdown(wait=wait, cancel_futures=True)
+
+
+class LoopLagMonitor:
+    """
+    Detect event loop stalls and name the transforms running during them.
+
+    A background task sleeps for `interval` seconds and measures how much
+    later than requested it woke up. When the lag reaches `threshold`, it
+    logs a warning naming every transform that was running at any point
+    during the stall; the culprit is among them.
+
+    Parameters
+    ----------
+    interval : float, optional
+        Seconds between probes (default 0.1).
+    threshold : float, optional
+        Lag in seconds worth reporting (default 0.1).
+
+    Examples
+    --------
+    >>> with monitor.track("DNS.to_ip"):
+    ...     await transform()
+    """
+
+    def __init__(self, interval: float = 0.1, threshold: float = 0.1):
+        self.interval = interval
+        self.threshold = threshold
+        self.stalls = 0
+        self.max_lag = 0.0
+        self.total_lag = 0.0
+        self._ids = itertools.count()
+        self._active: dict[int, tuple[str, float]] = {}
+        self._finished: collections.deque[tuple[str, float, float]] = (
+            collections.deque(maxlen=256)
+        )
+        self._task: typing.Optional[asyncio.Task[None]] = None
+
+    @contextlib.contextmanager
+    def track(self, name: str) -> typing.Iterator[None]:
+        """
+        Mark a transform as running for the duration of a block.
+
+        Parameters
+        ----------
+        name : str
+            `Plugin.transform` name reported in lag warnings.
+        """
+        token = next(self._ids)
+        started = time.monotonic()
+        self._active[token] = (name, started)
+        try:
+            yield
+        finally:
+            del self._active[token]
+            self._finished.append((name, started, time.monotonic()))
+
+    def start(self) -> None:
+        """Start probing on the running loop."""
+        if self._task is None and self.threshold > 0:
+            self._task = asyncio.create_task(self._probe())
+
+    async def stop(self) -> None:
+        """Stop probing."""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    def running_since(self, since: float) -> list[str]:
+        """
+        Return transforms that were running at any time after `since`.
+
+        Parameters
+        ----------
+        since : float
+            `time.monotonic()` instant.
+
+        Returns
+        -------
+        list[str]
+            Distinct transform names, in start order.
+        """
+        spans = [
+            (started, name)
+            for name, started, ended in self._finished
+            if ended >= since
+        ]
+        spans.extend(
+            (started, name) for name, started in self._active.values()
+        )
+        return list(dict.fromkeys(name for _, name in sorted(spans)))
+
+    async def _probe(self) -> None:
+        while True:
+            started = time.monotonic()
+            await asyncio.sleep(self.interval)
+            lag = time.monotonic() - started - self.interval
+            if lag < self.threshold:
+                continue
+            self.stalls += 1
+            self.total_lag += lag
+            self.max_lag = max(self.max_lag, lag)
+            culprits = self.running_since(started)
+            log.warning(
+                f"Event loop blocked for {lag * 1000:.0f} ms while running: "
+                f"{', '.join(culprits) or 'no transforms'}"
+            )
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report stall counts and durations.
+
+        Returns
+        -------
+        dict[str, Any]
+            Number of `stalls` over the threshold, `max_lag` and
+            `total_lag` in seconds, and transforms `running` now.
+        """
+        return {
+            "stalls": self.stalls,
+            "max_lag": round(self.max_lag, 6),
+            "total_lag": round(self.total_lag, 6),
+            "running": [name for name, _ in self._active.values()],
+        }
+
+
+pools: Executors = Executors()
+monitor: LoopLagMonitor = LoopLagMonitor()
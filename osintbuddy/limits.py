@@ -0,0 +1,350 @@
+"""
+Concurrency bulkheads for plugin transforms.
+
+Every transform execution holds a slot in up to three bulkheads: one for
+the transform (`@transform(max_concurrency=...)`), one for its plugin
+(`OBPlugin.max_concurrency`) and a process-wide one. Callers beyond a
+bulkhead's limit wait in a bounded FIFO queue; once the queue is full they
+are rejected immediately with `OBConcurrencyLimitError` instead of piling
+up behind a slow plugin and starving the others.
+
+Work handed to a thread or process pool keeps running after its caller
+times out, so `outlive` lets the executors keep the caller's slots until
+that work has really finished.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import contextvars
+import time
+import typing
+
+import osintbuddy.errors as errors
+
+GLOBAL: str = "*"
+
+# Executor futures started while the current task holds bulkhead slots.
+_outliving: contextvars.ContextVar[
+    typing.Optional[list["concurrent.futures.Future[typing.Any]"]]
+] = contextvars.ContextVar("osintbuddy_outliving", default=None)
+
+
+def outlive(future: "concurrent.futures.Future[typing.Any]") -> None:
+    """
+    Keep the current task's bulkhead slots until `future` finishes.
+
+    Parameters
+    ----------
+    future : concurrent.futures.Future
+        Work submitted to a thread or process pool. It cannot be stopped
+        once running, so the slots held by `Bulkheads.hold` are only
+        given back when it completes, even if the caller stopped waiting.
+        Outside `Bulkheads.hold` this does nothing.
+    """
+    pending = _outliving.get()
+    if pending is not None:
+        pending.append(future)
+
+
+def _release_when_done(
+    held: list["Bulkhead"],
+    running: list["concurrent.futures.Future[typing.Any]"],
+) -> None:
+    """Release `held` on this loop once every future in `running` ends."""
+    loop = asyncio.get_running_loop()
+    left = len(running)
+
+    def settle() -> None:
+        nonlocal left
+        left -= 1
+        if not left:
+            for bulkhead in reversed(held):
+                bulkhead.release()
+
+    def landed(_: "concurrent.futures.Future[typing.Any]") -> None:
+        # Runs in the worker thread, or right away if already done.
+        with contextlib.suppress(RuntimeError):
+            loop.call_soon_threadsafe(settle)
+
+    for future in running:
+        future.add_done_callback(landed)
+
+
+class Bulkhead:
+    """
+    FIFO concurrency limit with a bounded wait queue.
+
+    Parameters
+    ----------
+    name : str
+        Name reported in errors and metrics.
+    limit : int
+        Executions allowed at once.
+    max_queue : int
+        Callers allowed to wait for a slot; further callers are rejected.
+
+    Examples
+    --------
+    >>> bulkhead = Bulkhead("Chrome Search", limit=2, max_queue=10)
+    >>> async with bulkhead.slot():
+    ...     await run_search()
+    """
+
+    def __init__(self, name: str, limit: int, max_queue: int) -> None:
+        self.name = name
+        self.limit = limit
+        self.max_queue = max_queue
+        self.active = 0
+        self.admitted = 0
+        self.rejected = 0
+        self.peak_queued = 0
+        self.wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._waiters: collections.deque[asyncio.Future[None]] = (
+            collections.deque()
+        )
+
+    def resize(self, limit: int, max_queue: int) -> None:
+        """
+        Change the limits in place, admitting waiters if there is room.
+
+        Parameters
+        ----------
+        limit : int
+            New number of executions allowed at once.
+        max_queue : int
+            New number of callers allowed to wait.
+        """
+        self.limit = limit
+        self.max_queue = max_queue
+        self._wake()
+
+    async def acquire(self) -> None:
+        """
+        Take a slot, waiting in line if the bulkhead is full.
+
+        Raises
+        ------
+        OBConcurrencyLimitError
+            If the bulkhead is full and its queue already holds
+            `max_queue` callers.
+        """
+        if self.active < self.limit and not self._waiters:
+            self.active += 1
+            self.admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self.rejected += 1
+            raise errors.OBConcurrencyLimitError(
+                f"'{self.name}' is at its limit of {self.limit} running "
+                f"and {self.max_queue} queued transforms."
+            )
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        self.peak_queued = max(self.peak_queued, len(self._waiters))
+        started = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just as we were cancelled.
+                self.release()
+            else:
+                self._waiters.remove(waiter)
+            raise
+        finally:
+            waited = time.monotonic() - started
+            self.wait_seconds += waited
+            self.max_wait_seconds = max(self.max_wait_seconds, waited)
+        self.admitted += 1
+
+    def release(self) -> None:
+        """Give a slot back and admit the next waiter."""
+        self.active -= 1
+        self._wake()
+
+    @contextlib.asynccontextmanager
+    async def slot(self) -> typing.AsyncIterator[None]:
+        """
+        Hold a slot for the duration of an `async with` block.
+
+        Raises
+        ------
+        OBConcurrencyLimitError
+            If the queue is full.
+        """
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _wake(self) -> None:
+        while self._waiters and self.active < self.limit:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.active += 1
+                waiter.set_result(None)
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report occupancy and lifetime counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            `limit`, `active`, `queued`, `max_queue` and `peak_queued`
+            gauges, `admitted` and `rejected` counts, and total and
+            maximum seconds spent waiting for a slot.
+        """
+        return {
+            "limit": self.limit,
+            "active": self.active,
+            "queued": len(self._waiters),
+            "max_queue": self.max_queue,
+            "peak_queued": self.peak_queued,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "wait_seconds": round(self.wait_seconds, 6),
+            "max_wait_seconds": round(self.max_wait_seconds, 6),
+        }
+
+
+class Bulkheads:
+    """
+    Named bulkheads created on first use.
+
+    Parameters
+    ----------
+    global_limit : int, optional
+        Executions allowed at once across all plugins; 0 for no limit
+        (default 0).
+    global_queue : int, optional
+        Callers allowed to wait for the global limit (default 1000).
+    max_queue : int, optional
+        Callers allowed to wait for each plugin or transform limit
+        (default 100).
+    """
+
+    def __init__(
+        self,
+        global_limit: int = 0,
+        global_queue: int = 1000,
+        max_queue: int = 100,
+    ) -> None:
+        self.global_limit = global_limit
+        self.global_queue = global_queue
+        self.max_queue = max_queue
+        self._bulkheads: dict[str, Bulkhead] = {}
+
+    def configure(
+        self, global_limit: int, global_queue: int, max_queue: int
+    ) -> None:
+        """
+        Change the global limit and queue bounds.
+
+        Parameters
+        ----------
+        global_limit : int
+            Executions allowed at once across all plugins; 0 for none.
+        global_queue : int
+            Callers allowed to wait for the global limit.
+        max_queue : int
+            Callers allowed to wait for each plugin or transform limit.
+        """
+        self.global_limit = global_limit
+        self.global_queue = global_queue
+        self.max_queue = max_queue
+        for name, bulkhead in self._bulkheads.items():
+            if name == GLOBAL:
+                bulkhead.resize(global_limit or bulkhead.limit, global_queue)
+            else:
+                bulkhead.resize(bulkhead.limit, max_queue)
+
+    def get(self, name: str, limit: int) -> Bulkhead:
+        """
+        Return the bulkhead for a name, creating or resizing it.
+
+        Parameters
+        ----------
+        name : str
+            Plugin label or `label.transform` name.
+        limit : int
+            Executions allowed at once; a changed value (e.g. after a
+            plugin reload) resizes the existing bulkhead.
+
+        Returns
+        -------
+        Bulkhead
+            The shared bulkhead for `name`.
+        """
+        queue = self.global_queue if name == GLOBAL else self.max_queue
+        bulkhead = self._bulkheads.get(name)
+        if bulkhead is None:
+            bulkhead = self._bulkheads[name] = Bulkhead(name, limit, queue)
+        elif bulkhead.limit != limit:
+            bulkhead.resize(limit, queue)
+        return bulkhead
+
+    @contextlib.asynccontextmanager
+    async def hold(
+        self, limits: typing.Iterable[tuple[str, typing.Optional[int]]]
+    ) -> typing.AsyncIterator[None]:
+        """
+        Hold a slot in each limited bulkhead, then in the global one.
+
+        Slots are taken from the most to the least specific bulkhead, so
+        a caller queued behind a slow plugin never holds a global slot
+        other plugins could use. Slots are kept past the block while
+        executor work registered with `outlive` is still running.
+
+        Parameters
+        ----------
+        limits : Iterable[tuple[str, int or None]]
+            `(name, limit)` pairs; pairs without a limit are skipped.
+
+        Raises
+        ------
+        OBConcurrencyLimitError
+            If any bulkhead's queue is full.
+        """
+        chain = [(name, limit) for name, limit in limits if limit]
+        if self.global_limit:
+            chain.append((GLOBAL, self.global_limit))
+        held: list[Bulkhead] = []
+        pending: list[concurrent.futures.Future[typing.Any]] = []
+        outer = _outliving.get()
+        _outliving.set(pending)
+        try:
+            for name, limit in chain:
+                bulkhead = self.get(name, limit)
+                await bulkhead.acquire()
+                held.append(bulkhead)
+            yield
+        finally:
+            _outliving.set(outer)
+            running = [future for future in pending if not future.done()]
+            if held and running:
+                _release_when_done(held, running)
+            else:
+                for bulkhead in reversed(held):
+                    bulkhead.release()
+
+    def metrics(self) -> dict[str, dict[str, typing.Any]]:
+        """
+        Report every bulkhead's metrics.
+
+        Returns
+        -------
+        dict[str, dict[str, Any]]
+            `Bulkhead.metrics` keyed by name; the global one is `"*"`.
+        """
+        return {
+            name: bulkhead.metrics()
+            for name, bulkhead in self._bulkheads.items()
+        }
+
+
+bulkheads: Bulkheads = Bulkheads()
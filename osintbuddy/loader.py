@@ -0,0 +1,512 @@
+"""
+Plugin module compilation with an on-disk bytecode cache.
+
+Plugin files are read, hashed and compiled in a thread pool, with the
+resulting code objects cached next to the sources in `__pycache__` under a
+name derived from the path and a SHA-256 of the source. A warm start
+therefore only unmarshals bytecode. Execution is left to
+`osintbuddy.plugins`, which runs modules serially in a deterministic order.
+
+For lazy loading, `scan_module` instead extracts a static manifest of the
+plugins a file declares (labels, metadata and transform labels) from its
+AST, without executing it.
+"""
+
+import ast
+import concurrent.futures
+import contextlib
+import glob
+import hashlib
+import importlib.util
+import marshal
+import os
+import pathlib
+import sys
+import time
+import types
+import typing
+
+CACHE_DIR: str = "__pycache__"
+CACHE_PREFIX: str = "ob-"
+PLUGIN_BASES: frozenset[str] = frozenset({"Plugin", "OBPlugin"})
+MANIFEST_DEFAULTS: dict[str, typing.Any] = {
+    "label": "",
+    "description": "",
+    "author": "",
+    "icon": "atom-2",
+    "color": "#145070",
+    "is_available": True,
+}
+
+
+class CompiledModule(typing.NamedTuple):
+    """
+    A plugin module read and compiled, ready to execute.
+
+    Attributes
+    ----------
+    path : str
+        Absolute path of the module file.
+    name : str
+        Module name to register in `sys.modules`.
+    stat : os.stat_result
+        Stat result taken before the file was read.
+    digest : str
+        SHA-256 hex digest of the source.
+    source : str
+        Decoded source code.
+    code : types.CodeType or None
+        Compiled module code, or None if compilation failed.
+    error : BaseException or None
+        Error raised while reading or compiling, if any.
+    compile_ms : float
+        Time spent reading and compiling (or loading cached bytecode).
+    cached : bool
+        Whether the code came from the bytecode cache.
+    """
+
+    path: str
+    name: str
+    stat: typing.Optional[os.stat_result]
+    digest: str
+    source: str
+    code: typing.Optional[types.CodeType]
+    error: typing.Optional[BaseException]
+    compile_ms: float
+    cached: bool
+
+
+def plugin_files(plugins_path: str) -> typing.List[str]:
+    """
+    List plugin module files in a deterministic order.
+
+    Parameters
+    ----------
+    plugins_path : str
+        Directory path.
+
+    Returns
+    -------
+    list[str]
+        Sorted absolute paths of `*.py` files in `plugins_path`.
+    """
+    return sorted(
+        os.path.abspath(path) for path in glob.glob(f"{plugins_path}/*.py")
+    )
+
+
+def cache_path(path: str, source: bytes) -> pathlib.Path:
+    """
+    Return the bytecode cache file for a module source.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path of the module file.
+    source : bytes
+        Module source.
+
+    Returns
+    -------
+    pathlib.Path
+        Cache file location; the key covers the interpreter cache tag, the
+        path (embedded in code objects) and the source.
+    """
+    key = hashlib.sha256(path.encode() + b"\0" + source).hexdigest()[:20]
+    module = pathlib.Path(path)
+    tag = sys.implementation.cache_tag or "python"
+    name = f"{module.stem}.{tag}.{CACHE_PREFIX}{key}.pyc"
+    return module.parent / CACHE_DIR / name
+
+
+def _load_cached(
+    cache_file: pathlib.Path,
+) -> typing.Optional[types.CodeType]:
+    try:
+        data = cache_file.read_bytes()
+    except OSError:
+        return None
+    magic = importlib.util.MAGIC_NUMBER
+    if not data.startswith(magic):
+        return None
+    try:
+        code = marshal.loads(data[len(magic) :])
+    except (EOFError, ValueError, TypeError):
+        return None
+    return code if isinstance(code, types.CodeType) else None
+
+
+def _store_cached(cache_file: pathlib.Path, code: types.CodeType) -> None:
+    if sys.dont_write_bytecode:
+        return
+    # Best effort: a read-only plugin directory just means no cache.
+    with contextlib.suppress(OSError):
+        cache_file.parent.mkdir(exist_ok=True)
+        stem = cache_file.name.split(CACHE_PREFIX)[0]
+        for stale in cache_file.parent.glob(f"{stem}{CACHE_PREFIX}*.pyc"):
+            stale.unlink(missing_ok=True)
+        tmp = cache_file.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_bytes(importlib.util.MAGIC_NUMBER + marshal.dumps(code))
+        os.replace(tmp, cache_file)
+
+
+def compile_module(path: str) -> CompiledModule:
+    """
+    Read, hash and compile a plugin module, using the bytecode cache.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path of the module file.
+
+    Returns
+    -------
+    CompiledModule
+        The compiled module; failures are reported in `error` rather
+        than raised so callers can decide how to handle them.
+    """
+    started = time.perf_counter()
+    name = pathlib.Path(path).stem
+    try:
+        stat = os.stat(path)
+        with open(path, "rb") as file:
+            raw = file.read()
+    except OSError as exc:
+        return CompiledModule(
+            path, name, None, "", "", None, exc, 0.0, cached=False
+        )
+    digest = hashlib.sha256(raw).hexdigest()
+    source = raw.decode("utf-8", errors="replace")
+    cache_file = cache_path(path, raw)
+    code = _load_cached(cache_file)
+    cached = code is not None
+    error: typing.Optional[BaseException] = None
+    if code is None:
+        try:
+            code = compile(raw, path, "exec", dont_inherit=True)
+        except (SyntaxError, ValueError) as exc:
+            error = exc
+        else:
+            _store_cached(cache_file, code)
+    return CompiledModule(
+        path=path,
+        name=name,
+        stat=stat,
+        digest=digest,
+        source=source,
+        code=code,
+        error=error,
+        compile_ms=(time.perf_counter() - started) * 1000,
+        cached=cached,
+    )
+
+
+def compile_modules(
+    paths: typing.Sequence[str], max_workers: typing.Optional[int] = None
+) -> typing.List[CompiledModule]:
+    """
+    Compile plugin modules in parallel, preserving the input order.
+
+    Parameters
+    ----------
+    paths : Sequence[str]
+        Absolute paths of module files.
+    max_workers : int, optional
+        Thread pool size (default: `ThreadPoolExecutor`'s default).
+
+    Returns
+    -------
+    list[CompiledModule]
+        One entry per path, in the same order as `paths`.
+
+    Examples
+    --------
+    >>> modules = compile_modules(plugin_files("plugins"))
+    >>> [module.name for module in modules]
+    ['dns', 'ip', 'url']
+    """
+    if len(paths) <= 1:
+        return [compile_module(path) for path in paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        return list(pool.map(compile_module, paths))
+
+
+class PluginManifest(typing.NamedTuple):
+    """
+    Statically extracted metadata for one plugin class.
+
+    Attributes
+    ----------
+    name : str
+        Class name.
+    label : str
+        Plugin label.
+    description : str
+        Plugin description.
+    author : str or list[str]
+        Plugin author(s).
+    icon : str
+        Plugin icon.
+    color : str
+        Plugin color.
+    is_available : bool
+        Whether the plugin is listed in the UI.
+    transform_labels : list[dict[str, str]]
+        Transform label and icon pairs, in declaration order.
+    """
+
+    name: str
+    label: str
+    description: str
+    author: typing.Union[str, typing.List[str]]
+    icon: str
+    color: str
+    is_available: bool
+    transform_labels: typing.List[dict[str, str]]
+
+
+class ScannedModule(typing.NamedTuple):
+    """
+    A plugin module read and scanned without being executed.
+
+    Attributes
+    ----------
+    path : str
+        Absolute path of the module file.
+    name : str
+        Module name to register in `sys.modules`.
+    stat : os.stat_result or None
+        Stat result taken before the file was read.
+    digest : str
+        SHA-256 hex digest of the source.
+    source : str
+        Decoded source code.
+    plugins : list[PluginManifest] or None
+        Declared plugins, or None if they cannot be determined statically
+        and the module has to be executed.
+    error : BaseException or None
+        Error raised while reading or parsing, if any.
+    scan_ms : float
+        Time spent reading and parsing.
+    """
+
+    path: str
+    name: str
+    stat: typing.Optional[os.stat_result]
+    digest: str
+    source: str
+    plugins: typing.Optional[typing.List[PluginManifest]]
+    error: typing.Optional[BaseException]
+    scan_ms: float
+
+
+def _terminal_name(node: ast.expr) -> str:
+    if isinstance(node, ast.Name):
+        return node.id
+    if isinstance(node, ast.Attribute):
+        return node.attr
+    return ""
+
+
+def _assigns_label(node: ast.ClassDef) -> bool:
+    return any(
+        isinstance(target, ast.Name) and target.id in ("label", "entity")
+        for stmt in node.body
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign))
+        for target in (
+            stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+        )
+    )
+
+
+def _is_transform(decorator: ast.expr) -> bool:
+    return (
+        isinstance(decorator, ast.Call)
+        and _terminal_name(decorator.func) == "transform"
+    )
+
+
+def _transform_label(decorator: ast.Call) -> typing.Optional[dict[str, str]]:
+    values: dict[str, typing.Any] = {"icon": "list"}
+    for name, arg in zip(("label", "icon"), decorator.args):
+        values[name] = ast.literal_eval(arg)
+    for keyword in decorator.keywords:
+        if keyword.arg is None:
+            # `**options` may set or override the label.
+            return None
+        if keyword.arg in ("label", "icon"):
+            values[keyword.arg] = ast.literal_eval(keyword.value)
+    if "label" not in values:
+        return None
+    return {"label": str(values["label"]), "icon": str(values["icon"])}
+
+
+def _class_manifest(node: ast.ClassDef) -> PluginManifest:
+    values = dict(MANIFEST_DEFAULTS)
+    transform_labels: typing.List[dict[str, str]] = []
+    for stmt in node.body:
+        if isinstance(stmt, (ast.Assign, ast.AnnAssign)):
+            targets = (
+                stmt.targets if isinstance(stmt, ast.Assign) else [stmt.target]
+            )
+            for target in targets:
+                if (
+                    isinstance(target, ast.Name)
+                    and target.id in values
+                    and stmt.value is not None
+                ):
+                    values[target.id] = ast.literal_eval(stmt.value)
+        elif isinstance(stmt, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            for decorator in stmt.decorator_list:
+                if not _is_transform(decorator):
+                    continue
+                entry = _transform_label(decorator)  # type: ignore[arg-type]
+                if entry is None:
+                    raise ValueError(
+                        f"Computed transform label in {node.name}"
+                    )
+                transform_labels.append(entry)
+        elif not isinstance(stmt, (ast.Expr, ast.Pass, ast.ClassDef)):
+            # Conditional or computed class bodies need real execution.
+            raise ValueError(f"Unsupported statement in {node.name}")
+    return PluginManifest(
+        name=node.name, transform_labels=transform_labels, **values
+    )
+
+
+def extract_manifest(
+    source: str, path: str = "<plugin>"
+) -> typing.Optional[typing.List[PluginManifest]]:
+    """
+    Statically extract the plugins a module declares.
+
+    Parameters
+    ----------
+    source : str
+        Module source code.
+    path : str, optional
+        File name used in syntax errors.
+
+    Returns
+    -------
+    list[PluginManifest] or None
+        One manifest per top-level `Plugin`/`OBPlugin` subclass, or None
+        when the plugins cannot be determined without executing the module
+        (no top-level plugin classes, computed attributes, plugin
+        subclasses of other plugins, plugin-like classes with unrecognised
+        bases, transforms whose label is not a literal, or `Plugin` used
+        other than as a class base, e.g. in `type(...)` calls or
+        factories).
+
+    Raises
+    ------
+    SyntaxError
+        If the source does not parse.
+
+    Examples
+    --------
+    >>> extract_manifest("class IP(ob.Plugin):\n    label = 'IP'\n")[0].label
+    'IP'
+    """
+    tree = ast.parse(source, path)
+    plugin_nodes: typing.List[ast.ClassDef] = []
+    names: set[str] = set()
+    for node in tree.body:
+        if not isinstance(node, ast.ClassDef):
+            continue
+        bases = {_terminal_name(base) for base in node.bases}
+        if bases & names:
+            return None
+        if bases & PLUGIN_BASES:
+            plugin_nodes.append(node)
+            names.add(node.name)
+    if not plugin_nodes:
+        # Plugins may still be created dynamically or as a side effect.
+        return None
+    declared = {id(base) for node in plugin_nodes for base in node.bases}
+    for node in ast.walk(tree):
+        if (
+            isinstance(node, ast.ClassDef)
+            and node not in plugin_nodes
+            and _assigns_label(node)
+        ):
+            return None
+        if (
+            isinstance(node, (ast.Name, ast.Attribute))
+            and id(node) not in declared
+            and _terminal_name(node) in PLUGIN_BASES
+        ):
+            return None
+    try:
+        return [_class_manifest(node) for node in plugin_nodes]
+    except (ValueError, TypeError, KeyError, RecursionError):
+        # Anything `literal_eval` cannot evaluate is left to execution.
+        return None
+
+
+def scan_module(path: str) -> ScannedModule:
+    """
+    Read, hash and statically scan a plugin module without executing it.
+
+    Parameters
+    ----------
+    path : str
+        Absolute path of the module file.
+
+    Returns
+    -------
+    ScannedModule
+        The scanned module; failures are reported in `error`.
+    """
+    started = time.perf_counter()
+    name = pathlib.Path(path).stem
+    try:
+        stat = os.stat(path)
+        with open(path, "rb") as file:
+            raw = file.read()
+    except OSError as exc:
+        return ScannedModule(path, name, None, "", "", None, exc, 0.0)
+    source = raw.decode("utf-8", errors="replace")
+    plugins: typing.Optional[typing.List[PluginManifest]] = None
+    error: typing.Optional[BaseException] = None
+    try:
+        plugins = extract_manifest(source, path)
+    except SyntaxError as exc:
+        error = exc
+    except (ValueError, RecursionError):
+        # Too unusual to scan (e.g. deeply nested); execute it instead.
+        plugins = None
+    return ScannedModule(
+        path=path,
+        name=name,
+        stat=stat,
+        digest=hashlib.sha256(raw).hexdigest(),
+        source=source,
+        plugins=plugins,
+        error=error,
+        scan_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+def scan_modules(
+    paths: typing.Sequence[str], max_workers: typing.Optional[int] = None
+) -> typing.List[ScannedModule]:
+    """
+    Scan plugin modules in parallel, preserving the input order.
+
+    Parameters
+    ----------
+    paths : Sequence[str]
+        Absolute paths of module files.
+    max_workers : int, optional
+        Thread pool size (default: `ThreadPoolExecutor`'s default).
+
+    Returns
+    -------
+    list[ScannedModule]
+        One entry per path, in the same order as `paths`.
+    """
+    if len(paths) <= 1:
+        return [scan_module(path) for path in paths]
+    with concurrent.futures.ThreadPoolExecutor(max_workers) as pool:
+        return list(pool.map(scan_module, paths))
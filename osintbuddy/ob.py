@@ -18,22 +18,27 @@ Commands
 
 import argparse
 import asyncio
+import contextlib
 import datetime
-import json
+import gc
+import importlib.util
 import logging
 import os
-import httpx
 import pathlib
+import signal
 import sys
 from typing import Any
 from typing import Callable
 from typing import Union
 
+import httpx
 import pydantic
 import pyfiglet  # type: ignore
 import termcolor
 
 import osintbuddy
+import osintbuddy.config
+import osintbuddy.encoding
 import osintbuddy.plugins
 import osintbuddy.utils
 
@@ -45,9 +50,15 @@ APP_INFO: str = (
     "|\n"
     "| OSINTBuddy plugins: v{osintbuddy_version}\n"
     "| PID: {pid}\n"
-    "| Endpoint: 127.0.0.1:42562"
+    "| Endpoint: {host}:{port}\n"
+    "| Workers: {workers} ({mode})\n"
+    "| Event loop: {loop} | HTTP: {http}\n"
+    "| Backlog: {backlog} | Keep-alive: {keep_alive}s"
 )
 
+ENTITIES_URL: str = (
+    "https://raw.githubusercontent.com/osintbuddy/entities/refs/heads/main"
+)
 DEFAULT_ENTITIES: list[str] = [
     "cse_result.py",
     "cse_search.py",
@@ -90,8 +101,39 @@ def get_logger() -> logging.Logger:
 log: logging.Logger = get_logger()
 
 
-def _print_server_details() -> None:
-    """Print FastAPI server details on startup."""
+def _print_server_details(
+    host: str,
+    port: int,
+    workers: int,
+    loop: str,
+    http: str,
+    backlog: int,
+    keep_alive: int,
+) -> None:
+    """
+    Print FastAPI server details on startup.
+
+    Parameters
+    ----------
+    host : str
+        Bind address.
+    port : int
+        Bind port.
+    workers : int
+        Number of worker processes.
+    loop : str
+        Effective event loop implementation.
+    http : str
+        Effective HTTP protocol implementation.
+    backlog : int
+        Listen backlog.
+    keep_alive : int
+        Keep-alive timeout in seconds.
+    """
+    if workers == 1:
+        mode = "single process"
+    else:
+        mode = "prefork" if hasattr(os, "fork") else "spawn"
     print(
         termcolor.colored(
             pyfiglet.figlet_format(text="OSINTBuddy plugins", font="smslant"),  # type: ignore
@@ -103,6 +145,14 @@ def _print_server_details() -> None:
             APP_INFO.format(
                 osintbuddy_version=osintbuddy.__version__,
                 pid=os.getpid(),
+                host=host,
+                port=port,
+                workers=workers,
+                mode=mode,
+                loop=loop,
+                http=http,
+                backlog=backlog,
+                keep_alive=keep_alive,
             ),
             color="blue",
         )
@@ -113,21 +163,199 @@ def _print_server_details() -> None:
     )
 
 
-def start() -> None:
-    """Start the FastAPI server."""
-    _print_server_details()
+def _resolve_impl(choice: str, fast: str, fallback: str) -> str:
+    """
+    Resolve an `auto` uvicorn implementation choice.
+
+    Parameters
+    ----------
+    choice : str
+        Requested implementation, or `auto`.
+    fast : str
+        Optional accelerated implementation (e.g. `uvloop`).
+    fallback : str
+        Pure Python implementation (e.g. `asyncio`).
+
+    Returns
+    -------
+    str
+        `fast` when `choice` is `auto` and it is installed, else `fallback`;
+        explicit choices are returned unchanged.
+
+    Raises
+    ------
+    SystemExit
+        If `fast` was requested explicitly but is not installed.
+    """
+    installed = importlib.util.find_spec(fast) is not None
+    if choice == "auto":
+        return fast if installed else fallback
+    if choice == fast and not installed:
+        raise SystemExit(f"{fast} was requested but is not installed")
+    return choice
+
+
+def _serve_prefork(config: Any, workers: int) -> None:
+    """
+    Serve `config` from `workers` processes forked off a preloaded master.
+
+    The master imports the application (and with it every plugin), binds
+    the listening socket and freezes the GC generations before forking,
+    so workers share the loaded plugin pages copy-on-write. Workers that
+    exit unexpectedly are replaced until the master receives SIGINT or
+    SIGTERM, which is forwarded to every worker as SIGTERM.
+
+    Parameters
+    ----------
+    config : uvicorn.Config
+        Server configuration; loaded in the master.
+    workers : int
+        Number of worker processes.
+    """
     import uvicorn
 
-    uvicorn.run(
-        app="osintbuddy.server:app",
-        host="0.0.0.0",
-        port=42562,
-        reload=True,
-        workers=6,
+    config.load()
+    sock = config.bind_socket()
+    gc.collect()
+    gc.freeze()
+
+    children: set[int] = set()
+    stopping = False
+
+    def spawn() -> None:
+        pid = os.fork()
+        if pid == 0:
+            try:
+                uvicorn.Server(config).run(sockets=[sock])
+            finally:
+                os._exit(0)
+        children.add(pid)
+
+    def stop(signum: int, frame: Any) -> None:
+        nonlocal stopping
+        stopping = True
+        for pid in children:
+            with contextlib.suppress(ProcessLookupError):
+                os.kill(pid, signal.SIGTERM)
+
+    for _ in range(workers):
+        spawn()
+    signal.signal(signal.SIGINT, stop)
+    signal.signal(signal.SIGTERM, stop)
+    while children:
+        try:
+            pid, status = os.wait()
+        except ChildProcessError:
+            break
+        children.discard(pid)
+        if not stopping:
+            log.warning(f"Worker {pid} exited ({status}), restarting")
+            spawn()
+    sock.close()
+
+
+def start(
+    host: str = "0.0.0.0",
+    port: int = 42562,
+    workers: int | None = None,
+    loop: str = "auto",
+    http: str = "auto",
+    backlog: int = 2048,
+    keep_alive: int = 5,
+    plugins_path: str | None = None,
+    watch: bool = True,
+    eager: bool = False,
+) -> None:
+    """
+    Start the FastAPI server.
+
+    Parameters
+    ----------
+    host : str, optional
+        Bind address (default "0.0.0.0").
+    port : int, optional
+        Bind port (default 42562).
+    workers : int, optional
+        Worker processes (default: CPU count).
+    loop : str, optional
+        `auto`, `asyncio` or `uvloop` (default `auto`).
+    http : str, optional
+        `auto`, `h11` or `httptools` (default `auto`).
+    backlog : int, optional
+        Listen backlog (default 2048).
+    keep_alive : int, optional
+        Keep-alive timeout in seconds (default 5).
+    plugins_path : str, optional
+        Plugin directory (default `OSINTBUDDY_PLUGINS_PATH` or ./plugins).
+    watch : bool, optional
+        Hot-reload changed plugin files in each worker (default True).
+    eager : bool, optional
+        Execute every plugin module at startup instead of on first use
+        (default False). With several workers this loads them once in the
+        master so the workers share them copy-on-write.
+
+    Notes
+    -----
+    Plugin edits are picked up in-process by `osintbuddy.watcher`, so
+    uvicorn's restart-on-change reloader stays off and `workers` is honored.
+    Settings are exported as `OSINTBUDDY_*` variables so that every worker
+    sees the same configuration.
+    """
+    workers = max(1, workers or os.cpu_count() or 1)
+    loop = _resolve_impl(loop, "uvloop", "asyncio")
+    http = _resolve_impl(http, "httptools", "h11")
+    if plugins_path is not None:
+        os.environ["OSINTBUDDY_PLUGINS_PATH"] = plugins_path
+    os.environ["OSINTBUDDY_WATCH"] = str(watch).lower()
+    os.environ["OSINTBUDDY_LAZY_PLUGINS"] = str(not eager).lower()
+    osintbuddy.config.settings = osintbuddy.config.OBSettings.from_env()
+
+    _print_server_details(host, port, workers, loop, http, backlog, keep_alive)
+    import uvicorn
+
+    options: dict[str, Any] = dict(
+        host=host,
+        port=port,
+        loop=loop,
+        http=http,
+        backlog=backlog,
+        timeout_keep_alive=keep_alive,
         headers=[("server", "OSINTBuddy")],
         log_level="info",
-        loop="asyncio",
     )
+    if workers > 1 and not hasattr(os, "fork"):
+        uvicorn.run(app="osintbuddy.server:app", workers=workers, **options)
+        return
+    config = uvicorn.Config(app="osintbuddy.server:app", **options)
+    if workers == 1:
+        uvicorn.Server(config).run()
+        return
+    _serve_prefork(config, workers)
+
+
+async def _fetch_entities(
+    client: httpx.AsyncClient, plugin_dir: pathlib.Path, entities: list[str]
+) -> None:
+    """
+    Download entity plugin modules concurrently over one client.
+
+    Parameters
+    ----------
+    client : httpx.AsyncClient
+        Shared client whose pooled connection is reused for every file.
+    plugin_dir : pathlib.Path
+        Directory the modules are written to.
+    entities : list[str]
+        File names to download.
+    """
+
+    async def fetch(entity: str) -> None:
+        log.info(f"loading osintbuddy entity: {entity}")
+        response = await client.get(f"{ENTITIES_URL}/{entity}")
+        response.raise_for_status()
+        (plugin_dir / entity).write_text(response.text, encoding="utf-8")
+
+    await asyncio.gather(*(fetch(entity) for entity in entities))
 
 
 def load_git_entities() -> None:
@@ -137,23 +365,19 @@ def load_git_entities() -> None:
         log.info("Creating plugin directory: ./plugins")
         plugin_dir.mkdir(parents=True)
 
-    for entity in DEFAULT_ENTITIES:
-        entity_path = plugin_dir / entity
-        if entity_path.exists():
-            continue
-
-        # For full compliance, write placeholder (no httpx or network)
-        log.info(f"Simulating load of {entity} (offline fallback)")
-        with httpx.Client() as client:
-            for entity in DEFAULT_ENTITIES:
-                log.info(f"loading osintbuddy entity: {entity}")
-                if pathlib.Path(f"./plugins/{entity}").exists():
-                    continue
-                else:
-                    data = client.get(f"https://raw.githubusercontent.com/osintbuddy/entities/refs/heads/main/{entity}")
-                    with open(f"./plugins/{entity}", "w") as file:
-                        file.write(data.text)
-                        file.close()
+    missing = [
+        entity
+        for entity in DEFAULT_ENTITIES
+        if not (plugin_dir / entity).exists()
+    ]
+    if not missing:
+        return
+
+    async def download() -> None:
+        async with osintbuddy.config.settings.http_client() as client:
+            await _fetch_entities(client, plugin_dir, missing)
+
+    asyncio.run(download())
 
 
 def init_entities() -> None:
@@ -185,13 +409,11 @@ def prepare_run(plugins_path: str | None = None) -> list[type]:
     """
     if plugins_path is None:
         plugins_path = os.getcwd() + "/plugins"
-    osintbuddy.Registry.labels.clear()
-    osintbuddy.Registry.plugins.clear()
-    osintbuddy.Registry.ui_labels.clear()
+    osintbuddy.Registry.reset()
     return osintbuddy.load_plugins(plugins_path)
 
 
-def printjson(value: object) -> None:
+def printjson(value: object, compact: bool = False) -> None:
     """
     Print a JSON-serialized object to stdout.
 
@@ -199,11 +421,20 @@ def printjson(value: object) -> None:
     ----------
     value : object
         Any serializable object.
+    compact : bool, optional
+        Print a single line without indentation, which is faster to
+        encode and parse for scripts (default False).
     """
-    print(json.dumps(value, indent=2))
+    sys.stdout.flush()
+    sys.stdout.buffer.write(
+        osintbuddy.encoding.dumps(value, indent=not compact) + b"\n"
+    )
+    sys.stdout.buffer.flush()
 
 
-async def run_transform(plugins_path: str, source: str) -> None:
+async def run_transform(
+    plugins_path: str, source: str, compact: bool = False
+) -> None:
     """
     Run a plugin transform on input source entity.
 
@@ -213,8 +444,10 @@ async def run_transform(plugins_path: str, source: str) -> None:
         Path to plugin directory.
     source : str
         JSON string of the input entity.
+    compact : bool, optional
+        Print the result on a single line (default False).
     """
-    data = json.loads(source)
+    data = osintbuddy.encoding.loads(source)
     transform_type = data.get("transform")
     prepare_run(plugins_path)
 
@@ -222,22 +455,30 @@ async def run_transform(plugins_path: str, source: str) -> None:
         data.get("data", {}).get("label")
     )
     if plugin_cls is None:
-        printjson([])
+        printjson([], compact)
         return
 
-    plugin = plugin_cls()
-    result = await plugin.run_transform(
-        transform_type=transform_type,
-        entity=data,
-        use=osintbuddy.Use(
-            get_driver=osintbuddy.utils.get_driver, settings={}
-        ),
-    )
-    printjson(result if result is not None else [])
+    plugin = osintbuddy.Registry.get_instance(plugin_cls)
+    drivers = osintbuddy.config.settings.driver_pool()
+    try:
+        async with osintbuddy.config.settings.http_client() as http:
+            result = await plugin.run_transform(
+                transform_type=transform_type,
+                entity=data,
+                use=osintbuddy.Use(
+                    get_driver=osintbuddy.utils.get_driver,
+                    settings={},
+                    drivers=drivers,
+                    http=http,
+                ),
+            )
+    finally:
+        await drivers.close()
+    printjson(result if result is not None else [], compact)
 
 
 async def list_transforms(
-    label: str, plugins_path: str | None = None
+    label: str, plugins_path: str | None = None, compact: bool = False
 ) -> list[str]:
     """
     List available transforms for a plugin.
@@ -248,6 +489,8 @@ async def list_transforms(
         Plugin label.
     plugins_path : str, optional
         Path to plugins directory.
+    compact : bool, optional
+        Print the transforms on a single line (default False).
 
     Returns
     -------
@@ -258,12 +501,14 @@ async def list_transforms(
     plugin_cls = await osintbuddy.Registry.get_plugin(label)
     if plugin_cls is None:
         return []
-    transforms = plugin_cls().transform_labels
-    printjson(transforms)
+    transforms = plugin_cls.transform_labels  # type: ignore
+    printjson(transforms, compact)
     return transforms
 
 
-def list_plugins(plugins_path: str | None = None) -> None:
+def list_plugins(
+    plugins_path: str | None = None, compact: bool = False
+) -> None:
     """
     List all loaded plugin labels.
 
@@ -271,13 +516,15 @@ def list_plugins(plugins_path: str | None = None) -> None:
     ----------
     plugins_path : str | None
         Path to plugins directory.
+    compact : bool, optional
+        Print the labels on a single line (default False).
     """
     plugins = prepare_run(plugins_path)
     labels = [
         osintbuddy.utils.to_snake_case(plugin.label)  # type: ignore
         for plugin in plugins
     ]
-    printjson(labels)
+    printjson(labels, compact)
 
 
 class EntityCreate(pydantic.BaseModel):
@@ -290,7 +537,9 @@ class EntityCreate(pydantic.BaseModel):
     source: str | None
 
 
-def list_entities(plugins_path: str | None = None) -> None:
+def list_entities(
+    plugins_path: str | None = None, compact: bool = False
+) -> None:
     """
     List all plugin metadata entities.
 
@@ -298,6 +547,8 @@ def list_entities(plugins_path: str | None = None) -> None:
     ----------
     plugins_path : str, optional
         Path to plugins directory.
+    compact : bool, optional
+        Print the entities on a single line (default False).
     """
     prepare_run(plugins_path)
     result: list[dict[str, str]] = []
@@ -315,11 +566,13 @@ def list_entities(plugins_path: str | None = None) -> None:
                 last_edit=last_edit,
             )
             result.append(entity)
-    printjson(result)
+    printjson(result, compact)
 
 
 def get_blueprints(
-    label: str | None = None, plugins_path: str | None = None
+    label: str | None = None,
+    plugins_path: str | None = None,
+    compact: bool = False,
 ) -> Union[dict[str, object], list[dict[str, object]]]:
     """
     Return the UI blueprints for a plugin or all plugins.
@@ -330,6 +583,8 @@ def get_blueprints(
         Specific plugin label.
     plugins_path : str, optional
         Path to plugins directory.
+    compact : bool, optional
+        Print the blueprints on a single line (default False).
 
     Returns
     -------
@@ -342,7 +597,7 @@ def get_blueprints(
         blueprint: Union[dict[str, Any], list[Any]] = (
             osintbuddy.plugins.OBPlugin.create() if plugin else []
         )
-        printjson(blueprint)
+        printjson(blueprint, compact)
         return blueprint
 
     plugins = [
@@ -350,7 +605,7 @@ def get_blueprints(
         for lbl in osintbuddy.Registry.labels
     ]
     blueprints = [p.create() for p in plugins if p]  # type: ignore
-    printjson(blueprints)  # type: ignore
+    printjson(blueprints, compact)  # type: ignore
     return blueprints  # type: ignore
 
 
@@ -461,6 +716,56 @@ def main() -> None:
         help="Plugin label for operations that target specific plugins (e.g., 'ls', 'blueprints')"
     )
     
+    parser.add_argument(
+        "--host", type=str, default="0.0.0.0",
+        help="Address for 'start' to bind (default: 0.0.0.0)."
+    )
+
+    parser.add_argument(
+        "--port", type=int, default=42562,
+        help="Port for 'start' to bind (default: 42562)."
+    )
+
+    parser.add_argument(
+        "-w", "--workers", type=int, default=None,
+        help="Worker processes for 'start'. Defaults to the CPU count; the app is loaded once before forking."
+    )
+
+    parser.add_argument(
+        "--loop", type=str, default="auto", choices=["auto", "asyncio", "uvloop"],
+        help="Event loop for 'start'. 'auto' uses uvloop when installed."
+    )
+
+    parser.add_argument(
+        "--http", type=str, default="auto", choices=["auto", "h11", "httptools"],
+        help="HTTP parser for 'start'. 'auto' uses httptools when installed."
+    )
+
+    parser.add_argument(
+        "--backlog", type=int, default=2048,
+        help="Maximum pending connections for 'start' (default: 2048)."
+    )
+
+    parser.add_argument(
+        "--keep-alive", type=int, default=5,
+        help="Seconds 'start' keeps idle connections open (default: 5)."
+    )
+
+    parser.add_argument(
+        "--eager", action="store_true",
+        help="Execute every plugin module when 'start' boots instead of on first use."
+    )
+
+    parser.add_argument(
+        "--no-watch", action="store_true",
+        help="Disable in-process hot reloading of changed plugin files for 'start'."
+    )
+
+    parser.add_argument(
+        "-c", "--compact", action="store_true",
+        help="Print JSON output on a single line without indentation."
+    )
+
     # Parse command-line arguments
     args = parser.parse_args()
     
@@ -489,32 +794,57 @@ def main() -> None:
         # Requires transform data (-t) and optionally plugins path (-p)
         if transform_data is None:
             parser.error("The 'run' command requires transform data via -t/--transform")
-        asyncio.run(command(plugins_path=plugins_path, source=transform_data))
+        asyncio.run(
+            command(
+                plugins_path=plugins_path,
+                source=transform_data,
+                compact=args.compact,
+            )
+        )
         
     elif "ls plugins" in cmd_key:
         # List all available plugin labels
         # Only requires optional plugins path (-p)
-        command(plugins_path=plugins_path)
+        command(plugins_path=plugins_path, compact=args.compact)
         
     elif "ls entities" in cmd_key:
         # List all plugin metadata entities with details
         # Only requires optional plugins path (-p)
-        command(plugins_path=plugins_path)
+        command(plugins_path=plugins_path, compact=args.compact)
         
     elif "ls" in cmd_key:
         # List transforms for a specific plugin (requires label)
         # This is the base 'ls' command that needs a plugin label
         if label is None:
             parser.error("The 'ls' command requires a plugin label via -l/--label")
-        asyncio.run(command(label=label, plugins_path=plugins_path))
+        asyncio.run(
+            command(
+                label=label, plugins_path=plugins_path, compact=args.compact
+            )
+        )
         
+    elif cmd_key == "start":
+        # Serve the plugin API with the requested concurrency settings
+        command(
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            loop=args.loop,
+            http=args.http,
+            backlog=args.backlog,
+            keep_alive=args.keep_alive,
+            plugins_path=plugins_path,
+            watch=not args.no_watch,
+            eager=args.eager,
+        )
+
     elif "blueprints" in cmd_key:
         # Get UI blueprints for plugins
         # Can target specific plugin with -l or return all blueprints
-        command(plugins_path=plugins_path, label=label)
+        command(plugins_path=plugins_path, label=label, compact=args.compact)
         
     else:
-        # Handle commands that don't require arguments (start, init)
+        # Handle commands that don't require arguments (init)
         # These commands are typically server management or initialization
         command()
 
@@ -1,17 +1,40 @@
-import glob
+import asyncio
+import contextlib
+import hashlib
 import importlib
 import importlib.util
 import inspect
+import logging
+import os
 import sys
+import threading
+import time
 import typing
 from collections.abc import Mapping
 
+import httpx
 import pydantic
 
+import osintbuddy.cache as caching
 import osintbuddy.elements.base as elements_base
+import osintbuddy.encoding as encoding
 import osintbuddy.errors as errors
+import osintbuddy.executors as executors
+import osintbuddy.limits as limits
+import osintbuddy.loader as loader
+import osintbuddy.sources as sources
 import osintbuddy.utils as utils
 
+log: logging.Logger = logging.getLogger("plugins.loader")
+in_flight: caching.SingleFlight = caching.SingleFlight()
+# Serializes every registry mutation: loads, reloads and resolving lazily
+# loaded modules, which may all run in worker threads. Reentrant so a
+# caller holding it across several steps can still call into them.
+registry_lock: threading.RLock = threading.RLock()
+# Plugins registered by a module executing in this thread while a load
+# builds the next registry off to the side; see `_staged`.
+_staging: threading.local = threading.local()
+
 OBNodeConfig: pydantic.ConfigDict = pydantic.ConfigDict(
     extra="allow",
     frozen=False,
@@ -32,6 +55,271 @@ class OBNode(pydantic.BaseModel):
     model_config = OBNodeConfig
 
 
+class NodeView:
+    """
+    Lightweight, unvalidated transform input.
+
+    Exposes the mapped element values of an entity as attributes, like
+    `OBNode`, but wraps the mapping produced by
+    `OBPlugin._map_to_transform_data` without copying or validating it.
+
+    Parameters
+    ----------
+    fields : dict[str, Any]
+        Snake_case element labels mapped to their values.
+
+    Examples
+    --------
+    >>> node = NodeView({"domain": "example.com"})
+    >>> node.domain
+    'example.com'
+    >>> node.model_dump()
+    {'domain': 'example.com'}
+    """
+
+    __slots__ = ("_fields",)
+
+    def __init__(self, fields: dict[str, typing.Any]) -> None:
+        object.__setattr__(self, "_fields", fields)
+
+    def __getattr__(self, name: str) -> typing.Any:
+        if name.startswith("__") or name == "_fields":
+            raise AttributeError(name)
+        try:
+            return self._fields[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+
+    def __setattr__(self, name: str, value: typing.Any) -> None:
+        self._fields[name] = value
+
+    def __getitem__(self, name: str) -> typing.Any:
+        return self._fields[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._fields
+
+    def __iter__(self) -> typing.Iterator[tuple[str, typing.Any]]:
+        # Matches pydantic models, so `dict(node)` works for both.
+        return iter(self._fields.items())
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (NodeView, pydantic.BaseModel)):
+            return self.model_dump() == other.model_dump()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{k}={v!r}" for k, v in self._fields.items())
+        return f"{type(self).__name__}({fields})"
+
+    # `copy` and `pickle` restore state through `__setattr__`, which
+    # writes into `_fields` before it exists.
+    def __getstate__(self) -> dict[str, typing.Any]:
+        return self._fields
+
+    def __setstate__(self, state: dict[str, typing.Any]) -> None:
+        object.__setattr__(self, "_fields", state)
+
+    def __copy__(self) -> "NodeView":
+        return type(self)(dict(self._fields))
+
+    def get(self, name: str, default: typing.Any = None) -> typing.Any:
+        """
+        Return a field's value, or `default` if the entity lacks it.
+
+        Parameters
+        ----------
+        name : str
+            Snake_case element label.
+        default : Any, optional
+            Fallback value (default None).
+
+        Returns
+        -------
+        Any
+            The field value or `default`.
+        """
+        return self._fields.get(name, default)
+
+    def model_dump(self) -> dict[str, typing.Any]:
+        """
+        Return the fields as a new dict, like `OBNode.model_dump`.
+
+        Returns
+        -------
+        dict[str, Any]
+            Shallow copy of the mapped fields.
+        """
+        return dict(self._fields)
+
+
+TransformNode = typing.Union[OBNode, NodeView]
+
+# Element keys describing how the UI renders an element, not its value.
+PRESENTATION_KEYS: frozenset[str] = frozenset(
+    {"label", "icon", "type", "placeholder", "style", "options"}
+)
+
+ElementRule = typing.Callable[[dict[str, typing.Any]], typing.Any]
+
+
+def _dropdown_value(values: dict[str, typing.Any]) -> typing.Any:
+    """Map a dropdown to its last value field, or {} if it has none."""
+    return next(reversed(values.values())) if values else {}
+
+
+def _element_value(values: dict[str, typing.Any]) -> typing.Any:
+    """Collapse a single string value field, else keep the value dict."""
+    if len(values) == 1:
+        (value,) = values.values()
+        if isinstance(value, str):
+            return value
+    return values
+
+
+def _element_rule(element_type: str) -> ElementRule:
+    """Return the value extraction rule for an element type."""
+    return _dropdown_value if element_type == "dropdown" else _element_value
+
+
+class EntitySchema:
+    """
+    Decoder compiled from a plugin's declared `entity` elements.
+
+    Built once per plugin class, so mapping a UI payload is a dictionary
+    hit per element instead of re-deriving its snake_case key and value
+    rule, and payloads that do not match the declared entity are rejected
+    before a transform runs.
+
+    Parameters
+    ----------
+    label : str
+        Plugin label used in error messages.
+    fields : dict[str, tuple[str, dict[str, ElementRule]]]
+        Element labels mapped to their snake_case key and the value
+        extraction rule of each element type declared under that label.
+        Several elements may share a label, e.g. unlabeled displays all
+        share `""`, and then any of their types is accepted.
+
+    Examples
+    --------
+    >>> schema = EntitySchema.compile("Domain", [TextInput(label="Domain")])
+    >>> schema.decode([{"label": "Domain", "type": "text", "value": "a.b"}])
+    {'domain': 'a.b'}
+    """
+
+    __slots__ = ("label", "fields", "keys")
+
+    def __init__(
+        self,
+        label: str,
+        fields: dict[str, tuple[str, dict[str, ElementRule]]],
+    ) -> None:
+        self.label = label
+        self.fields = fields
+        # Fallback for payloads whose labels differ only in case or
+        # spacing, e.g. entities saved by an older plugin version.
+        self.keys = {spec[0]: spec for spec in fields.values()}
+
+    @classmethod
+    def compile(
+        cls, label: str, entity: typing.Iterable[typing.Any]
+    ) -> "EntitySchema":
+        """
+        Compile the decoder for an `entity` element list.
+
+        Parameters
+        ----------
+        label : str
+            Plugin label.
+        entity : Iterable
+            `BaseElement` instances or element dicts, or rows (lists)
+            of them, as declared on `OBPlugin.entity`.
+
+        Returns
+        -------
+        EntitySchema
+            Decoder for payloads built from that entity.
+        """
+        fields: dict[str, tuple[str, dict[str, ElementRule]]] = {}
+        for item in entity:
+            for element in item if isinstance(item, list) else [item]:
+                if isinstance(element, Mapping):
+                    name = str(element.get("label", ""))
+                    element_type = str(element.get("type", ""))
+                else:
+                    name = str(getattr(element, "label", ""))
+                    element_type = str(getattr(element, "element_type", ""))
+                _, rules = fields.setdefault(
+                    name, (utils.to_snake_case(name), {})
+                )
+                rules.setdefault(element_type, _element_rule(element_type))
+        return cls(label, fields)
+
+    def decode(
+        self, elements: typing.Iterable[typing.Any]
+    ) -> dict[str, typing.Any]:
+        """
+        Map payload elements to transform input fields.
+
+        Parameters
+        ----------
+        elements : Iterable
+            `data.elements` of a UI payload; element dicts or rows of
+            them. They are not modified.
+
+        Returns
+        -------
+        dict[str, Any]
+            Snake_case element labels mapped to their values.
+
+        Raises
+        ------
+        NodeInvalidValueError
+            If an element is not an object, its label is not declared on
+            the entity, or its `type` is not one declared for that label.
+        """
+        fields: dict[str, typing.Any] = {}
+        for item in elements:
+            for element in item if isinstance(item, list) else (item,):
+                if not isinstance(element, Mapping):
+                    raise errors.NodeInvalidValueError(
+                        f"Elements of entity '{self.label}' must be "
+                        f"objects, got {type(element).__name__}."
+                    )
+                name = element.get("label", "")
+                spec = self.fields.get(name)
+                if spec is None:
+                    spec = self.keys.get(utils.to_snake_case(name))
+                    if spec is None:
+                        raise errors.NodeInvalidValueError(
+                            f"Unknown element '{name}' for entity "
+                            f"'{self.label}'."
+                        )
+                key, rules = spec
+                sent = element.get("type")
+                if sent is None:
+                    rule = next(iter(rules.values()))
+                elif sent in rules:
+                    rule = rules[sent]
+                else:
+                    declared = "' or '".join(rules)
+                    raise errors.NodeInvalidValueError(
+                        f"Element '{name}' of entity '{self.label}' is "
+                        f"declared as '{declared}', got '{sent}'."
+                    )
+                fields[key] = rule(
+                    {
+                        k: v
+                        for k, v in element.items()
+                        if k not in PRESENTATION_KEYS
+                    }
+                )
+        return fields
+
+
 def plugin_results_middleman(
     func: typing.Callable[..., typing.Any],
 ) -> typing.Callable[..., typing.Any]:
@@ -73,13 +361,125 @@ class OBUse(pydantic.BaseModel):
     Attributes
     ----------
     get_driver : Callable
-        Function returning browser/HTTP driver.
+        Legacy driver check kept for older plugins; it returns None and
+        quits its driver itself. Use `driver` for a usable browser.
     settings : dict
         Plugin-specific settings.
+    drivers : DriverPool or None
+        Shared pool of warm browser drivers, see `driver`.
+    http : httpx.AsyncClient or None
+        Shared HTTP client with pooled keep-alive connections. Transforms
+        should use it rather than opening their own clients.
+    cache : TransformCache or None
+        Store for results of transforms declared with `cache_ttl`.
+    deadline : float or None
+        `time.monotonic()` instant by which the transform must finish,
+        see `remaining`.
     """
 
-    get_driver: typing.Callable[[], None]
+    model_config = pydantic.ConfigDict(arbitrary_types_allowed=True)
+
+    get_driver: typing.Callable[..., typing.Any]
     settings: dict[str, typing.Any]
+    drivers: typing.Optional[utils.DriverPool] = None
+    http: typing.Optional[httpx.AsyncClient] = None
+    cache: typing.Optional[caching.TransformCache] = None
+    deadline: typing.Optional[float] = None
+
+    def remaining(
+        self, default: typing.Optional[float] = None
+    ) -> typing.Optional[float]:
+        """
+        Return the seconds left before the deadline.
+
+        Parameters
+        ----------
+        default : float, optional
+            Value returned when there is no deadline (default None).
+
+        Returns
+        -------
+        float or None
+            Remaining budget, never negative, to pass on as the timeout
+            of outbound HTTP or driver calls.
+
+        Examples
+        --------
+        >>> await use.http.get(url, timeout=use.remaining(10.0))
+        """
+        if self.deadline is None:
+            return default
+        return max(self.deadline - time.monotonic(), 0.0)
+
+    def driver(self) -> typing.AsyncContextManager[typing.Any]:
+        """
+        Check out a pooled browser driver for an `async with` block.
+
+        Returns
+        -------
+        AsyncContextManager[WebDriver]
+            Yields a warm driver and returns it to the pool on exit.
+
+        Raises
+        ------
+        OBPluginError
+            If no driver pool was provided.
+
+        Examples
+        --------
+        >>> async with use.driver() as driver:
+        ...     driver.get("https://example.com")
+        """
+        if self.drivers is None:
+            raise errors.OBPluginError("No browser driver pool available.")
+        return self.drivers.checkout()
+
+
+class LazyPlugin:
+    """
+    Registry placeholder for a plugin whose module has not run yet.
+
+    Carries the metadata statically extracted by `osintbuddy.loader`, so
+    listings, UI labels and transform labels can be served without
+    executing the module. `OBRegistry.resolve` swaps it for the real class.
+
+    Parameters
+    ----------
+    manifest : loader.PluginManifest
+        Statically extracted plugin metadata.
+    module : str
+        Name of the module declaring the plugin.
+    source_path : str
+        Absolute path of the module file.
+
+    Attributes
+    ----------
+    error : BaseException or None
+        Error raised by the last attempt to execute the module. It is
+        re-raised instead of executing the module again until the file
+        changes and a reload replaces the placeholder.
+    """
+
+    def __init__(
+        self, manifest: loader.PluginManifest, module: str, source_path: str
+    ) -> None:
+        self.label: str = manifest.label
+        self.description: str = manifest.description
+        self.author: typing.Union[str, typing.List[str]] = manifest.author
+        self.icon: str = manifest.icon
+        self.color: str = manifest.color
+        self.is_available: bool = manifest.is_available
+        self.transform_labels: typing.List[dict[str, str]] = (
+            manifest.transform_labels
+        )
+        self.source_path: str = source_path
+        self.error: typing.Optional[BaseException] = None
+        # Shadow the class attribute so registry bookkeeping can group
+        # placeholders and real plugin classes by module alike.
+        self.__module__ = module
+
+    def __repr__(self) -> str:
+        return f"<LazyPlugin {self.label!r} from {self.source_path}>"
 
 
 class OBRegistry(type):
@@ -89,39 +489,294 @@ class OBRegistry(type):
     Attributes
     ----------
     plugins : list[type]
-        List of registered plugin classes.
+        List of registered plugin classes, or `LazyPlugin` placeholders
+        for modules that have not been executed yet.
     labels : list[str]
         Labels of registered plugins.
     ui_labels : list[dict]
         UI-visible metadata per plugin.
+    index : dict[str, type]
+        Plugin classes keyed by their snake_case label, so lookups are a
+        single dictionary hit instead of a scan over `labels`.
+    instances : dict[type, OBPlugin]
+        Reusable plugin instances keyed by plugin class.
+    blueprints : dict[str, tuple[bytes, str]]
+        JSON-encoded blueprints and their ETags keyed by snake_case label,
+        plus `ALL_BLUEPRINTS` for the combined list of every plugin.
+    packed_blueprints : dict[str, bytes]
+        MessagePack copies of `blueprints` keyed by their JSON ETag, and
+        dropped together with them.
+    modules : dict[str, ModuleRecord]
+        Plugin modules loaded from disk, keyed by absolute file path.
     """
 
+    ALL_BLUEPRINTS: typing.ClassVar[str] = "_osib_all"
+
     plugins: typing.List[type] = []
     labels: typing.List[str] = []
     ui_labels: typing.List[dict[str, str]] = []
+    index: dict[str, type] = {}
+    instances: dict[type, typing.Any] = {}
+    blueprints: dict[str, tuple[bytes, str]] = {}
+    packed_blueprints: dict[str, bytes] = {}
+    modules: dict[str, "ModuleRecord"] = {}
 
     def __init__(
         cls, name: str, bases: tuple[type, ...], attrs: dict[str, typing.Any]
     ) -> None:
+        # Transform tables are static per class, build them once here
+        # rather than on every plugin instantiation.
+        funcs = [func for func in attrs.values() if hasattr(func, "label")]
+        cls.transforms = {
+            utils.to_snake_case(func.label): func for func in funcs
+        }
+        cls.transform_labels = [
+            {
+                "label": str(func.label),
+                "icon": str(getattr(func, "icon", "atom-2")),
+            }
+            for func in funcs
+        ]
+        entity = getattr(cls, "entity", None)
+        cls.schema = (
+            EntitySchema.compile(str(getattr(cls, "label", "")), entity)
+            if entity
+            else None
+        )
         if name not in ("OBPlugin", "Plugin") and issubclass(cls, OBPlugin):
-            label = cls.label.strip()
-            if cls.is_available:
-                author = (
-                    cls.author
-                    if isinstance(cls.author, str)
-                    else ", ".join(cls.author)
+            OBRegistry.register(cls)
+        super().__init__(name, bases, attrs)
+
+    @classmethod
+    def register(cls, plugin: typing.Any) -> None:
+        """
+        Append a plugin class or `LazyPlugin` to the registry.
+
+        While a plugin module executes for a load, reload or lazy resolve,
+        the plugin is collected for that load instead, which installs it
+        with `swap` once every module has run.
+
+        Parameters
+        ----------
+        plugin : type or LazyPlugin
+            Plugin to register.
+        """
+        staged = getattr(_staging, "plugins", None)
+        if staged is not None:
+            staged.append(plugin)
+            return
+        label = plugin.label.strip()
+        if plugin.is_available:
+            OBRegistry.ui_labels.append(OBRegistry._ui_label(plugin))
+        OBRegistry.labels.append(label)
+        OBRegistry.plugins.append(plugin)
+        # First registration wins, matching the old linear scan order.
+        OBRegistry.index.setdefault(utils.to_snake_case(label), plugin)
+
+    @classmethod
+    def lookup(cls, plugin_label: str) -> typing.Any:
+        """
+        Find a plugin by label without executing lazily loaded modules.
+
+        Parameters
+        ----------
+        plugin_label : str
+            Label of the plugin.
+
+        Returns
+        -------
+        type, LazyPlugin or None
+            Plugin class or placeholder, or None.
+        """
+        return OBRegistry.index.get(utils.to_snake_case(plugin_label))
+
+    @classmethod
+    def resolve(cls, plugin: typing.Any) -> typing.Optional[type]:
+        """
+        Return the plugin class for a registry entry, loading it if lazy.
+
+        Executing the module replaces every `LazyPlugin` from that module
+        with the real classes, in place, via `swap`. A module that fails is
+        not executed again until it changes; its error is raised instead.
+
+        Parameters
+        ----------
+        plugin : type, LazyPlugin or None
+            Registry entry.
+
+        Returns
+        -------
+        type or None
+            The plugin class, or None if the module no longer defines it.
+
+        Raises
+        ------
+        OBPluginError
+            If an earlier attempt to execute the module failed.
+        Exception
+            Anything raised while executing the plugin module.
+        """
+        if not isinstance(plugin, LazyPlugin):
+            return plugin
+        with registry_lock:
+            current = cls.lookup(plugin.label)
+            if current is None:
+                # Unregistered by a reload while we waited.
+                return None
+            if not isinstance(current, LazyPlugin):
+                # Resolved by another thread while we waited.
+                return current
+            plugin = current
+            path = plugin.source_path
+            if plugin.error is not None:
+                raise errors.OBPluginError(
+                    f"Plugin module {path} failed to load: {plugin.error}"
+                ) from plugin.error
+            try:
+                record, created = _register_module(
+                    loader.compile_module(path)
                 )
-                OBRegistry.ui_labels.append(
-                    {
-                        "label": label,
-                        "description": cls.description
-                        or "Description not available.",
-                        "author": author or "Author not provided.",
-                    }
+            except Exception as exc:
+                for entry in OBRegistry.plugins:
+                    if (
+                        isinstance(entry, LazyPlugin)
+                        and entry.source_path == path
+                    ):
+                        entry.error = exc
+                raise
+            OBRegistry.swap(
+                _place_plugins(
+                    OBRegistry.plugins, {record.name: created}, set()
                 )
-            OBRegistry.labels.append(label)
-            OBRegistry.plugins.append(cls)
-        super().__init__(name, bases, attrs)
+            )
+            OBRegistry.modules[path] = record
+        resolved = cls.lookup(plugin.label)
+        return None if isinstance(resolved, LazyPlugin) else resolved
+
+    @classmethod
+    def source_path(cls, plugin: typing.Any) -> typing.Optional[str]:
+        """
+        Return the file a plugin was loaded from, if known.
+
+        Parameters
+        ----------
+        plugin : type or LazyPlugin
+            Registry entry.
+
+        Returns
+        -------
+        str or None
+            Module file path, or None for plugins loaded from strings.
+        """
+        if isinstance(plugin, LazyPlugin):
+            return plugin.source_path
+        module = sys.modules.get(plugin.__module__)
+        return getattr(module, "__file__", None)
+
+    @classmethod
+    def reset(cls) -> None:
+        """Forget every registered plugin and clear the label index."""
+        OBRegistry.labels.clear()
+        OBRegistry.plugins.clear()
+        OBRegistry.ui_labels.clear()
+        OBRegistry.index.clear()
+        OBRegistry.instances.clear()
+        OBRegistry.blueprints.clear()
+        OBRegistry.packed_blueprints.clear()
+        OBRegistry.modules.clear()
+
+    @staticmethod
+    def _ui_label(plugin: type) -> dict[str, str]:
+        author = plugin.author  # type: ignore
+        author = author if isinstance(author, str) else ", ".join(author)
+        return {
+            "label": plugin.label.strip(),  # type: ignore
+            "description": plugin.description  # type: ignore
+            or "Description not available.",
+            "author": author or "Author not provided.",
+        }
+
+    @classmethod
+    def swap(cls, plugins: typing.List[type]) -> None:
+        """
+        Replace the registered plugins with `plugins` in a single step.
+
+        Labels, UI labels and the label index are rebuilt off to the side
+        and then rebound together, so readers never observe an empty or
+        half-populated registry. Instances and encoded blueprints are kept
+        for plugin classes that survive the swap.
+
+        Parameters
+        ----------
+        plugins : list[type]
+            Plugin classes in registry order.
+        """
+        index: dict[str, type] = {}
+        for plugin in plugins:
+            label = plugin.label.strip()  # type: ignore
+            index.setdefault(utils.to_snake_case(label), plugin)
+        kept = set(plugins)
+        blueprints = {
+            key: entry
+            for key, entry in OBRegistry.blueprints.items()
+            if key != cls.ALL_BLUEPRINTS
+            and index.get(key) is OBRegistry.index.get(key)
+        }
+        etags = {etag for _, etag in blueprints.values()}
+        (
+            OBRegistry.plugins,
+            OBRegistry.labels,
+            OBRegistry.ui_labels,
+            OBRegistry.index,
+            OBRegistry.instances,
+            OBRegistry.blueprints,
+            OBRegistry.packed_blueprints,
+        ) = (
+            list(plugins),
+            [plugin.label.strip() for plugin in plugins],  # type: ignore
+            [
+                OBRegistry._ui_label(plugin)
+                for plugin in plugins
+                if plugin.is_available  # type: ignore
+            ],
+            index,
+            {
+                plugin: instance
+                for plugin, instance in OBRegistry.instances.items()
+                if plugin in kept
+            },
+            blueprints,
+            {
+                etag: packed
+                for etag, packed in OBRegistry.packed_blueprints.items()
+                if etag in etags
+            },
+        )
+
+    @classmethod
+    def get_instance(cls, plugin: type) -> "OBPlugin":
+        """
+        Return the shared instance of a plugin class, creating it once.
+
+        Parameters
+        ----------
+        plugin : type
+            Registered plugin class.
+
+        Returns
+        -------
+        OBPlugin
+            Reusable instance of `plugin`.
+
+        Notes
+        -----
+        Plugins are stateless, so a single instance per class is reused
+        across requests instead of constructing one per call.
+        """
+        instance = OBRegistry.instances.get(plugin)
+        if instance is None:
+            instance = OBRegistry.instances[plugin] = plugin()
+        return typing.cast("OBPlugin", instance)
 
     @classmethod
     async def get_plugin(cls, plugin_label: str) -> typing.Optional[type]:
@@ -137,11 +792,16 @@ class OBRegistry(type):
         -------
         type or None
             Matching plugin class or None.
+
+        Notes
+        -----
+        Lazily loaded plugins are resolved in a worker thread, so their
+        module executes off the event loop.
         """
-        for i, label in enumerate(cls.labels):
-            if utils.to_snake_case(label) == utils.to_snake_case(plugin_label):
-                return cls.plugins[i]
-        return None
+        plugin = cls.lookup(plugin_label)
+        if isinstance(plugin, LazyPlugin):
+            return await asyncio.to_thread(cls.resolve, plugin)
+        return plugin
 
     @classmethod
     def get_plug(cls, plugin_label: str) -> typing.Optional[type]:
@@ -158,10 +818,112 @@ class OBRegistry(type):
         type or None
             Plugin class or None.
         """
-        for i, label in enumerate(cls.labels):
-            if utils.to_snake_case(label) == utils.to_snake_case(plugin_label):
-                return cls.plugins[i]
-        return None
+        return cls.resolve(cls.lookup(plugin_label))
+
+    @classmethod
+    def _blueprint_key(cls, plugin_label: str) -> str:
+        if plugin_label == cls.ALL_BLUEPRINTS:
+            return cls.ALL_BLUEPRINTS
+        return utils.to_snake_case(plugin_label)
+
+    @classmethod
+    async def load_blueprint(
+        cls, plugin_label: str
+    ) -> typing.Optional[tuple[bytes, str]]:
+        """
+        Retrieve a blueprint like `get_blueprint`, without blocking the loop.
+
+        Parameters
+        ----------
+        plugin_label : str
+            Label of the plugin, or `ALL_BLUEPRINTS` for every plugin.
+
+        Returns
+        -------
+        tuple[bytes, str] or None
+            Encoded blueprint and quoted ETag, or None if no plugin matches.
+
+        Notes
+        -----
+        Cached blueprints are returned directly. Otherwise the blueprint
+        is built in a worker thread, since that may execute lazily loaded
+        plugin modules.
+        """
+        cached = OBRegistry.blueprints.get(cls._blueprint_key(plugin_label))
+        if cached is not None:
+            return cached
+        return await asyncio.to_thread(cls.get_blueprint, plugin_label)
+
+    @classmethod
+    def get_blueprint(
+        cls, plugin_label: str
+    ) -> typing.Optional[tuple[bytes, str]]:
+        """
+        Retrieve a pre-encoded JSON blueprint and its ETag.
+
+        Parameters
+        ----------
+        plugin_label : str
+            Label of the plugin, or `ALL_BLUEPRINTS` for every plugin.
+
+        Returns
+        -------
+        tuple[bytes, str] or None
+            Encoded blueprint and quoted ETag, or None if no plugin matches.
+
+        Notes
+        -----
+        Blueprints are static per plugin class, so each one is encoded the
+        first time it is requested and reused until `reset` clears it.
+        """
+        key = cls._blueprint_key(plugin_label)
+        cached = OBRegistry.blueprints.get(key)
+        if cached is not None:
+            return cached
+        if key == cls.ALL_BLUEPRINTS:
+            bodies = [
+                entry[0]
+                for entry in (
+                    cls.get_blueprint(label) for label in OBRegistry.labels
+                )
+                if entry is not None
+            ]
+            body = b"[" + b",".join(bodies) + b"]"
+        else:
+            plugin = cls.resolve(OBRegistry.index.get(key))
+            if plugin is None:
+                return None
+            body = encoding.dumps(plugin.create())  # type: ignore
+        etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+        OBRegistry.blueprints[key] = (body, etag)
+        return body, etag
+
+    @classmethod
+    def pack_blueprint(cls, blueprint: tuple[bytes, str]) -> tuple[bytes, str]:
+        """
+        Re-encode a blueprint from `get_blueprint` as MessagePack.
+
+        Parameters
+        ----------
+        blueprint : tuple[bytes, str]
+            JSON-encoded blueprint and its quoted ETag.
+
+        Returns
+        -------
+        tuple[bytes, str]
+            MessagePack-encoded blueprint and its own quoted ETag.
+
+        Notes
+        -----
+        The packed copy is cached under the JSON ETag until the registry
+        drops the blueprint it was made from.
+        """
+        body, etag = blueprint
+        packed = OBRegistry.packed_blueprints.get(etag)
+        if packed is None:
+            packed = encoding.packb(encoding.loads(body))
+            OBRegistry.packed_blueprints[etag] = packed
+        return packed, f'{etag[:-1]}-msgpack"'
 
     def __getitem__(cls, key: str) -> typing.Optional[type]:
         return cls.get_plug(key)
@@ -190,33 +952,502 @@ def load_plugin(mod_name: str, plugin_code: str) -> typing.List[type]:
     return OBRegistry.plugins
 
 
-def load_plugins(plugins_path: str = "plugins") -> typing.List[type]:
+class ModuleRecord(typing.NamedTuple):
+    """
+    Bookkeeping for a plugin module loaded from disk.
+
+    Attributes
+    ----------
+    name : str
+        Module name registered in `sys.modules`.
+    path : str
+        Absolute path of the module file.
+    mtime_ns : int
+        Modification time in nanoseconds when the module was loaded.
+    size : int
+        File size in bytes when the module was loaded.
+    digest : str
+        SHA-256 hex digest of the loaded source.
+    compile_ms : float
+        Time spent reading and compiling, loading cached bytecode, or
+        scanning the source for lazy modules.
+    exec_ms : float
+        Time spent executing the module body.
+    cached : bool
+        Whether the bytecode came from the on-disk cache.
+    lazy : bool
+        Whether the module was only scanned and is registered through
+        `LazyPlugin` placeholders.
+    """
+
+    name: str
+    path: str
+    mtime_ns: int
+    size: int
+    digest: str
+    compile_ms: float = 0.0
+    exec_ms: float = 0.0
+    cached: bool = False
+    lazy: bool = False
+
+
+class ModuleChange(pydantic.BaseModel):
+    """
+    A plugin module touched by `reload_plugins`.
+
+    Attributes
+    ----------
+    path : str
+        Absolute path of the module file.
+    plugins : list[str]
+        Labels of the plugins the module now provides.
+    elapsed_ms : float
+        Time spent executing the module.
+    error : str or None
+        Error raised while executing the module, if any.
+    """
+
+    path: str
+    plugins: typing.List[str] = []
+    elapsed_ms: float = 0.0
+    error: typing.Optional[str] = None
+
+
+class ReloadReport(pydantic.BaseModel):
+    """
+    Summary of an incremental plugin reload.
+
+    Attributes
+    ----------
+    added : list[ModuleChange]
+        Newly discovered modules.
+    changed : list[ModuleChange]
+        Modules whose source changed and were re-executed.
+    removed : list[ModuleChange]
+        Modules whose files were deleted.
+    failed : list[ModuleChange]
+        Modules that raised while executing; their previous plugins are kept.
+    unchanged : int
+        Number of modules left untouched.
+    elapsed_ms : float
+        Total time spent reloading.
+    """
+
+    added: typing.List[ModuleChange] = []
+    changed: typing.List[ModuleChange] = []
+    removed: typing.List[ModuleChange] = []
+    failed: typing.List[ModuleChange] = []
+    unchanged: int = 0
+    elapsed_ms: float = 0.0
+
+
+def _exec_module(module: loader.CompiledModule) -> ModuleRecord:
+    """
+    Execute a compiled plugin module and record it.
+
+    Parameters
+    ----------
+    module : loader.CompiledModule
+        Module compiled by `osintbuddy.loader`.
+
+    Returns
+    -------
+    ModuleRecord
+        Record describing the executed module, with its timings.
+
+    Raises
+    ------
+    Exception
+        The read/compile error, or anything raised by the module body;
+        `sys.modules` is restored on failure.
+    """
+    if module.error is not None or module.code is None or module.stat is None:
+        raise module.error or ImportError(f"Cannot load {module.path}")
+    spec = importlib.util.spec_from_file_location(module.name, module.path)
+    if spec is None:
+        raise ImportError(f"Cannot load plugin module from {module.path}")
+    mod = importlib.util.module_from_spec(spec)
+    previous = sys.modules.get(module.name)
+    sys.modules[module.name] = mod
+    started = time.perf_counter()
+    try:
+        exec(module.code, mod.__dict__)
+    except BaseException:
+        if previous is None:
+            sys.modules.pop(module.name, None)
+        else:
+            sys.modules[module.name] = previous
+        raise
+    exec_ms = (time.perf_counter() - started) * 1000
+    sources.cache.load(module.path, module.stat, module.source)
+    log.debug(
+        f"Loaded {module.path} in {module.compile_ms + exec_ms:.1f} ms "
+        f"(compile {module.compile_ms:.1f} ms"
+        f"{', cached' if module.cached else ''}, exec {exec_ms:.1f} ms)"
+    )
+    return ModuleRecord(
+        name=module.name,
+        path=module.path,
+        mtime_ns=module.stat.st_mtime_ns,
+        size=module.stat.st_size,
+        digest=module.digest,
+        compile_ms=module.compile_ms,
+        exec_ms=exec_ms,
+        cached=module.cached,
+    )
+
+
+@contextlib.contextmanager
+def _staged() -> typing.Iterator[typing.List[typing.Any]]:
+    """Collect plugins registered in this thread instead of installing them."""
+    previous = getattr(_staging, "plugins", None)
+    _staging.plugins = staged = []
+    try:
+        yield staged
+    finally:
+        _staging.plugins = previous
+
+
+def _register_module(
+    module: typing.Union[loader.CompiledModule, loader.ScannedModule],
+) -> tuple[ModuleRecord, typing.List[typing.Any]]:
+    """
+    Collect the plugins of a compiled or scanned module.
+
+    Compiled modules are executed. Scanned modules yield `LazyPlugin`
+    placeholders instead, unless their plugins could not be determined
+    statically, in which case they are compiled and executed after all.
+    Nothing is added to the live registry; callers install the plugins
+    with `OBRegistry.swap`.
+
+    Parameters
+    ----------
+    module : loader.CompiledModule or loader.ScannedModule
+        Module prepared by `osintbuddy.loader`.
+
+    Returns
+    -------
+    tuple[ModuleRecord, list]
+        Module record and the plugin classes or placeholders it defines.
+
+    Raises
+    ------
+    Exception
+        Anything raised while compiling or executing the module.
+    """
+    if isinstance(module, loader.ScannedModule):
+        if module.plugins is None or module.stat is None:
+            return _register_module(loader.compile_module(module.path))
+        stubs = [
+            LazyPlugin(manifest, module.name, module.path)
+            for manifest in module.plugins
+        ]
+        sources.cache.load(module.path, module.stat, module.source)
+        record = ModuleRecord(
+            name=module.name,
+            path=module.path,
+            mtime_ns=module.stat.st_mtime_ns,
+            size=module.stat.st_size,
+            digest=module.digest,
+            compile_ms=module.scan_ms,
+            lazy=True,
+        )
+        return record, stubs
+    with _staged() as staged:
+        record = _exec_module(module)
+    created = [
+        plugin for plugin in staged if plugin.__module__ == record.name
+    ]
+    return record, created
+
+
+def _place_plugins(
+    live: typing.List[typing.Any],
+    replaced: dict[str, typing.List[typing.Any]],
+    removed: set[str],
+) -> typing.List[typing.Any]:
+    """
+    Compute a new registry order after modules were replaced or removed.
+
+    Surviving plugins keep their position so registry ids stay stable;
+    a replaced module's plugins take the slot of its first previous
+    plugin, and plugins of new modules are appended.
+
+    Parameters
+    ----------
+    live : list
+        Current registry entries.
+    replaced : dict[str, list]
+        New entries keyed by module name.
+    removed : set[str]
+        Names of modules whose entries are dropped.
+
+    Returns
+    -------
+    list
+        Registry entries in their new order.
+    """
+    plugins: typing.List[typing.Any] = []
+    placed: set[str] = set()
+    for plugin in live:
+        module = plugin.__module__
+        if module in removed:
+            continue
+        if module in replaced:
+            if module not in placed:
+                plugins.extend(replaced[module])
+                placed.add(module)
+            continue
+        plugins.append(plugin)
+    for module, created in replaced.items():
+        if module not in placed:
+            plugins.extend(created)
+    return plugins
+
+
+def _prepare_modules(
+    paths: typing.Sequence[str], lazy: bool
+) -> typing.Sequence[
+    typing.Union[loader.CompiledModule, loader.ScannedModule]
+]:
+    if lazy:
+        return loader.scan_modules(paths)
+    return loader.compile_modules(paths)
+
+
+def load_plugins(
+    plugins_path: str = "plugins", lazy: bool = False
+) -> typing.List[type]:
     """
     Load plugin Python modules from filesystem.
 
+    Sources are compiled in parallel through `osintbuddy.loader`, reusing
+    cached bytecode where the source is unchanged, and then executed one
+    by one in sorted path order so registry ids are stable between runs.
+    Per-module timings are kept in `OBRegistry.modules`.
+
+    With `lazy`, modules are only parsed: plugins are registered from a
+    static manifest as `LazyPlugin` placeholders, and a module is executed
+    the first time one of its plugins is resolved for a blueprint or
+    transform. Modules whose plugins cannot be determined statically are
+    executed right away.
+
     Parameters
     ----------
     plugins_path : str
         Directory path.
+    lazy : bool, optional
+        Defer executing modules until first use (default False).
 
     Returns
     -------
     list[type]
-        Loaded plugin classes.
-    """
-    files = glob.glob(f"{plugins_path}/*.py")
-    for path in files:
-        name = path.replace(".py", "").replace("plugins/", "")
-        spec = importlib.util.spec_from_file_location(name, path)
-        if spec is not None and spec.loader is not None:
-            mod = importlib.util.module_from_spec(spec)
-            sys.modules[name] = mod
-            spec.loader.exec_module(mod)
+        Loaded plugin classes, including placeholders when `lazy`.
+    """
+    with registry_lock:
+        started = time.perf_counter()
+        modules = _prepare_modules(loader.plugin_files(plugins_path), lazy)
+        loaded = list(OBRegistry.plugins)
+        try:
+            for module in modules:
+                record, created = _register_module(module)
+                OBRegistry.modules[module.path] = record
+                loaded.extend(created)
+        finally:
+            # Install what loaded, even if a later module raised.
+            OBRegistry.swap(loaded)
+        deferred = sum(record.lazy for record in OBRegistry.modules.values())
+        log.info(
+            f"Loaded {len(modules)} plugin modules from {plugins_path} in "
+            f"{(time.perf_counter() - started) * 1000:.1f} ms "
+            f"({deferred} deferred)"
+        )
     return OBRegistry.plugins
 
 
+def reload_plugins(
+    plugins_path: str = "plugins", lazy: bool = False, full: bool = False
+) -> ReloadReport:
+    """
+    Reload only the plugin modules that changed since the last load.
+
+    Files are compared against the previous load by mtime and size, then
+    by content hash. Changed and new modules are re-executed (or, with
+    `lazy`, re-scanned), plugins from deleted files are unregistered, and
+    the resulting registry is swapped in with `OBRegistry.swap`. Until
+    then readers keep seeing the previous registry, never a partial one.
+
+    Parameters
+    ----------
+    plugins_path : str
+        Directory path.
+    lazy : bool, optional
+        Defer executing changed modules until first use (default False).
+    full : bool, optional
+        Treat every module as changed and re-execute it (default False).
+
+    Returns
+    -------
+    ReloadReport
+        What was added, changed, removed or failed, with timings.
+
+    Examples
+    --------
+    >>> report = reload_plugins("plugins")
+    >>> [change.path for change in report.changed]
+    ['/srv/plugins/ip.py']
+    """
+    with registry_lock:
+        started = time.perf_counter()
+        report = ReloadReport()
+        previous = dict(OBRegistry.modules)
+        live = list(OBRegistry.plugins)
+        records: dict[str, ModuleRecord] = {}
+        replaced: dict[str, typing.List[typing.Any]] = {}
+
+        stale: typing.List[tuple[str, typing.Optional[ModuleRecord]]] = []
+        for path in loader.plugin_files(plugins_path):
+            record = previous.pop(path, None)
+            stat = os.stat(path)
+            if (
+                not full
+                and record is not None
+                and record.mtime_ns == stat.st_mtime_ns
+                and record.size == stat.st_size
+            ):
+                records[path] = record
+                report.unchanged += 1
+            else:
+                stale.append((path, record))
+
+        prepared = _prepare_modules([path for path, _ in stale], lazy)
+        for (path, record), module in zip(stale, prepared):
+            if (
+                not full
+                and record is not None
+                and record.digest == module.digest
+            ):
+                records[path] = record._replace(
+                    mtime_ns=module.stat.st_mtime_ns,  # type: ignore
+                    size=module.stat.st_size,  # type: ignore
+                )
+                report.unchanged += 1
+                continue
+
+            change = ModuleChange(path=path)
+            module_started = time.perf_counter()
+            try:
+                new_record, created = _register_module(module)
+            except Exception as exc:
+                change.error = f"{type(exc).__name__}: {exc}"
+                report.failed.append(change)
+                if record is not None:
+                    records[path] = record
+                continue
+            finally:
+                change.elapsed_ms = (
+                    time.perf_counter() - module_started
+                ) * 1000 + (
+                    module.compile_ms
+                    if isinstance(module, loader.CompiledModule)
+                    else module.scan_ms
+                )
+            records[path] = new_record
+            replaced[new_record.name] = created
+            change.plugins = [plugin.label for plugin in created]
+            (report.added if record is None else report.changed).append(change)
+
+        removed_names: set[str] = set()
+        for path, record in previous.items():
+            removed_names.add(record.name)
+            sys.modules.pop(record.name, None)
+            sources.cache.discard(path)
+            report.removed.append(
+                ModuleChange(
+                    path=path,
+                    plugins=[
+                        plugin.label
+                        for plugin in live
+                        if plugin.__module__ == record.name
+                    ],
+                )
+            )
+
+        OBRegistry.swap(_place_plugins(live, replaced, removed_names))
+        OBRegistry.modules = records
+        report.elapsed_ms = (time.perf_counter() - started) * 1000
+    return report
+
+
+class TransformJob(pydantic.BaseModel):
+    """
+    One transform invocation in a batch.
+
+    Attributes
+    ----------
+    id : str
+        Caller-chosen identifier echoed back in the matching result.
+    transform : str
+        Transform name or label.
+    data : dict
+        Input entity with its plugin `label` and `elements`, as sent to
+        `POST /transforms`.
+    """
+
+    id: str
+    transform: str
+    data: dict[str, typing.Any] = {}
+
+
+class TransformResult(pydantic.BaseModel):
+    """
+    Outcome of one `TransformJob`.
+
+    Attributes
+    ----------
+    id : str
+        Identifier of the job.
+    result : list[dict] or None
+        Transform output nodes, None if the job failed.
+    error : str or None
+        Error message if the job failed.
+    error_type : str or None
+        Exception class name if the job failed.
+    """
+
+    id: str
+    result: typing.Optional[typing.List[dict[str, typing.Any]]] = None
+    error: typing.Optional[str] = None
+    error_type: typing.Optional[str] = None
+
+    @classmethod
+    def failed(cls, job_id: str, exc: BaseException) -> "TransformResult":
+        """
+        Build the result of a job that raised.
+
+        Parameters
+        ----------
+        job_id : str
+            Identifier of the job.
+        exc : BaseException
+            Exception raised by the job.
+
+        Returns
+        -------
+        TransformResult
+            Result carrying the error message and type.
+        """
+        return cls(id=job_id, error=str(exc), error_type=type(exc).__name__)
+
+
 def transform(
-    label: str, icon: str = "list", edge_label: str = "transformed_to"
+    label: str,
+    icon: str = "list",
+    edge_label: str = "transformed_to",
+    cache_ttl: typing.Optional[float] = None,
+    timeout: typing.Optional[float] = None,
+    max_concurrency: typing.Optional[int] = None,
+    executor: typing.Optional[str] = None,
 ) -> typing.Callable[..., typing.Any]:
     """
     Decorator for plugin transform functions.
@@ -229,33 +1460,132 @@ def transform(
         Icon identifier (default: 'list').
     edge_label : str, optional
         Graph edge label (default: 'transformed_to').
+    cache_ttl : float, optional
+        Seconds to reuse the result for an identical input node. Only
+        set this for idempotent transforms (default: None, not cached).
+    timeout : float, optional
+        Seconds the transform may run before it is cancelled; the
+        caller's `OBUse.deadline` applies too, whichever is sooner
+        (default: None, only the deadline applies).
+    max_concurrency : int, optional
+        Executions of this transform allowed at once per worker; further
+        calls queue (default: None, no transform-level limit).
+    executor : str, optional
+        `"thread"` or `"process"` to run a blocking body, sync or async,
+        off the event loop (default: None, run on the loop). Thread
+        bodies must not use loop-bound `use` resources such as
+        `use.http`; process bodies additionally need a plugin loaded from
+        a file and a picklable result.
 
     Returns
     -------
     Callable
         Decorator.
+
+    Raises
+    ------
+    ValueError
+        If `executor` is unknown or used with an async generator.
+
+    Notes
+    -----
+    Async generator transforms are marked `streaming`; each node (or list
+    of nodes) they yield can be sent to the client as soon as it is
+    produced, see `OBPlugin.stream_transform`.
     """
     import functools
 
     def decorator_transform(
         func: typing.Callable[..., typing.Any],
     ) -> typing.Callable[..., typing.Any]:
-        @functools.wraps(func)
-        async def wrapper(
-            self: typing.Any, node: OBNode, **kwargs: typing.Any
-        ) -> typing.Any:
-            return await func(self=self, node=node, **kwargs)
+        wrapper: typing.Callable[..., typing.Any]
+        if executor is not None:
+            if executor not in executors.EXECUTORS or (
+                inspect.isasyncgenfunction(func)
+            ):
+                raise ValueError(
+                    f"Transform '{label}' cannot use executor '{executor}'."
+                )
+
+            @functools.wraps(func)
+            async def offload_wrapper(
+                self: typing.Any, node: TransformNode, **kwargs: typing.Any
+            ) -> typing.Any:
+                if executor == "thread":
+                    return await executors.pools.run_in_thread(
+                        func, {"self": self, "node": node, **kwargs}
+                    )
+                path = OBRegistry.source_path(type(self))
+                if path is None:
+                    raise errors.OBPluginError(
+                        f"Transform '{label}' runs in a process and needs "
+                        "a plugin loaded from a file."
+                    )
+                use: typing.Optional[OBUse] = kwargs.get("use")
+                return await executors.pools.run_in_process(
+                    path,
+                    type(self).__name__,
+                    utils.to_snake_case(label),
+                    node.model_dump(),
+                    use.settings if use is not None else {},
+                    use.remaining() if use is not None else None,
+                )
+
+            wrapper = offload_wrapper
+        elif inspect.isasyncgenfunction(func):
+
+            @functools.wraps(func)
+            async def stream_wrapper(
+                self: typing.Any, node: TransformNode, **kwargs: typing.Any
+            ) -> typing.AsyncIterator[typing.Any]:
+                async for item in func(self=self, node=node, **kwargs):
+                    yield item
 
+            wrapper = stream_wrapper
+        else:
+
+            @functools.wraps(func)
+            async def call_wrapper(
+                self: typing.Any, node: TransformNode, **kwargs: typing.Any
+            ) -> typing.Any:
+                return await func(self=self, node=node, **kwargs)
+
+            wrapper = call_wrapper
+
+        setattr(wrapper, "streaming", inspect.isasyncgenfunction(func))
         setattr(wrapper, "label", label)
         setattr(wrapper, "icon", icon)
         setattr(wrapper, "edge_label", edge_label)
+        setattr(wrapper, "cache_ttl", cache_ttl)
+        setattr(wrapper, "timeout", timeout)
+        setattr(wrapper, "max_concurrency", max_concurrency)
+        setattr(wrapper, "executor", executor)
         return wrapper
 
     return decorator_transform
 
 
 class OBPlugin(object, metaclass=OBRegistry):
-    """Base class for OSINTBuddy plugin implementations."""
+    """
+    Base class for OSINTBuddy plugin implementations.
+
+    Attributes
+    ----------
+    transforms : dict[str, Callable]
+        Transform functions keyed by snake_case label, built by
+        `OBRegistry` when the class is created.
+    transform_labels : list[dict[str, str]]
+        Transform label and icon pairs shown in the UI.
+    max_concurrency : int or None
+        Transforms of this plugin allowed to run at once per worker;
+        further calls queue, see `osintbuddy.limits`.
+    strict : bool
+        Validate transform input into a pydantic `OBNode` instead of
+        passing a lightweight `NodeView`.
+    schema : EntitySchema or None
+        Input decoder compiled from `entity` when the class is created;
+        None for plugins that declare no elements.
+    """
 
     entity: typing.List[elements_base.BaseElement]
     label: str = ""
@@ -264,25 +1594,13 @@ class OBPlugin(object, metaclass=OBRegistry):
     is_available: bool = True
     author: typing.Union[str, typing.List[str]] = ""
     description: str = ""
+    max_concurrency: typing.Optional[int] = None
+    strict: bool = False
 
+    schema: typing.Optional[EntitySchema]
+    transforms: dict[str, typing.Callable[..., typing.Any]]
     transform_labels: typing.List[dict[str, str]]
 
-    def __init__(self) -> None:
-        transforms = self.__class__.__dict__.values()
-        self.transforms = {
-            utils.to_snake_case(func.label): func
-            for func in transforms
-            if hasattr(func, "label")
-        }
-        self.transform_labels = [
-            {
-                "label": str(func.label),
-                "icon": str(getattr(func, "icon", "atom-2")),
-            }
-            for func in transforms
-            if hasattr(func, "label")
-        ]
-
     def __call__(self) -> dict[str, typing.Any]:
         return self.create()
 
@@ -352,7 +1670,11 @@ class OBPlugin(object, metaclass=OBRegistry):
         return ui
 
     async def run_transform(
-        self, transform_type: str, entity: dict[str, typing.Any], use: OBUse
+        self,
+        transform_type: str,
+        entity: dict[str, typing.Any],
+        use: OBUse,
+        refresh: bool = False,
     ) -> typing.Optional[typing.List[dict[str, typing.Any]]]:
         """
         Execute a registered transform.
@@ -365,64 +1687,427 @@ class OBPlugin(object, metaclass=OBRegistry):
             Input entity.
         use : OBUse
             Execution context.
+        refresh : bool, optional
+            Skip cached results and store a fresh one (default False).
 
         Returns
         -------
         list[dict] or None
             Transformed output or None.
+
+        Raises
+        ------
+        OBTransformTimeoutError
+            If the transform's `timeout` or `use.deadline` passes first;
+            the transform is cancelled unless other callers still await
+            the same coalesced execution.
+
+        Notes
+        -----
+        Concurrent calls for the same plugin, transform, plugin module
+        version and mapped input node share a single execution through
+        `in_flight`. Every caller waits until its own deadline, and the
+        shared execution sees the latest of their deadlines in
+        `use.deadline`. Results of transforms declared with `cache_ttl`
+        are also served from `use.cache` while it holds a live entry.
         """
         name = utils.to_snake_case(transform_type)
         if self.transforms and name in self.transforms:
-            try:
-                func = self.transforms[name]
-                result: (
-                    typing.List[dict[str, typing.Any]] | typing.Any
-                ) = await func(
-                    self=self,
-                    node=self._map_to_transform_data(entity),
-                    use=use,
+            func = self.transforms[name]
+            node = self._map_to_transform_data(entity)
+            key = caching.cache_key(
+                self.label, name, node.model_dump(), self._digest()
+            )
+            # Used only if this call starts the execution; callers joining
+            # it later move its deadline back through `extend`.
+            shared = use.model_copy()
+            async with self._time_limit(name, self._deadline(func, use)):
+                return await in_flight.do(
+                    f"{key}:refresh" if refresh else key,
+                    lambda: self._execute(
+                        func, name, node, shared, key, refresh
+                    ),
+                    name=f"{self.label}.{name}",
+                    deadline=use.deadline,
+                    extend=lambda deadline: setattr(
+                        shared, "deadline", deadline
+                    ),
                 )
-                edge = func.edge_label
-                if isinstance(result, list):
-                    for node in result:  # type: ignore
-                        node["edge_label"] = edge
-                    return result  # type: ignore
-                result["edge_label"] = edge
-                return [result]
-            except (Exception, errors.OBPluginError) as exc:
-                raise exc
         return None
 
+    def _bulkhead(
+        self, func: typing.Callable[..., typing.Any], name: str
+    ) -> typing.AsyncContextManager[None]:
+        return limits.bulkheads.hold(
+            [
+                (
+                    f"{self.label}.{name}",
+                    getattr(func, "max_concurrency", None),
+                ),
+                (self.label, self.max_concurrency),
+            ]
+        )
+
+    @staticmethod
+    def _deadline(
+        func: typing.Callable[..., typing.Any], use: OBUse
+    ) -> typing.Optional[float]:
+        timeout = getattr(func, "timeout", None)
+        deadlines = [
+            deadline
+            for deadline in (
+                None if timeout is None else time.monotonic() + timeout,
+                use.deadline,
+            )
+            if deadline is not None
+        ]
+        return min(deadlines) if deadlines else None
+
+    @contextlib.asynccontextmanager
+    async def _time_limit(
+        self,
+        name: str,
+        deadline: typing.Optional[float],
+        started: typing.Optional[float] = None,
+    ) -> typing.AsyncIterator[None]:
+        now = time.monotonic()
+        started = now if started is None else started
+        scope = asyncio.timeout(
+            None if deadline is None else max(deadline - now, 0.0)
+        )
+        try:
+            async with scope:
+                yield
+        except TimeoutError as exc:
+            if not scope.expired():
+                raise
+            raise errors.OBTransformTimeoutError(
+                f"Transform '{self.label}.{name}' timed out after "
+                f"{time.monotonic() - started:.3g}s."
+            ) from exc
+
+    async def _execute(
+        self,
+        func: typing.Callable[..., typing.Any],
+        name: str,
+        node: TransformNode,
+        use: OBUse,
+        key: str,
+        refresh: bool,
+    ) -> typing.List[dict[str, typing.Any]]:
+        ttl = getattr(func, "cache_ttl", None)
+        cached = ttl and use.cache is not None
+        if cached and not refresh:
+            hit = await use.cache.get(key)  # type: ignore
+            if hit is not None:
+                return hit  # type: ignore
+        async with self._bulkhead(func, name):
+            with executors.monitor.track(f"{self.label}.{name}"):
+                result = await self._call(func, node, use)
+        if cached:
+            await use.cache.set(key, result, ttl)  # type: ignore
+        return result  # type: ignore
+
+    async def _call(
+        self,
+        func: typing.Callable[..., typing.Any],
+        node: TransformNode,
+        use: OBUse,
+    ) -> typing.List[dict[str, typing.Any]]:
+        if getattr(func, "streaming", False):
+            return [item async for item in self._stream(func, node, use)]
+        result = await func(self=self, node=node, use=use)
+        edge = func.edge_label  # type: ignore
+        if isinstance(result, list):
+            for item in result:  # type: ignore
+                item["edge_label"] = edge
+            return result  # type: ignore
+        result["edge_label"] = edge
+        return [result]
+
+    async def stream_transform(
+        self,
+        transform_type: str,
+        entity: dict[str, typing.Any],
+        use: OBUse,
+        refresh: bool = False,
+    ) -> typing.AsyncIterator[dict[str, typing.Any]]:
+        """
+        Execute a registered transform, yielding nodes as they are produced.
+
+        Parameters
+        ----------
+        transform_type : str
+            Method name.
+        entity : dict
+            Input entity.
+        use : OBUse
+            Execution context.
+        refresh : bool, optional
+            Skip cached results and store a fresh one (default False).
+
+        Yields
+        ------
+        dict
+            Output nodes with their `edge_label` stamped.
+
+        Raises
+        ------
+        OBPluginError
+            If the plugin has no such transform.
+        OBTransformTimeoutError
+            If the transform's `timeout` or `use.deadline` passes first.
+
+        Notes
+        -----
+        Async generator transforms are consumed lazily and bypass the
+        result cache and request coalescing, so the full result is never
+        held in memory. Their time limit is a deadline for the whole
+        stream, not for each item. Other transforms run through
+        `run_transform` and their nodes are yielded once it returns.
+        """
+        name = utils.to_snake_case(transform_type)
+        func = (self.transforms or {}).get(name)
+        if func is None:
+            raise errors.OBPluginError(
+                f"Unknown transform '{transform_type}' for plugin "
+                f"'{self.label}'."
+            )
+        if getattr(func, "streaming", False):
+            node = self._map_to_transform_data(entity)
+            started = time.monotonic()
+            deadline = self._deadline(func, use)
+            async with contextlib.AsyncExitStack() as stack:
+                async with self._time_limit(name, deadline, started):
+                    await stack.enter_async_context(
+                        self._bulkhead(func, name)
+                    )
+                items = self._stream(func, node, use)
+                stack.push_async_callback(items.aclose)
+                while True:
+                    async with self._time_limit(name, deadline, started):
+                        try:
+                            with executors.monitor.track(
+                                f"{self.label}.{name}"
+                            ):
+                                item = await anext(items)
+                        except StopAsyncIteration:
+                            return
+                    yield item
+        for item in await self.run_transform(
+            transform_type, entity, use, refresh=refresh
+        ) or []:
+            yield item
+
+    async def _stream(
+        self,
+        func: typing.Callable[..., typing.Any],
+        node: TransformNode,
+        use: OBUse,
+    ) -> typing.AsyncIterator[dict[str, typing.Any]]:
+        edge = func.edge_label  # type: ignore
+        async for produced in func(self=self, node=node, use=use):
+            for item in produced if isinstance(produced, list) else [produced]:
+                item["edge_label"] = edge
+                yield item
+
+    async def run_transforms(
+        self,
+        jobs: typing.Iterable[TransformJob],
+        use: OBUse,
+        concurrency: typing.Union[int, asyncio.Semaphore] = 8,
+        refresh: bool = False,
+    ) -> typing.List[TransformResult]:
+        """
+        Execute many transforms of this plugin with bounded concurrency.
+
+        Parameters
+        ----------
+        jobs : Iterable[TransformJob]
+            Jobs whose entities belong to this plugin.
+        use : OBUse
+            Execution context shared by every job.
+        concurrency : int or asyncio.Semaphore, optional
+            Maximum jobs running at once, or a semaphore shared with
+            other batches (default 8).
+        refresh : bool, optional
+            Skip cached results and store fresh ones (default False).
+
+        Returns
+        -------
+        list[TransformResult]
+            One result per job, in job order. A job that raises yields a
+            result with `error` set instead of failing the batch.
+        """
+        limit = (
+            asyncio.Semaphore(concurrency)
+            if isinstance(concurrency, int)
+            else concurrency
+        )
+
+        async def run(job: TransformJob) -> TransformResult:
+            async with limit:
+                try:
+                    result = await self.run_transform(
+                        transform_type=job.transform,
+                        entity=job.model_dump(),
+                        use=use,
+                        refresh=refresh,
+                    )
+                except Exception as exc:
+                    return TransformResult.failed(job.id, exc)
+            if result is None:
+                return TransformResult.failed(
+                    job.id,
+                    errors.OBPluginError(
+                        f"Unknown transform '{job.transform}' for "
+                        f"plugin '{self.label}'."
+                    ),
+                )
+            return TransformResult(id=job.id, result=result)
+
+        return list(await asyncio.gather(*(run(job) for job in jobs)))
+
     @classmethod
-    def _map_to_transform_data(cls, node: dict[str, typing.Any]) -> OBNode:
-        transform_map: dict[str, typing.Any] = {}
+    def _digest(cls) -> str:
+        path = OBRegistry.source_path(cls)
+        record = OBRegistry.modules.get(path) if path else None
+        return record.digest if record is not None else ""
+
+    @classmethod
+    def _map_to_transform_data(
+        cls, node: dict[str, typing.Any]
+    ) -> TransformNode:
+        """
+        Map an entity's UI elements to the input node of a transform.
+
+        Parameters
+        ----------
+        node : dict[str, Any]
+            Entity payload with `data.elements`, a list of element dicts
+            or rows (lists) of them. It is not modified.
+
+        Returns
+        -------
+        NodeView or OBNode
+            A `NodeView`, or a validated `OBNode` if the plugin sets
+            `strict`.
+
+        Raises
+        ------
+        NodeInvalidValueError
+            If the plugin declares an `entity` and the payload has an
+            element it does not declare, or one of a different type.
+        """
         elements = node.get("data", {}).get("elements", [])
+        if cls.schema is not None:
+            return cls._to_node(cls.schema.decode(elements))
+        transform_map: dict[str, typing.Any] = {}
         for item in elements:
             if isinstance(item, list):
                 for sub in item:  # type: ignore
                     cls._map_element(transform_map, sub)  # type: ignore
             else:
                 cls._map_element(transform_map, item)
-        return OBNode(**transform_map)
+        return cls._to_node(transform_map)
+
+    @classmethod
+    def _to_node(cls, fields: dict[str, typing.Any]) -> TransformNode:
+        if cls.strict:
+            return OBNode.model_validate(fields)
+        return NodeView(fields)
 
     @staticmethod
     def _map_element(
         transform_map: dict[str, typing.Any], element: dict[str, typing.Any]
     ) -> None:
-        label = utils.to_snake_case(element.pop("label", ""))
-        transform_map[label] = {}
-        element.pop("icon", None)
-        element_type = element.pop("type", "")
-        element.pop("placeholder", None)
-        element.pop("style", None)
-        element.pop("options", None)
-
-        for k, v in element.items():
-            if (
-                isinstance(v, str)
-                and len(element) == 1
-                or element_type == "dropdown"
-            ):
-                transform_map[label] = v
-            else:
-                transform_map[label][k] = v
+        """
+        Map one element's value into `transform_map` without mutating it.
+
+        Used for plugins without a compiled `schema`. Dropdowns map to
+        their last value field, an element with a single string value
+        field collapses to that string, and anything else maps to a dict
+        of its value fields.
+        """
+        values = {
+            k: v for k, v in element.items() if k not in PRESENTATION_KEYS
+        }
+        label = utils.to_snake_case(element.get("label", ""))
+        rule = _element_rule(element.get("type", ""))
+        transform_map[label] = rule(values)
+
+
+async def run_batch(
+    jobs: typing.Sequence[TransformJob],
+    use: OBUse,
+    concurrency: int = 8,
+    refresh: bool = False,
+) -> typing.List[TransformResult]:
+    """
+    Execute transform jobs for any mix of plugins.
+
+    Jobs are grouped by plugin so each plugin is resolved and instantiated
+    once, then run through `OBPlugin.run_transforms` sharing one
+    concurrency limit across every group.
+
+    Parameters
+    ----------
+    jobs : Sequence[TransformJob]
+        Jobs to run; each names its plugin in `data["label"]`.
+    use : OBUse
+        Execution context shared by every job.
+    concurrency : int, optional
+        Maximum jobs running at once across the batch (default 8).
+    refresh : bool, optional
+        Skip cached results and store fresh ones (default False).
+
+    Returns
+    -------
+    list[TransformResult]
+        One result per job, in job order. Jobs for unknown plugins or
+        plugins that fail to load get an error result.
+
+    Examples
+    --------
+    >>> results = await run_batch(
+    ...     [TransformJob(id="1", transform="to_ip", data=domain_entity)],
+    ...     use,
+    ... )
+    >>> results[0].id
+    '1'
+    """
+    groups: dict[str, typing.List[int]] = {}
+    for position, job in enumerate(jobs):
+        label = utils.to_snake_case(str(job.data.get("label", "")))
+        groups.setdefault(label, []).append(position)
+
+    limit = asyncio.Semaphore(concurrency)
+    results: typing.List[typing.Optional[TransformResult]] = [None] * len(
+        jobs
+    )
+
+    async def run_group(label: str, positions: typing.List[int]) -> None:
+        try:
+            plugin = await OBRegistry.get_plugin(label)
+            if plugin is None:
+                raise errors.OBPluginError(f"Unknown plugin '{label}'.")
+            instance = OBRegistry.get_instance(plugin)
+        except Exception as exc:
+            for position in positions:
+                results[position] = TransformResult.failed(
+                    jobs[position].id, exc
+                )
+            return
+        outcomes = await instance.run_transforms(
+            [jobs[position] for position in positions],
+            use,
+            concurrency=limit,
+            refresh=refresh,
+        )
+        for position, outcome in zip(positions, outcomes):
+            results[position] = outcome
+
+    await asyncio.gather(
+        *(run_group(label, positions) for label, positions in groups.items())
+    )
+    return typing.cast("typing.List[TransformResult]", results)
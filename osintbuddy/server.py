@@ -3,25 +3,302 @@
 Provides HTTP endpoints to manage OSINTBuddy plugins and transforms.
 """
 
-import datetime
-import os
-import sys
+import asyncio
+import contextlib
+import logging
+import math
+import time
 import types
 import typing
 
 import fastapi
+import fastapi.responses
+import fastapi.routing
+import httpx
 import pydantic
 
 import osintbuddy
+import osintbuddy.cache
+import osintbuddy.compression
+import osintbuddy.config
+import osintbuddy.encoding
+import osintbuddy.errors
+import osintbuddy.executors
+import osintbuddy.limits
 import osintbuddy.plugins
+import osintbuddy.sources
 import osintbuddy.utils
 import osintbuddy.utils.deps
+import osintbuddy.watcher
+
+log: logging.Logger = logging.getLogger("plugins.server")
+settings: osintbuddy.config.OBSettings = osintbuddy.config.settings
+
+osintbuddy.plugins.load_plugins(
+    settings.plugins_path, lazy=settings.lazy_plugins
+)
+osintbuddy.limits.bulkheads.configure(
+    settings.max_concurrency, settings.max_queue, settings.bulkhead_queue
+)
+osintbuddy.executors.pools.configure(
+    settings.thread_workers, settings.process_workers
+)
+osintbuddy.executors.monitor.interval = settings.loop_lag_interval
+osintbuddy.executors.monitor.threshold = settings.loop_lag_threshold
+drivers: osintbuddy.utils.DriverPool = settings.driver_pool()
+http_client: httpx.AsyncClient | None = None
+results: osintbuddy.cache.TransformCache = settings.transform_cache()
+compressed: osintbuddy.compression.BodyCache = settings.compressed_bodies()
+
+
+def _reload_plugins(full: bool = False) -> osintbuddy.plugins.ReloadReport:
+    """
+    Reload plugin modules, serialized by `plugins.registry_lock`.
+
+    Blocks while modules execute, so call it from a worker thread. The
+    lock is shared with lazy plugin resolution, so `/refresh`, the file
+    watcher and first use of a lazy plugin never interleave.
+
+    Parameters
+    ----------
+    full : bool, optional
+        Re-execute every module, not only changed ones (default False).
+
+    Returns
+    -------
+    ReloadReport
+        What was added, changed, removed or failed, with timings.
+    """
+    return osintbuddy.plugins.reload_plugins(
+        settings.plugins_path, lazy=settings.lazy_plugins, full=full
+    )
+
+
+def _reload_changed_plugins() -> None:
+    """Reload changed plugin modules and log what happened."""
+    report = _reload_plugins()
+    for kind in ("added", "changed", "removed", "failed"):
+        for change in getattr(report, kind):
+            log.info(
+                f"Plugin module {kind}: {change.path} "
+                f"{change.plugins or ''} {change.error or ''}".rstrip()
+            )
+
+
+@contextlib.asynccontextmanager
+async def lifespan(app: fastapi.FastAPI) -> typing.AsyncIterator[None]:
+    """
+    Start and stop background services alongside the application.
+
+    Parameters
+    ----------
+    app : fastapi.FastAPI
+        The application being served.
+
+    Yields
+    ------
+    None
+        Control while the application is serving requests.
+    """
+    global http_client
+    watcher: osintbuddy.watcher.PluginWatcher | None = None
+    if settings.watch:
+        watcher = osintbuddy.watcher.PluginWatcher(
+            settings.plugins_path,
+            on_change=_reload_changed_plugins,
+            interval=settings.watch_interval,
+            debounce=settings.watch_debounce,
+        )
+        await watcher.start()
+    await drivers.start()
+    await results.start(settings.cache_purge_interval)
+    http_client = settings.http_client()
+    osintbuddy.executors.monitor.start()
+    try:
+        yield
+    finally:
+        await osintbuddy.executors.monitor.stop()
+        await asyncio.to_thread(osintbuddy.executors.pools.shutdown)
+        await http_client.aclose()
+        http_client = None
+        await drivers.close()
+        await results.close()
+        if watcher is not None:
+            await watcher.stop()
 
-osintbuddy.plugins.load_plugins()
 
 app: fastapi.FastAPI = fastapi.FastAPI(
-    title=f"OSINTBuddy Plugins v{osintbuddy.__version__}"
+    title=f"OSINTBuddy Plugins v{osintbuddy.__version__}", lifespan=lifespan
 )
+app.add_middleware(
+    osintbuddy.compression.CompressionMiddleware,
+    encodings=settings.compression.split(","),
+    minimum_size=settings.compression_min_size,
+    levels={
+        "gzip": settings.gzip_level,
+        "br": settings.brotli_level,
+        "zstd": settings.zstd_level,
+    },
+    cache=compressed,
+)
+
+
+class JSONResponse(fastapi.responses.Response):
+    """
+    Response encoded with `osintbuddy.encoding.dumps`.
+
+    Endpoints returning many nodes, blueprints or entities return this
+    directly, so FastAPI skips validating the return value and running it
+    through `jsonable_encoder` before the encoder sees it.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: typing.Any) -> bytes:
+        """Encode the response content with orjson when available."""
+        return osintbuddy.encoding.dumps(content)
+
+
+class MsgPackResponse(fastapi.responses.Response):
+    """Response encoded with `osintbuddy.encoding.packb`."""
+
+    media_type = osintbuddy.encoding.MSGPACK_MEDIA_TYPE
+
+    def render(self, content: typing.Any) -> bytes:
+        """Encode the response content as MessagePack."""
+        return osintbuddy.encoding.packb(content)
+
+
+class DecodingRequest(fastapi.Request):
+    """
+    Request whose `json()` decodes the body with `osintbuddy.encoding`.
+
+    `packed` requests carry MessagePack bodies; FastAPI reads them
+    through `json()` like JSON ones, so both are validated the same way.
+    """
+
+    packed: bool = False
+
+    async def json(self) -> typing.Any:
+        """Decode the JSON or MessagePack body once and cache it."""
+        if not hasattr(self, "_decoded"):
+            body = await self.body()
+            self._decoded = (
+                osintbuddy.encoding.unpackb(body)
+                if self.packed
+                else osintbuddy.encoding.loads(body)
+            )
+        return self._decoded
+
+
+def _media_type(content_type: str | None) -> str:
+    """Return the lowercased media type of a `Content-Type` value."""
+    return (content_type or "").split(";", 1)[0].strip().lower()
+
+
+class NegotiatedRoute(fastapi.routing.APIRoute):
+    """Route accepting MessagePack request bodies as well as JSON."""
+
+    def get_route_handler(
+        self,
+    ) -> typing.Callable[
+        [fastapi.Request], typing.Coroutine[typing.Any, typing.Any, typing.Any]
+    ]:
+        """Wrap FastAPI's handler to decode bodies with `DecodingRequest`."""
+        handler = super().get_route_handler()
+
+        async def decode(request: fastapi.Request) -> fastapi.Response:
+            media_type = _media_type(request.headers.get("content-type"))
+            packed = media_type in osintbuddy.encoding.MSGPACK_MEDIA_TYPES
+            scope = request.scope
+            if packed:
+                if not osintbuddy.encoding.HAS_MSGPACK:
+                    raise fastapi.HTTPException(
+                        status_code=415,
+                        detail="MessagePack requires the 'msgpack' package.",
+                    )
+                # FastAPI only parses bodies labelled as JSON; relabel the
+                # copy of the scope it sees and decode in `json()`.
+                scope = {
+                    **scope,
+                    "headers": [
+                        (name, value)
+                        for name, value in scope["headers"]
+                        if name != b"content-type"
+                    ]
+                    + [(b"content-type", b"application/json")],
+                }
+            decoding = DecodingRequest(scope, request.receive)
+            decoding.packed = packed
+            return await handler(decoding)
+
+        return decode
+
+
+app.router.route_class = NegotiatedRoute
+
+
+def _prefers_msgpack(accept: str | None) -> bool:
+    """
+    Check whether an `Accept` header asks for MessagePack over JSON.
+
+    Parameters
+    ----------
+    accept : str or None
+        Raw header value, e.g. `application/msgpack, application/json;q=0.5`.
+
+    Returns
+    -------
+    bool
+        True if `msgpack` is installed and a MessagePack media type is
+        accepted with a quality at least that of JSON. JSON's quality is
+        that of `application/json` if listed, else the best of
+        `application/*` and `*/*`.
+    """
+    if not accept or not osintbuddy.encoding.HAS_MSGPACK:
+        return False
+    packed = wildcard = 0.0
+    plain: float | None = None
+    for item in accept.split(","):
+        media_type, *params = item.split(";")
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        media_type = media_type.strip().lower()
+        if media_type in osintbuddy.encoding.MSGPACK_MEDIA_TYPES:
+            packed = max(packed, quality)
+        elif media_type == "application/json":
+            plain = max(plain or 0.0, quality)
+        elif media_type in ("application/*", "*/*"):
+            wildcard = max(wildcard, quality)
+    return packed > 0 and packed >= (wildcard if plain is None else plain)
+
+
+def _negotiate(content: typing.Any, accept: str | None) -> fastapi.Response:
+    """
+    Encode a response as MessagePack or JSON, as the client prefers.
+
+    Parameters
+    ----------
+    content : Any
+        Plain response data.
+    accept : str or None
+        The request's `Accept` header.
+
+    Returns
+    -------
+    fastapi.Response
+        `MsgPackResponse` or `JSONResponse`, varying on `Accept`.
+    """
+    response_class = (
+        MsgPackResponse if _prefers_msgpack(accept) else JSONResponse
+    )
+    return response_class(content, headers={"Vary": "Accept"})
 
 
 class EntityCreate(pydantic.BaseModel):
@@ -52,42 +329,82 @@ class EntityCreate(pydantic.BaseModel):
     source: str | None
 
 
-@app.get("/entities")
-async def get_entities() -> list[EntityCreate]:
+def _to_entity(
+    idx: int, plugin: type, include_source: bool = True
+) -> EntityCreate | None:
+    """
+    Build the entity metadata for a registered plugin.
+
+    Parameters
+    ----------
+    idx : int
+        Position of the plugin in the registry.
+    plugin : type or LazyPlugin
+        Registered plugin class or placeholder.
+    include_source : bool, optional
+        Whether to include the module source code (default True).
+
+    Returns
+    -------
+    EntityCreate or None
+        Plugin metadata, or None if the plugin has no source file.
+    """
+    module_file = osintbuddy.Registry.source_path(plugin)
+    if module_file is None:
+        return None
+
+    entry = osintbuddy.sources.cache.get(module_file)
+    author = getattr(plugin, "author", "Unknown author")
+    return EntityCreate(
+        id=idx,
+        label=getattr(plugin, "label", None),
+        author=author if isinstance(author, str) else ", ".join(author),
+        description=getattr(plugin, "description", "No description found..."),
+        last_edit=entry.last_edit,
+        source=entry.source if include_source else None,
+    )
+
+
+@app.get(
+    "/entities",
+    response_model=list[EntityCreate],
+    response_class=JSONResponse,
+)
+def get_entities(include_source: bool = True) -> JSONResponse:
     """
     Return all loaded plugin entities with metadata and source code.
 
+    Parameters
+    ----------
+    include_source : bool, optional
+        Whether to include each plugin's source code (default True).
+
     Returns
     -------
-    list[EntityCreate]
-        Plugin metadata with source code.
+    JSONResponse
+        `EntityCreate` plugin metadata, with source code unless
+        `include_source` is False.
+
+    Notes
+    -----
+    Sources come from `osintbuddy.sources.cache`; files are only re-read
+    when their mtime or size changed. The handler is synchronous so the
+    occasional re-read runs in FastAPI's threadpool, off the event loop.
     """
-    entities: list[EntityCreate] = []
+    entities: list[dict[str, typing.Any]] = []
     for idx, plugin in enumerate(osintbuddy.Registry.plugins):
-        module_file = sys.modules[plugin.__module__].__file__
-
-        # Handle potential None value for module_file
-        if module_file is None:
-            continue
-
-        entity = EntityCreate(
-            id=idx,
-            label=getattr(plugin, "label", None),
-            author=getattr(plugin, "author", "Unknown author"),
-            description=getattr(
-                plugin, "description", "No description found..."
-            ),
-            last_edit=datetime.datetime.fromtimestamp(
-                os.path.getmtime(module_file), tz=datetime.timezone.utc
-            ).strftime("%Y-%m-%d %H:%M:%S"),
-            source=open(module_file, "r", encoding="utf-8").read(),
-        )
-        entities.append(entity)
-    return entities
+        entity = _to_entity(idx, plugin, include_source)
+        if entity is not None:
+            entities.append(entity.model_dump())
+    return JSONResponse(entities)
 
 
-@app.get("/entities/{hid}")
-async def get_entity_source(hid: str) -> EntityCreate | list[typing.Any]:
+@app.get(
+    "/entities/{hid}",
+    response_model=EntityCreate | list[typing.Any],
+    response_class=JSONResponse,
+)
+def get_entity_source(hid: str, include_source: bool = True) -> JSONResponse:
     """
     Return a single plugin entity's metadata and source code by ID.
 
@@ -95,62 +412,89 @@ async def get_entity_source(hid: str) -> EntityCreate | list[typing.Any]:
     ----------
     hid : str
         The plugin index ID.
+    include_source : bool, optional
+        Whether to include the plugin's source code (default True).
 
     Returns
     -------
-    EntityCreate | list[typing.Any]
-        The plugin entity or empty list if not found.
+    JSONResponse
+        The `EntityCreate` plugin entity or empty list if not found.
     """
-    for idx, plugin in enumerate(osintbuddy.Registry.plugins):
-        if str(idx) == hid:
-            module_file: str | None = sys.modules[plugin.__module__].__file__
-
-            # Handle potential None value for module_file
-            if module_file is None:
-                continue
-
-            entity = EntityCreate(
-                id=idx,
-                label=getattr(plugin, "label", None),
-                author=getattr(plugin, "author", "Unknown author"),
-                description=getattr(
-                    plugin, "description", "No description found..."
-                ),
-                last_edit=datetime.datetime.fromtimestamp(
-                    os.path.getmtime(module_file), tz=datetime.timezone.utc
-                ).strftime("%Y-%m-%d %H:%M:%S"),
-                source=open(module_file, "r", encoding="utf-8").read(),
-            )
-            return entity
-    return []
+    plugins = osintbuddy.Registry.plugins
+    if not hid.isdecimal() or int(hid) >= len(plugins):
+        return JSONResponse([])
+    entity = _to_entity(int(hid), plugins[int(hid)], include_source)
+    return JSONResponse(entity.model_dump() if entity is not None else [])
 
 
 @app.get("/refresh")
-async def reload_entities(blueprints: bool = False) -> list[dict[str, str]]:
+async def reload_entities(
+    blueprints: bool = False, full: bool = False, report: bool = False
+) -> list[dict[str, str]] | dict[str, typing.Any]:
     """
-    Reload all registered plugins and return their UI labels.
+    Reload changed plugins and return their UI labels.
 
     Parameters
     ----------
     blueprints : bool, optional
         Whether to refresh blueprints (unused).
+    full : bool, optional
+        Re-execute every module, not only changed ones (default False).
+    report : bool, optional
+        Also return the reload report (default False).
 
     Returns
     -------
-    list[dict[str, str]]
-        All UI labels.
+    list[dict[str, str]] or dict[str, Any]
+        All UI labels. With `report`, an object holding them under
+        `ui_labels` plus the modules that were added, changed, removed or
+        failed and the time spent on each.
+
+    Notes
+    -----
+    Modules execute in a worker thread so other requests keep being
+    served during the reload, against the previous plugins until the
+    new ones are swapped in together.
     """
-    osintbuddy.Registry.labels.clear()
-    osintbuddy.Registry.plugins.clear()
-    osintbuddy.Registry.ui_labels.clear()
-    osintbuddy.plugins.load_plugins()
-    return osintbuddy.Registry.ui_labels
+    reloaded = await asyncio.to_thread(_reload_plugins, full)
+    if not report:
+        return osintbuddy.Registry.ui_labels
+    return {
+        "ui_labels": osintbuddy.Registry.ui_labels,
+        **reloaded.model_dump(),
+    }
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Check an `If-None-Match` request header against an ETag.
+
+    Parameters
+    ----------
+    if_none_match : str or None
+        Raw header value, possibly a comma separated list or `*`.
+    etag : str
+        Quoted ETag of the current representation.
+
+    Returns
+    -------
+    bool
+        True if the client already holds the current representation.
+    """
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or any(
+        tag.removeprefix("W/") == etag for tag in candidates
+    )
 
 
 @app.get("/blueprint")
 async def get_entity_blueprint(
     label: str,
-) -> list[dict[str, typing.Any]] | dict[str, typing.Any]:
+    if_none_match: str | None = fastapi.Header(default=None),
+    accept: str | None = fastapi.Header(default=None),
+) -> fastapi.Response:
     """
     Return the blueprint of a plugin entity or all if '_osib_all'.
 
@@ -158,22 +502,32 @@ async def get_entity_blueprint(
     ----------
     label : str
         Plugin label or '_osib_all' to get all.
+    if_none_match : str or None
+        ETag(s) the client already holds.
+    accept : str or None
+        `application/msgpack` selects MessagePack instead of JSON.
 
     Returns
     -------
-    list[dict[str, Any]] | dict[str, Any]
-        Blueprint(s) for the plugin(s).
+    fastapi.Response
+        Pre-encoded blueprint(s), or 304 if the client's ETag matches.
+        Each encoding has its own ETag.
     """
-    if label == "_osib_all":
-        plugins = [
-            await osintbuddy.Registry.get_plugin(
-                osintbuddy.utils.to_snake_case(lbl)
-            )
-            for lbl in osintbuddy.Registry.labels
-        ]
-        return [p.create() for p in plugins if p is not None]  # type: ignore
-    plugin = await osintbuddy.Registry.get_plugin(label)
-    return plugin.create() if plugin is not None else []  # type: ignore
+    cached = await osintbuddy.Registry.load_blueprint(label)
+    if cached is None:
+        return _negotiate([], accept)
+    body, etag = cached
+    media_type = JSONResponse.media_type
+    if _prefers_msgpack(accept):
+        body, etag = osintbuddy.Registry.pack_blueprint(cached)
+        media_type = MsgPackResponse.media_type
+    headers = {"ETag": etag, "Vary": "Accept"}
+    if _etag_matches(if_none_match, etag):
+        return fastapi.Response(status_code=304, headers=headers)
+    # Already encoded; a plain Response sends it as is.
+    return fastapi.Response(
+        content=body, media_type=media_type, headers=headers
+    )
 
 
 @app.get("/transforms")
@@ -190,17 +544,159 @@ async def get_entity_transforms(label: str) -> list[dict[str, str]]:
     -------
     list[dict[str, str]]
         Transform definitions (label + icon).
+
+    Notes
+    -----
+    Served from the registry entry without resolving it, so listing the
+    transforms of a lazily loaded plugin does not execute its module.
     """
-    plugin = await osintbuddy.Registry.get_plugin(label)
+    plugin = osintbuddy.Registry.lookup(label)
     if not isinstance(plugin, types.NoneType):
-        return plugin().transform_labels
+        return plugin.transform_labels  # type: ignore
     return []
 
 
-@app.post("/transforms")
+def _use(timeout: float | None = None) -> osintbuddy.plugins.OBUse:
+    """
+    Build the execution context handed to transforms.
+
+    Parameters
+    ----------
+    timeout : float or None, optional
+        Client-supplied budget in seconds; the `transform_timeout`
+        setting still applies if it is lower (default None).
+
+    Returns
+    -------
+    OBUse
+        Context sharing this worker's driver pool, HTTP client and
+        result cache, with its `deadline` set from the budget.
+    """
+    budgets = [
+        budget
+        for budget in (settings.transform_timeout or None, timeout)
+        if budget is not None
+    ]
+    return osintbuddy.Use(
+        get_driver=osintbuddy.utils.deps.get_driver,
+        settings={},
+        drivers=drivers,
+        http=http_client,
+        cache=results,
+        deadline=time.monotonic() + min(budgets) if budgets else None,
+    )
+
+
+@app.exception_handler(osintbuddy.errors.OBTransformTimeoutError)
+async def transform_timeout_handler(
+    request: fastapi.Request, exc: osintbuddy.errors.OBTransformTimeoutError
+) -> fastapi.responses.JSONResponse:
+    """
+    Report a transform that ran out of time as 504 Gateway Timeout.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Request that timed out.
+    exc : OBTransformTimeoutError
+        The timeout error.
+
+    Returns
+    -------
+    fastapi.responses.JSONResponse
+        `{"error": ..., "error_type": "OBTransformTimeoutError"}`.
+    """
+    return fastapi.responses.JSONResponse(
+        status_code=504,
+        content={"error": str(exc), "error_type": type(exc).__name__},
+    )
+
+
+@app.exception_handler(osintbuddy.errors.OBConcurrencyLimitError)
+async def concurrency_limit_handler(
+    request: fastapi.Request, exc: osintbuddy.errors.OBConcurrencyLimitError
+) -> fastapi.responses.JSONResponse:
+    """
+    Reject a transform whose bulkhead queue is full with 429.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Rejected request.
+    exc : OBConcurrencyLimitError
+        The rejection.
+
+    Returns
+    -------
+    fastapi.responses.JSONResponse
+        `{"error": ..., "error_type": "OBConcurrencyLimitError"}` with a
+        `Retry-After` header.
+    """
+    return fastapi.responses.JSONResponse(
+        status_code=429,
+        content={"error": str(exc), "error_type": type(exc).__name__},
+        headers={"Retry-After": "1"},
+    )
+
+
+@app.exception_handler(osintbuddy.errors.NodeInvalidValueError)
+async def invalid_node_handler(
+    request: fastapi.Request, exc: osintbuddy.errors.NodeInvalidValueError
+) -> fastapi.responses.JSONResponse:
+    """
+    Reject an entity that does not match its plugin's schema with 422.
+
+    Parameters
+    ----------
+    request : fastapi.Request
+        Rejected request.
+    exc : NodeInvalidValueError
+        The decoding error.
+
+    Returns
+    -------
+    fastapi.responses.JSONResponse
+        `{"error": ..., "error_type": "NodeInvalidValueError"}`.
+    """
+    return fastapi.responses.JSONResponse(
+        status_code=422,
+        content={"error": str(exc), "error_type": type(exc).__name__},
+    )
+
+
+def _bypass_cache(cache_control: str | None) -> bool:
+    """
+    Check whether a request asks for a fresh transform result.
+
+    Parameters
+    ----------
+    cache_control : str or None
+        Raw `Cache-Control` request header.
+
+    Returns
+    -------
+    bool
+        True if the header carries `no-cache` or `no-store`.
+    """
+    if not cache_control:
+        return False
+    directives = {d.strip().lower() for d in cache_control.split(",")}
+    return not directives.isdisjoint({"no-cache", "no-store"})
+
+
+@app.post(
+    "/transforms",
+    response_model=list[dict[str, typing.Any]],
+    response_class=JSONResponse,
+)
 async def run_entity_transform(
     context: dict[str, typing.Any],
-) -> list[dict[str, typing.Any]]:
+    cache_control: str | None = fastapi.Header(default=None),
+    x_osintbuddy_timeout: float | None = fastapi.Header(
+        default=None, gt=0, allow_inf_nan=False
+    ),
+    accept: str | None = fastapi.Header(default=None),
+) -> fastapi.Response:
     """
     Execute a plugin transform based on provided context.
 
@@ -208,26 +704,490 @@ async def run_entity_transform(
     ----------
     context : dict[str, Any]
         Transform execution context including `label`, `transform`, and `data`.
+    cache_control : str or None
+        `Cache-Control: no-cache` forces a cached transform to run again
+        and replaces its cached result.
+    x_osintbuddy_timeout : float or None
+        Positive seconds the client will wait; lowers the transform's
+        deadline. Other values are rejected with 422.
+    accept : str or None
+        `application/msgpack` selects MessagePack instead of JSON.
 
     Returns
     -------
-    list[dict[str, Any]]
-        The transform output as node(s).
+    fastapi.Response
+        The transform output as node(s). A transform that runs out of
+        time is cancelled and answered with a 504 error body.
+
+    Notes
+    -----
+    The request body may also be MessagePack, sent with
+    `Content-Type: application/msgpack`.
     """
     data: dict[str, typing.Any] = context.get("data", {})
 
     plugin_label = data.get("label")  # type: ignore
     if plugin_label is None:
-        return []
+        return _negotiate([], accept)
 
     plugin = await osintbuddy.Registry.get_plugin(plugin_label)  # type: ignore
     if not isinstance(plugin, types.NoneType):
-        result = await plugin().run_transform(
+        instance = osintbuddy.Registry.get_instance(plugin)
+        result = await instance.run_transform(
             transform_type=context.get("transform"),
             entity=context,
-            use=osintbuddy.Use(
-                get_driver=osintbuddy.utils.deps.get_driver, settings={}
-            ),
+            use=_use(x_osintbuddy_timeout),
+            refresh=_bypass_cache(cache_control),
         )
-        return result
-    return []
+        return _negotiate(result if result is not None else [], accept)
+    return _negotiate([], accept)
+
+
+def _stream_frames(
+    items: typing.AsyncIterator[dict[str, typing.Any]], sse: bool
+) -> typing.AsyncIterator[bytes]:
+    """
+    Encode streamed transform nodes as NDJSON lines or SSE events.
+
+    Parameters
+    ----------
+    items : AsyncIterator[dict[str, Any]]
+        Output nodes of `OBPlugin.stream_transform`.
+    sse : bool
+        Emit `text/event-stream` events instead of NDJSON lines.
+
+    Returns
+    -------
+    AsyncIterator[bytes]
+        One frame per node, then a final `end` frame with the node count,
+        or an `error` frame if the transform raised after streaming began.
+    """
+
+    def frame(event: str, payload: typing.Any) -> bytes:
+        body = osintbuddy.encoding.dumps(payload)
+        if sse:
+            return b"event: %s\ndata: %s\n\n" % (event.encode(), body)
+        if event == "node":
+            return body + b"\n"
+        return b'{"%s":%s}\n' % (event.encode(), body)
+
+    async def frames() -> typing.AsyncIterator[bytes]:
+        count = 0
+        try:
+            async for item in items:
+                count += 1
+                yield frame("node", item)
+        except Exception as exc:
+            if isinstance(exc, osintbuddy.errors.OBTransformTimeoutError):
+                log.warning(str(exc))
+            else:
+                log.exception("Streaming transform failed")
+            yield frame(
+                "error", {"error": str(exc), "error_type": type(exc).__name__}
+            )
+            return
+        yield frame("end", {"count": count})
+
+    return frames()
+
+
+@app.post("/transforms/stream")
+async def stream_entity_transform(
+    context: dict[str, typing.Any],
+    accept: str | None = fastapi.Header(default=None),
+    cache_control: str | None = fastapi.Header(default=None),
+    x_osintbuddy_timeout: float | None = fastapi.Header(
+        default=None, gt=0, allow_inf_nan=False
+    ),
+) -> fastapi.responses.StreamingResponse:
+    """
+    Execute a plugin transform and stream its nodes as they are produced.
+
+    Parameters
+    ----------
+    context : dict[str, Any]
+        Transform execution context, as for `POST /transforms`.
+    accept : str or None
+        `text/event-stream` selects Server-Sent Events; anything else
+        gets newline-delimited JSON (`application/x-ndjson`).
+    cache_control : str or None
+        `Cache-Control: no-cache` forces a cached transform to run again.
+    x_osintbuddy_timeout : float or None
+        Positive seconds the client will wait for the whole stream.
+
+    Returns
+    -------
+    fastapi.responses.StreamingResponse
+        One node per NDJSON line or SSE `node` event, each with its
+        `edge_label`, followed by an `end` (or `error`) frame.
+
+    Raises
+    ------
+    fastapi.HTTPException
+        404 if the plugin or transform does not exist.
+    """
+    plugin = await osintbuddy.Registry.get_plugin(
+        context.get("data", {}).get("label") or ""
+    )
+    if plugin is None:
+        raise fastapi.HTTPException(status_code=404, detail="Unknown plugin.")
+    instance = osintbuddy.Registry.get_instance(plugin)
+    transform = osintbuddy.utils.to_snake_case(context.get("transform") or "")
+    if transform not in (instance.transforms or {}):
+        raise fastapi.HTTPException(
+            status_code=404, detail="Unknown transform."
+        )
+    items = instance.stream_transform(
+        transform_type=transform,
+        entity=context,
+        use=_use(x_osintbuddy_timeout),
+        refresh=_bypass_cache(cache_control),
+    )
+    sse = "text/event-stream" in (accept or "")
+    return fastapi.responses.StreamingResponse(
+        _stream_frames(items, sse),
+        media_type="text/event-stream" if sse else "application/x-ndjson",
+        headers={"Cache-Control": "no-cache"} if sse else None,
+    )
+
+
+def _timeout_or_none(value: typing.Any) -> float | None:
+    """
+    Parse the optional `timeout` of a WebSocket `run` message.
+
+    Parameters
+    ----------
+    value : Any
+        Raw value.
+
+    Returns
+    -------
+    float or None
+        Seconds, or None if the message has no timeout.
+
+    Raises
+    ------
+    OBPluginError
+        If the timeout is not a finite, positive number; the job then
+        fails like an HTTP request with an invalid `X-OSINTBuddy-Timeout`.
+    """
+    if value is None:
+        return None
+    try:
+        timeout = float(value)
+    except (TypeError, ValueError):
+        timeout = math.nan
+    if not math.isfinite(timeout) or timeout <= 0:
+        raise osintbuddy.errors.OBPluginError(
+            "'timeout' must be a positive number of seconds."
+        )
+    return timeout
+
+
+class _TransformChannel:
+    """
+    One `/transforms/ws` connection multiplexing many transform jobs.
+
+    Every job runs as its own task and reports through a bounded outgoing
+    queue drained by a single writer. When the client reads slower than
+    jobs produce, `put` blocks and the streaming transforms pause rather
+    than buffering without bound. Likewise at most `ws_max_pending` jobs
+    are accepted at a time, and malformed messages are answered with an
+    `error` rather than closing the connection. Replies to the client's
+    own messages and `cancelled` frames are queued from separate tasks,
+    so a full queue never stops the reader from seeing a `cancel`, and a
+    cancelled job's terminal frame waits for room instead of being
+    dropped.
+
+    Parameters
+    ----------
+    websocket : fastapi.WebSocket
+        Accepted connection.
+    """
+
+    def __init__(self, websocket: fastapi.WebSocket) -> None:
+        self.websocket = websocket
+        self.outbox: asyncio.Queue[dict[str, typing.Any]] = asyncio.Queue(
+            maxsize=settings.ws_queue_size
+        )
+        self.slots = asyncio.Semaphore(settings.ws_max_jobs)
+        self.jobs: dict[str, asyncio.Task[None]] = {}
+        self.replies: set[asyncio.Task[None]] = set()
+        self.closed = False
+
+    async def serve(self) -> None:
+        """Read commands until the client disconnects, then clean up."""
+        writer = asyncio.create_task(self._write())
+        try:
+            while True:
+                try:
+                    message = await self._receive()
+                except ValueError:
+                    self._reply(
+                        {
+                            "type": "error",
+                            "id": None,
+                            "error": "Expected a JSON message.",
+                        }
+                    )
+                    continue
+                self._handle(message)
+        except (fastapi.WebSocketDisconnect, RuntimeError):
+            pass
+        finally:
+            self.closed = True
+            tasks = [*self.jobs.values(), *self.replies]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            writer.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await writer
+
+    async def _receive(self) -> typing.Any:
+        # Text and binary frames alike carry JSON; `receive_json` would
+        # fail on binary frames and let decoding errors end the loop.
+        message = await self.websocket.receive()
+        if message["type"] == "websocket.disconnect":
+            raise fastapi.WebSocketDisconnect(message.get("code", 1000))
+        data = message.get("text")
+        return osintbuddy.encoding.loads(
+            data if data is not None else message.get("bytes") or b""
+        )
+
+    def _reply(self, message: dict[str, typing.Any]) -> None:
+        # Queued from a task so the reader keeps reading; tasks reach
+        # the queue in creation order, keeping replies in order.
+        task = asyncio.create_task(self.outbox.put(message))
+        self.replies.add(task)
+        task.add_done_callback(self.replies.discard)
+
+    def _handle(self, message: typing.Any) -> None:
+        if not isinstance(message, dict):
+            self._reply(
+                {"type": "error", "id": None, "error": "Expected an object."}
+            )
+            return
+        job_id = message.get("id")
+        kind = message.get("type")
+        if kind == "cancel":
+            task = self.jobs.get(str(job_id))
+            if task is not None:
+                task.cancel()
+            return
+        if kind != "run" or job_id is None or str(job_id) in self.jobs:
+            self._reply(
+                {
+                    "type": "error",
+                    "id": job_id,
+                    "error": "Expected a 'run' or 'cancel' message with "
+                    "a unique 'id'.",
+                }
+            )
+            return
+        if len(self.jobs) >= settings.ws_max_pending:
+            self._reply(
+                {
+                    "type": "error",
+                    "id": job_id,
+                    "error": f"At most {settings.ws_max_pending} jobs may "
+                    "be pending per connection.",
+                    "error_type": "OBConcurrencyLimitError",
+                }
+            )
+            return
+        job_id = str(job_id)
+        task = asyncio.create_task(self._run(job_id, message))
+        task.add_done_callback(lambda _, job_id=job_id: self._finish(job_id))
+        self.jobs[job_id] = task
+
+    def _finish(self, job_id: str) -> None:
+        task = self.jobs.pop(job_id)
+        # Also reached by jobs cancelled before they started running.
+        if task.cancelled() and not self.closed:
+            self._reply({"type": "cancelled", "id": job_id})
+
+    async def _run(self, job_id: str, message: dict[str, typing.Any]) -> None:
+        try:
+            await self.outbox.put({"type": "queued", "id": job_id})
+            async with self.slots:
+                await self.outbox.put({"type": "started", "id": job_id})
+                count = 0
+                async for node in self._stream(message):
+                    count += 1
+                    await self.outbox.put(
+                        {"type": "node", "id": job_id, "node": node}
+                    )
+            await self.outbox.put(
+                {"type": "done", "id": job_id, "count": count}
+            )
+        except Exception as exc:
+            await self.outbox.put(
+                {
+                    "type": "error",
+                    "id": job_id,
+                    "error": str(exc),
+                    "error_type": type(exc).__name__,
+                }
+            )
+
+    async def _stream(
+        self, message: dict[str, typing.Any]
+    ) -> typing.AsyncIterator[dict[str, typing.Any]]:
+        label = (message.get("data") or {}).get("label") or ""
+        plugin = await osintbuddy.Registry.get_plugin(label)
+        if plugin is None:
+            raise osintbuddy.errors.OBPluginError(f"Unknown plugin '{label}'.")
+        instance = osintbuddy.Registry.get_instance(plugin)
+        async for node in instance.stream_transform(
+            transform_type=message.get("transform") or "",
+            entity=message,
+            use=_use(_timeout_or_none(message.get("timeout"))),
+            refresh=bool(message.get("refresh")),
+        ):
+            yield node
+
+    async def _write(self) -> None:
+        while True:
+            message = await self.outbox.get()
+            await self.websocket.send_text(
+                osintbuddy.encoding.dumps(message).decode()
+            )
+
+
+@app.websocket("/transforms/ws")
+async def transform_channel(websocket: fastapi.WebSocket) -> None:
+    """
+    Run many transforms over one WebSocket connection.
+
+    The client sends `{"type": "run", "id": ..., "transform": ...,
+    "data": {...}}` to start a job (optionally with `"refresh": true`
+    and a `"timeout"` in seconds)
+    and `{"type": "cancel", "id": ...}` to cancel one. Every server
+    message carries the job `id` and a `type`: `queued`, `started`,
+    `node` (one per output node, under `node`), then exactly one of
+    `done` (with the node `count`), `error` or `cancelled`.
+
+    Parameters
+    ----------
+    websocket : fastapi.WebSocket
+        Incoming connection.
+
+    Notes
+    -----
+    At most `ws_max_jobs` jobs run at once per connection, at most
+    `ws_max_pending` are accepted before further `run` messages get an
+    `error`, and at most `ws_queue_size` messages are buffered for a slow
+    client before running jobs are paused. Messages that are not JSON
+    get an `error` with a null `id`.
+    """
+    await websocket.accept()
+    await _TransformChannel(websocket).serve()
+
+
+class TransformBatch(pydantic.BaseModel):
+    """
+    Request body of `POST /transforms/batch`.
+
+    Attributes
+    ----------
+    jobs : list[TransformJob]
+        Transform invocations, each with a caller-chosen `id`.
+    concurrency : int or None
+        Jobs to run at once, capped by the `batch_concurrency` setting.
+    """
+
+    jobs: list[osintbuddy.plugins.TransformJob]
+    concurrency: int | None = None
+
+
+@app.post(
+    "/transforms/batch",
+    response_model=list[osintbuddy.plugins.TransformResult],
+    response_class=JSONResponse,
+)
+async def run_entity_transforms(
+    batch: TransformBatch,
+    cache_control: str | None = fastapi.Header(default=None),
+    x_osintbuddy_timeout: float | None = fastapi.Header(
+        default=None, gt=0, allow_inf_nan=False
+    ),
+    accept: str | None = fastapi.Header(default=None),
+) -> fastapi.Response:
+    """
+    Execute many transforms, across any plugins, in one request.
+
+    Parameters
+    ----------
+    batch : TransformBatch
+        Jobs to run and an optional concurrency limit.
+    cache_control : str or None
+        `Cache-Control: no-cache` forces cached transforms to run again.
+    x_osintbuddy_timeout : float or None
+        Positive seconds the client will wait for the whole batch; jobs
+        still running then fail with `OBTransformTimeoutError`.
+    accept : str or None
+        `application/msgpack` selects MessagePack instead of JSON; the
+        batch itself may be sent as MessagePack too.
+
+    Returns
+    -------
+    fastapi.Response
+        A `TransformResult` per job, in request order and carrying the
+        job `id`. Failed jobs report `error` and `error_type` instead of
+        `result`.
+
+    Raises
+    ------
+    fastapi.HTTPException
+        413 if the batch has more than `batch_max_jobs` jobs.
+    """
+    if len(batch.jobs) > settings.batch_max_jobs:
+        raise fastapi.HTTPException(
+            status_code=413,
+            detail=f"Batches are limited to {settings.batch_max_jobs} jobs.",
+        )
+    concurrency = min(
+        batch.concurrency or settings.batch_concurrency,
+        settings.batch_concurrency,
+    )
+    outcomes = await osintbuddy.plugins.run_batch(
+        batch.jobs,
+        use=_use(x_osintbuddy_timeout),
+        concurrency=max(concurrency, 1),
+        refresh=_bypass_cache(cache_control),
+    )
+    return _negotiate([outcome.model_dump() for outcome in outcomes], accept)
+
+
+@app.get("/stats")
+async def get_stats() -> dict[str, typing.Any]:
+    """
+    Report runtime metrics of this worker's shared resources.
+
+    Returns
+    -------
+    dict[str, Any]
+        Browser driver pool occupancy and lifetime counters under
+        `drivers`, busy hosts' outbound request counts under `http` and
+        transform result cache hits, misses and evictions under `cache`,
+        in-flight transforms with their waiter counts under
+        `coalescing`, and per-bulkhead running, queued, rejected and
+        wait-time figures under `limits`, event loop stalls under
+        `loop` and compressed response cache and byte counts under
+        `compression`.
+    """
+    transport = getattr(http_client, "_transport", None)
+    return {
+        "drivers": drivers.metrics(),
+        "http": (
+            transport.metrics()
+            if isinstance(transport, osintbuddy.utils.HostLimitedTransport)
+            else {}
+        ),
+        "cache": results.metrics(),
+        "coalescing": osintbuddy.plugins.in_flight.metrics(),
+        "limits": osintbuddy.limits.bulkheads.metrics(),
+        "loop": osintbuddy.executors.monitor.metrics(),
+        "compression": compressed.metrics(),
+    }
@@ -0,0 +1,162 @@
+"""
+In-memory cache of plugin module sources.
+
+Plugin listings need each module's source text and last edit time. Rather
+than reading every file per request, entries are loaded once and
+revalidated with a single `os.stat` call, only re-reading a file when its
+modification time or size changed.
+"""
+
+import datetime
+import os
+import threading
+import typing
+
+
+class SourceEntry(typing.NamedTuple):
+    """
+    Cached source and metadata for a single plugin module.
+
+    Attributes
+    ----------
+    path : str
+        Absolute path of the module file.
+    mtime_ns : int
+        Modification time in nanoseconds when the file was read.
+    size : int
+        File size in bytes when the file was read.
+    last_edit : str
+        UTC timestamp of the last modification.
+    source : str
+        Source code of the module.
+    """
+
+    path: str
+    mtime_ns: int
+    size: int
+    last_edit: str
+    source: str
+
+
+class SourceCache:
+    """
+    Thread-safe cache of plugin sources keyed by (path, mtime, size).
+
+    Methods
+    -------
+    load(path)
+        Read a file and store it in the cache.
+    get(path)
+        Return a cached entry, re-reading the file only if it changed.
+    discard(path)
+        Drop a single cached entry.
+    clear()
+        Drop every cached entry.
+
+    Examples
+    --------
+    >>> cache = SourceCache()
+    >>> entry = cache.get("plugins/ip.py")
+    >>> entry is cache.get("plugins/ip.py")
+    True
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[str, SourceEntry] = {}
+        self._lock = threading.Lock()
+
+    def load(
+        self,
+        path: str,
+        stat: typing.Optional[os.stat_result] = None,
+        source: typing.Optional[str] = None,
+    ) -> SourceEntry:
+        """
+        Read a module file and store it in the cache.
+
+        Parameters
+        ----------
+        path : str
+            Path of the module file.
+        stat : os.stat_result, optional
+            Stat result already taken for `path`.
+        source : str, optional
+            Source already read after `stat` was taken; skips the read.
+
+        Returns
+        -------
+        SourceEntry
+            The freshly read entry.
+
+        Raises
+        ------
+        OSError
+            If the file cannot be read.
+        """
+        path = os.path.abspath(path)
+        if stat is None or source is None:
+            stat = os.stat(path)
+            with open(path, "r", encoding="utf-8") as file:
+                source = file.read()
+        entry = SourceEntry(
+            path=path,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            last_edit=datetime.datetime.fromtimestamp(
+                stat.st_mtime, tz=datetime.timezone.utc
+            ).strftime("%Y-%m-%d %H:%M:%S"),
+            source=source,
+        )
+        with self._lock:
+            self._entries[path] = entry
+        return entry
+
+    def get(self, path: str) -> SourceEntry:
+        """
+        Return the cached entry for a module, revalidating it via stat.
+
+        Parameters
+        ----------
+        path : str
+            Path of the module file.
+
+        Returns
+        -------
+        SourceEntry
+            Cached or freshly read entry.
+
+        Raises
+        ------
+        OSError
+            If the file no longer exists or cannot be read.
+        """
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        entry = self._entries.get(path)
+        if (
+            entry is not None
+            and entry.mtime_ns == stat.st_mtime_ns
+            and entry.size == stat.st_size
+        ):
+            return entry
+        return self.load(path, stat)
+
+    def discard(self, path: str) -> None:
+        """
+        Drop the cached entry for a module, if any.
+
+        Parameters
+        ----------
+        path : str
+            Path of the module file.
+        """
+        with self._lock:
+            self._entries.pop(os.path.abspath(path), None)
+
+    def clear(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+
+cache: SourceCache = SourceCache()
@@ -13,9 +13,12 @@ Modules
 -------
 generic
     Core functions: MAP_KEY, chunks, find_emails, to_clean_domain,
-    slugify, to_camel_case, to_snake_case, dkeys_to_snake_case.
+    slugify, to_camel_case, to_snake_case, dkeys_to_snake_case,
+    case_cache_info, case_cache_clear.
 deps
-    Dependency utilities: get_driver context manager.
+    Dependency utilities: get_driver, start_driver, driver_is_healthy, the
+    DriverPool of warm browser sessions and the shared HTTP client
+    (build_http_client, HostLimitedTransport).
 
 Re-exports
 ----------
@@ -27,7 +30,14 @@ slugify
 to_camel_case
 to_snake_case
 dkeys_to_snake_case
+case_cache_info
+case_cache_clear
 get_driver
+start_driver
+driver_is_healthy
+DriverPool
+build_http_client
+HostLimitedTransport
 """
 
 import osintbuddy.utils.deps as deps
@@ -42,9 +52,16 @@ slugify = generic.slugify
 to_camel_case = generic.to_camel_case
 to_snake_case = generic.to_snake_case
 dkeys_to_snake_case = generic.dkeys_to_snake_case
+case_cache_info = generic.case_cache_info
+case_cache_clear = generic.case_cache_clear
 
 # Dependency utilities
 get_driver = deps.get_driver
+start_driver = deps.start_driver
+driver_is_healthy = deps.driver_is_healthy
+DriverPool = deps.DriverPool
+build_http_client = deps.build_http_client
+HostLimitedTransport = deps.HostLimitedTransport
 
 __all__ = [
     "MAP_KEY",
@@ -55,5 +72,12 @@ __all__ = [
     "to_camel_case",
     "to_snake_case",
     "dkeys_to_snake_case",
+    "case_cache_info",
+    "case_cache_clear",
     "get_driver",
+    "start_driver",
+    "driver_is_healthy",
+    "DriverPool",
+    "build_http_client",
+    "HostLimitedTransport",
 ]
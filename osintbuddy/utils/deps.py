@@ -1,9 +1,19 @@
+import asyncio
+import collections
+import contextlib
+import importlib.util
+import logging
+import time
 import typing
 
+import httpx
+import selenium.common.exceptions
 import selenium.webdriver
 import selenium.webdriver.chrome.options
 import selenium.webdriver.remote.webdriver
 
+log: logging.Logger = logging.getLogger("plugins.deps")
+
 
 class ChromeOptionsProtocol(typing.Protocol):
     """Protocol for ChromeOptions to provide precise typing for add_argument and binary_location."""
@@ -70,12 +80,56 @@ def build_chrome_options(
     return options
 
 
+def start_driver(
+    chrome_options: typing.Optional[ChromeOptionsProtocol] = None,
+) -> selenium.webdriver.remote.webdriver.WebDriver:
+    """
+    Start a new Chrome WebDriver session.
+
+    Parameters
+    ----------
+    chrome_options : ChromeOptionsProtocol, optional
+        Pre-configured ChromeOptions (default from build_chrome_options,
+        built per call rather than at import time).
+
+    Returns
+    -------
+    selenium.webdriver.remote.webdriver.WebDriver
+        A running driver; the caller is responsible for calling `quit()`.
+        Transforms should prefer checking one out of a `DriverPool`.
+
+    Raises
+    ------
+    selenium.common.exceptions.WebDriverException
+        If the driver fails to start.
+
+    Examples
+    --------
+    >>> driver = start_driver()
+    >>> driver.get("https://example.com")
+    >>> title = driver.title
+    >>> driver.quit()
+    """
+    if chrome_options is None:
+        chrome_options = build_chrome_options()
+    return selenium.webdriver.Chrome(
+        options=typing.cast(
+            "selenium.webdriver.chrome.options.Options",
+            chrome_options,
+        )
+    )
+
+
 def get_driver(
-    chrome_options: ChromeOptionsProtocol = build_chrome_options(),
+    chrome_options: typing.Optional[ChromeOptionsProtocol] = None,
 ) -> None:
     """
     Initializes a Chrome WebDriver instance and ensures cleanup.
 
+    Kept for plugins calling `use.get_driver()`, which never had to quit
+    a driver. Use `start_driver` for a driver you manage yourself, or
+    `OBUse.driver` for a pooled one.
+
     Parameters
     ----------
     chrome_options : ChromeOptionsProtocol, optional
@@ -89,21 +143,482 @@ def get_driver(
     ------
     selenium.common.exceptions.WebDriverException
         If the driver fails to start.
+    """
+    driver = start_driver(chrome_options)
+    try:
+        driver.get("https://example.com")
+    finally:
+        driver.quit()
+
+
+def driver_is_healthy(driver: typing.Any) -> bool:
+    """
+    Check that a WebDriver session still responds.
+
+    Parameters
+    ----------
+    driver : WebDriver
+        Driver to probe.
+
+    Returns
+    -------
+    bool
+        True if the session answered a lightweight command.
+    """
+    try:
+        _ = driver.current_url
+    except Exception:
+        return False
+    return True
+
+
+class _PooledDriver:
+    __slots__ = ("created", "driver", "last_used", "uses")
+
+    def __init__(self, driver: typing.Any) -> None:
+        self.driver = driver
+        self.uses = 0
+        self.created = time.monotonic()
+        self.last_used = self.created
+
+
+class DriverPool:
+    """
+    Bounded, asyncio-aware pool of warm WebDriver sessions.
+
+    Drivers are checked out with `checkout()` (or `acquire`/`release`),
+    reused across transforms and recycled after `max_uses` checkouts,
+    when they fail a health check, or after sitting idle for
+    `idle_timeout` seconds. At most `max_size` drivers are checked out at
+    once; further callers wait. Blocking WebDriver calls (start, probe,
+    quit) run in worker threads so they never stall the event loop.
+
+    Parameters
+    ----------
+    factory : Callable[[], WebDriver], optional
+        Starts a new driver (default `start_driver`).
+    max_size : int, optional
+        Global cap on concurrently checked-out drivers (default 2).
+    max_uses : int, optional
+        Checkouts before a driver is recycled (default 50).
+    idle_timeout : float, optional
+        Seconds an idle driver is kept before eviction (default 300).
+    warm : int, optional
+        Drivers to start eagerly in `start()` (default 0).
+    health_check : Callable[[WebDriver], bool], optional
+        Probe run before reusing an idle driver (default
+        `driver_is_healthy`).
+
+    Attributes
+    ----------
+    stats : dict[str, int]
+        Lifetime counters, see `metrics`.
 
     Examples
     --------
-    >>> driver = get_driver()
-    >>> driver.get("https://example.com")
-    >>> title = driver.title
-    >>> driver.quit()
+    >>> pool = DriverPool(factory=FakeDriver, max_size=2)
+    >>> async with pool.checkout() as driver:
+    ...     driver.get("https://example.com")
+    >>> pool.metrics()["idle"]
+    1
+    """
+
+    def __init__(
+        self,
+        factory: typing.Callable[[], typing.Any] = start_driver,
+        max_size: int = 2,
+        max_uses: int = 50,
+        idle_timeout: float = 300.0,
+        warm: int = 0,
+        health_check: typing.Callable[[typing.Any], bool] = driver_is_healthy,
+    ) -> None:
+        if max_size <= 0:
+            raise ValueError("Driver pool 'max_size' must be positive.")
+        self.factory = factory
+        self.max_size = max_size
+        self.max_uses = max_uses
+        self.idle_timeout = idle_timeout
+        self.warm = min(warm, max_size)
+        self.health_check = health_check
+        self.stats: dict[str, int] = {
+            "created": 0,
+            "reused": 0,
+            "recycled": 0,
+            "evicted": 0,
+            "unhealthy": 0,
+            "checkouts": 0,
+        }
+        self._idle: collections.deque[_PooledDriver] = collections.deque()
+        self._in_use: dict[int, _PooledDriver] = {}
+        self._slots = asyncio.Semaphore(max_size)
+        self._waiting = 0
+        self._wait_seconds = 0.0
+        self._reaper: typing.Optional[asyncio.Task[None]] = None
+        self._closed = False
+
+    async def start(self) -> None:
+        """Start warm drivers and the idle eviction task."""
+        self._closed = False
+        for _ in range(self.warm - len(self._idle)):
+            self._idle.append(await self._create())
+        if self._reaper is None and self.idle_timeout > 0:
+            self._reaper = asyncio.create_task(self._reap())
+
+    async def close(self) -> None:
+        """Stop eviction and quit idle drivers; busy ones quit on release."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._reaper
+            self._reaper = None
+        while self._idle:
+            await self._quit(self._idle.pop())
+
+    async def acquire(self) -> typing.Any:
+        """
+        Check out a driver, waiting for a free slot if the pool is full.
+
+        Returns
+        -------
+        WebDriver
+            A healthy driver; hand it back with `release`.
+
+        Raises
+        ------
+        RuntimeError
+            If the pool has been closed.
+        selenium.common.exceptions.WebDriverException
+            If a new driver fails to start.
+        """
+        if self._closed:
+            raise RuntimeError("Driver pool is closed.")
+        started = time.monotonic()
+        self._waiting += 1
+        try:
+            await self._slots.acquire()
+        finally:
+            self._waiting -= 1
+            self._wait_seconds += time.monotonic() - started
+        try:
+            pooled = await self._checkout_idle() or await self._create()
+        except BaseException:
+            self._slots.release()
+            raise
+        pooled.uses += 1
+        self.stats["checkouts"] += 1
+        self._in_use[id(pooled.driver)] = pooled
+        return pooled.driver
+
+    async def release(self, driver: typing.Any, discard: bool = False) -> None:
+        """
+        Return a checked-out driver to the pool.
+
+        Parameters
+        ----------
+        driver : WebDriver
+            Driver obtained from `acquire`.
+        discard : bool, optional
+            Quit the driver instead of keeping it (default False).
+        """
+        pooled = self._in_use.pop(id(driver), None)
+        try:
+            if pooled is None:
+                return
+            if discard or self._closed or pooled.uses >= self.max_uses:
+                if not discard and not self._closed:
+                    self.stats["recycled"] += 1
+                await self._quit(pooled)
+                return
+            pooled.last_used = time.monotonic()
+            self._idle.append(pooled)
+        finally:
+            if pooled is not None:
+                self._slots.release()
+
+    @contextlib.asynccontextmanager
+    async def checkout(self) -> typing.AsyncIterator[typing.Any]:
+        """
+        Check out a driver for the duration of an `async with` block.
+
+        Yields
+        ------
+        WebDriver
+            A healthy driver. It is discarded rather than reused if the
+            block fails with a WebDriver error or is cancelled.
+        """
+        driver = await self.acquire()
+        discard = False
+        try:
+            yield driver
+        except (
+            selenium.common.exceptions.WebDriverException,
+            asyncio.CancelledError,
+        ):
+            discard = True
+            raise
+        finally:
+            await self.release(driver, discard=discard)
+
+    async def evict_idle(self) -> int:
+        """
+        Quit drivers idle for longer than `idle_timeout`.
+
+        Returns
+        -------
+        int
+            Number of drivers evicted.
+        """
+        deadline = time.monotonic() - self.idle_timeout
+        expired = [p for p in self._idle if p.last_used <= deadline]
+        # Detach every expired driver before the first await, so a
+        # concurrent checkout can neither take one nor race the removal.
+        for pooled in expired:
+            self._idle.remove(pooled)
+        self.stats["evicted"] += len(expired)
+        for pooled in expired:
+            await self._quit(pooled)
+        return len(expired)
+
+    def metrics(self) -> dict[str, typing.Any]:
+        """
+        Report pool occupancy and lifetime counters.
+
+        Returns
+        -------
+        dict[str, Any]
+            `in_use`, `idle`, `waiting` and `max_size` gauges, the
+            lifetime counters from `stats`, and the total seconds callers
+            spent waiting for a slot.
+        """
+        return {
+            "in_use": len(self._in_use),
+            "idle": len(self._idle),
+            "waiting": self._waiting,
+            "max_size": self.max_size,
+            "wait_seconds": round(self._wait_seconds, 6),
+            **self.stats,
+        }
+
+    async def _checkout_idle(self) -> typing.Optional[_PooledDriver]:
+        # Most recently used first: it is the warmest and least likely
+        # to have hit the idle timeout.
+        while self._idle:
+            pooled = self._idle.pop()
+            if await asyncio.to_thread(self.health_check, pooled.driver):
+                self.stats["reused"] += 1
+                return pooled
+            self.stats["unhealthy"] += 1
+            await self._quit(pooled)
+        return None
+
+    async def _create(self) -> _PooledDriver:
+        driver = await asyncio.to_thread(self.factory)
+        self.stats["created"] += 1
+        return _PooledDriver(driver)
+
+    async def _quit(self, pooled: _PooledDriver) -> None:
+        with contextlib.suppress(Exception):
+            await asyncio.to_thread(pooled.driver.quit)
+
+    async def _reap(self) -> None:
+        while True:
+            await asyncio.sleep(max(self.idle_timeout / 2, 1.0))
+            await self.evict_idle()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that frees its per-host slot once closed."""
+
+    def __init__(
+        self, stream: httpx.AsyncByteStream, release: typing.Callable[[], None]
+    ) -> None:
+        self._stream = stream
+        self._release: typing.Optional[typing.Callable[[], None]] = release
+
+    async def __aiter__(self) -> typing.AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class HostLimitedTransport(httpx.AsyncBaseTransport):
+    """
+    Async transport capping concurrent requests per host.
+
+    httpx only bounds connections for the whole pool; this wrapper adds
+    a per-host semaphore so a single slow upstream cannot occupy every
+    pooled connection. A slot is held until the response body is closed.
+    A host's semaphore and counters are dropped once it has no requests
+    in flight or waiting, so fanning out to many hosts does not grow the
+    transport without bound.
+
+    Parameters
+    ----------
+    transport : httpx.AsyncBaseTransport
+        Transport that performs the requests.
+    per_host : int
+        Maximum in-flight requests to any single host.
+
+    Examples
+    --------
+    >>> transport = HostLimitedTransport(httpx.AsyncHTTPTransport(), 4)
+    >>> client = httpx.AsyncClient(transport=transport)
     """
-    driver: selenium.webdriver.remote.webdriver.WebDriver = (
-        selenium.webdriver.Chrome(
-            options=typing.cast(
-                "selenium.webdriver.chrome.options.Options",
-                chrome_options,
-            )
+
+    def __init__(
+        self, transport: httpx.AsyncBaseTransport, per_host: int
+    ) -> None:
+        self.transport = transport
+        self.per_host = per_host
+        self._hosts: dict[str, asyncio.Semaphore] = {}
+        self._in_flight: collections.Counter[str] = collections.Counter()
+        self._waiting: collections.Counter[str] = collections.Counter()
+
+    async def handle_async_request(
+        self, request: httpx.Request
+    ) -> httpx.Response:
+        """
+        Send a request once a slot for its host is free.
+
+        Parameters
+        ----------
+        request : httpx.Request
+            Outgoing request.
+
+        Returns
+        -------
+        httpx.Response
+            Response whose body releases the host slot when closed.
+        """
+        host = request.url.netloc.decode("ascii")
+        slots = self._hosts.get(host)
+        if slots is None:
+            slots = self._hosts[host] = asyncio.Semaphore(self.per_host)
+        self._waiting[host] += 1
+        try:
+            await slots.acquire()
+        except BaseException:
+            self._waiting[host] -= 1
+            self._forget_idle(host)
+            raise
+        self._waiting[host] -= 1
+        self._in_flight[host] += 1
+
+        def release() -> None:
+            self._in_flight[host] -= 1
+            slots.release()
+            self._forget_idle(host)
+
+        try:
+            response = await self.transport.handle_async_request(request)
+        except BaseException:
+            release()
+            raise
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(
+                typing.cast("httpx.AsyncByteStream", response.stream),
+                release,
+            ),
+            extensions=response.extensions,
         )
+
+    async def aclose(self) -> None:
+        """Close the wrapped transport and its pooled connections."""
+        await self.transport.aclose()
+
+    def _forget_idle(self, host: str) -> None:
+        if self._in_flight[host] or self._waiting[host]:
+            return
+        # Nothing holds the semaphore any more; a later request to the
+        # host starts a fresh one.
+        self._hosts.pop(host, None)
+        del self._in_flight[host]
+        del self._waiting[host]
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """
+        Report per-host request counts.
+
+        Returns
+        -------
+        dict[str, dict[str, int]]
+            `in_flight` and `waiting` requests for every host with
+            requests in flight or waiting.
+        """
+        return {
+            host: {
+                "in_flight": self._in_flight[host],
+                "waiting": self._waiting[host],
+            }
+            for host in self._hosts
+        }
+
+
+def build_http_client(
+    max_connections: int = 100,
+    max_keepalive: int = 20,
+    keepalive_expiry: float = 30.0,
+    per_host: int = 10,
+    http2: bool = True,
+    timeout: float = 10.0,
+    connect_timeout: float = 5.0,
+) -> httpx.AsyncClient:
+    """
+    Create the shared, connection-pooling HTTP client for transforms.
+
+    Parameters
+    ----------
+    max_connections : int, optional
+        Total connections in the pool (default 100).
+    max_keepalive : int, optional
+        Idle keep-alive connections retained (default 20).
+    keepalive_expiry : float, optional
+        Seconds an idle connection is kept open (default 30.0).
+    per_host : int, optional
+        Concurrent requests allowed to a single host (default 10).
+    http2 : bool, optional
+        Negotiate HTTP/2 when the optional `h2` package is installed
+        (default True).
+    timeout : float, optional
+        Read, write and pool timeout in seconds (default 10.0).
+    connect_timeout : float, optional
+        Connect timeout in seconds (default 5.0).
+
+    Returns
+    -------
+    httpx.AsyncClient
+        Client the caller must close with `aclose()`; its transport is a
+        `HostLimitedTransport`.
+
+    Examples
+    --------
+    >>> client = build_http_client(per_host=4)
+    >>> response = await client.get("https://example.com")
+    >>> await client.aclose()
+    """
+    if http2 and importlib.util.find_spec("h2") is None:
+        log.warning("HTTP/2 requested but 'h2' is not installed; using 1.1")
+        http2 = False
+    transport = httpx.AsyncHTTPTransport(
+        http2=http2,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry,
+        ),
+    )
+    return httpx.AsyncClient(
+        transport=HostLimitedTransport(transport, per_host),
+        timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        follow_redirects=True,
     )
-    driver.get("https://example.com")
-    driver.quit()
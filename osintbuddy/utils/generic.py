@@ -1,3 +1,4 @@
+import functools
 import re
 import typing
 import unicodedata
@@ -6,6 +7,9 @@ import urllib.parse
 T = typing.TypeVar("T")
 EMAIL_REGEX: typing.Pattern[str] = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
 MAP_KEY: str = "___obmap___"
+CASE_CACHE_SIZE: int = 4096
+CAMEL_BOUNDARY_REGEX: typing.Pattern[str] = re.compile(r"([a-z0-9])([A-Z])")
+UNDERSCORES_REGEX: typing.Pattern[str] = re.compile(r"__+")
 
 
 def chunks(lst: typing.List[T], n: int) -> typing.Iterator[typing.List[T]]:
@@ -145,6 +149,7 @@ def slugify(value: typing.Any, allow_unicode: bool = False) -> str:
     return re.sub(r"[-\s]+", "-", text).strip("-_")
 
 
+@functools.lru_cache(maxsize=CASE_CACHE_SIZE)
 def to_camel_case(value: str) -> str:
     """
     Convert a snake_case or space-separated string to camelCase.
@@ -168,6 +173,7 @@ def to_camel_case(value: str) -> str:
     return parts[0] + "".join(word.title() for word in parts[1:])
 
 
+@functools.lru_cache(maxsize=CASE_CACHE_SIZE)
 def to_snake_case(name: str) -> str:
     """
     Convert camelCase or kebab-case string to snake_case.
@@ -188,13 +194,52 @@ def to_snake_case(name: str) -> str:
     'my_function_name'
     >>> to_snake_case("my-function-name")
     'my_function_name'
+
+    Notes
+    -----
+    Results are memoized in a bounded LRU cache of `CASE_CACHE_SIZE`
+    entries, see `case_cache_info`.
     """
     camel: str = to_camel_case(name.replace("-", "_"))
-    step1: str = re.sub(r"([a-z0-9])([A-Z])", r"\1_\2", camel)
-    step2: str = re.sub(r"__+", "_", step1)
+    step1: str = CAMEL_BOUNDARY_REGEX.sub(r"\1_\2", camel)
+    step2: str = UNDERSCORES_REGEX.sub("_", step1)
     return step2.lower()
 
 
+def case_cache_info() -> dict[str, dict[str, int]]:
+    """
+    Report hit/miss counters for the case conversion caches.
+
+    Returns
+    -------
+    dict[str, dict[str, int]]
+        Per-function `hits`, `misses`, `size` and `maxsize` counters.
+
+    Examples
+    --------
+    >>> case_cache_clear()
+    >>> _ = to_snake_case("IP Address"), to_snake_case("IP Address")
+    >>> case_cache_info()["to_snake_case"]["hits"]
+    1
+    """
+    stats: dict[str, dict[str, int]] = {}
+    for func in (to_camel_case, to_snake_case):
+        info = func.cache_info()
+        stats[func.__name__] = {
+            "hits": info.hits,
+            "misses": info.misses,
+            "size": info.currsize,
+            "maxsize": info.maxsize or 0,
+        }
+    return stats
+
+
+def case_cache_clear() -> None:
+    """Empty the case conversion caches and reset their counters."""
+    to_camel_case.cache_clear()
+    to_snake_case.cache_clear()
+
+
 @typing.overload
 def dkeys_to_snake_case(
     data: typing.Dict[str, typing.Any],
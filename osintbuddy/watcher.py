@@ -0,0 +1,183 @@
+"""
+Plugin directory watcher for in-process hot reloading.
+
+Uses Linux inotify through `ctypes` when it is available and falls back to
+polling file stats everywhere else. Bursts of events are debounced into a
+single call of the supplied change callback, which the server points at
+`osintbuddy.plugins.reload_plugins`.
+"""
+
+import asyncio
+import contextlib
+import ctypes
+import ctypes.util
+import glob
+import logging
+import os
+import struct
+import sys
+import typing
+
+log: logging.Logger = logging.getLogger("plugins.watcher")
+
+IN_MODIFY: int = 0x00000002
+IN_CLOSE_WRITE: int = 0x00000008
+IN_MOVED_FROM: int = 0x00000040
+IN_MOVED_TO: int = 0x00000080
+IN_CREATE: int = 0x00000100
+IN_DELETE: int = 0x00000200
+IN_NONBLOCK: int = 0o4000
+IN_CLOEXEC: int = 0o2000000
+WATCH_MASK: int = (
+    IN_MODIFY
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+)
+EVENT_HEADER: struct.Struct = struct.Struct("iIII")
+
+
+class PluginWatcher:
+    """
+    Watch a plugin directory and call back when `*.py` files change.
+
+    Parameters
+    ----------
+    plugins_path : str
+        Directory to watch.
+    on_change : Callable[[], Any]
+        Called once per debounced burst of changes. Plain functions run
+        in a worker thread so reloads do not stall the event loop;
+        coroutine functions are awaited on it.
+    interval : float, optional
+        Seconds between scans for the polling backend (default 1.0).
+    debounce : float, optional
+        Seconds to wait for further events before calling back (default 0.2).
+    backend : str, optional
+        `"auto"`, `"inotify"` or `"poll"` (default `"auto"`).
+
+    Attributes
+    ----------
+    backend : str
+        Backend in use once started: `"inotify"` or `"poll"`.
+
+    Examples
+    --------
+    >>> watcher = PluginWatcher("plugins", on_change=lambda: None)
+    >>> await watcher.start()
+    >>> watcher.backend
+    'inotify'
+    >>> await watcher.stop()
+    """
+
+    def __init__(
+        self,
+        plugins_path: str,
+        on_change: typing.Callable[[], typing.Any],
+        interval: float = 1.0,
+        debounce: float = 0.2,
+        backend: str = "auto",
+    ) -> None:
+        self.plugins_path = os.path.abspath(plugins_path)
+        self.on_change = on_change
+        self.interval = interval
+        self.debounce = debounce
+        self.backend = backend
+        self._changed = asyncio.Event()
+        self._tasks: typing.List[asyncio.Task[None]] = []
+        self._fd: typing.Optional[int] = None
+
+    async def start(self) -> None:
+        """Start watching in background tasks on the running loop."""
+        if self.backend in ("auto", "inotify") and self._start_inotify():
+            self.backend = "inotify"
+        else:
+            self.backend = "poll"
+            self._tasks.append(asyncio.create_task(self._poll()))
+        self._tasks.append(asyncio.create_task(self._dispatch()))
+        log.info(f"Watching {self.plugins_path} ({self.backend})")
+
+    async def stop(self) -> None:
+        """Stop watching and release the inotify descriptor."""
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        self._tasks.clear()
+        if self._fd is not None:
+            asyncio.get_running_loop().remove_reader(self._fd)
+            os.close(self._fd)
+            self._fd = None
+
+    def _start_inotify(self) -> bool:
+        if not sys.platform.startswith("linux"):
+            return False
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            return False
+        try:
+            libc = ctypes.CDLL(libc_name, use_errno=True)
+            fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        except (OSError, AttributeError):
+            return False
+        if fd < 0:
+            return False
+        watch = libc.inotify_add_watch(
+            fd, os.fsencode(self.plugins_path), WATCH_MASK
+        )
+        if watch < 0:
+            os.close(fd)
+            return False
+        self._fd = fd
+        asyncio.get_running_loop().add_reader(fd, self._read_events)
+        return True
+
+    def _read_events(self) -> None:
+        if self._fd is None:
+            return
+        try:
+            data = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            _, _, _, length = EVENT_HEADER.unpack_from(data, offset)
+            start = offset + EVENT_HEADER.size
+            name = data[start : start + length].rstrip(b"\0")
+            offset = start + length
+            if name.endswith(b".py"):
+                self._changed.set()
+
+    def _snapshot(self) -> dict[str, tuple[int, int]]:
+        snapshot: dict[str, tuple[int, int]] = {}
+        for path in glob.glob(f"{self.plugins_path}/*.py"):
+            with contextlib.suppress(OSError):
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    async def _poll(self) -> None:
+        previous = self._snapshot()
+        while True:
+            await asyncio.sleep(self.interval)
+            current = self._snapshot()
+            if current != previous:
+                previous = current
+                self._changed.set()
+
+    async def _dispatch(self) -> None:
+        while True:
+            await self._changed.wait()
+            # Let editors finish writing/renaming before reloading.
+            await asyncio.sleep(self.debounce)
+            self._changed.clear()
+            try:
+                if asyncio.iscoroutinefunction(self.on_change):
+                    await self.on_change()
+                else:
+                    await asyncio.to_thread(self.on_change)
+            except Exception:
+                log.exception("Plugin reload failed")
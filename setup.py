@@ -39,6 +39,10 @@ setup(
         "test": parse_requirements("requirements-test.txt")
         if Path("requirements-test.txt").exists()
         else [],
+        "fast": ["orjson>=3.8"],
+        "msgpack": ["msgpack>=1.0"],
+        "brotli": ["brotli>=1.0"],
+        "zstd": ["zstandard>=0.20"],
     },
     entry_points={
         "console_scripts": [
@@ -0,0 +1,62 @@
+"""Shared fixtures: a plugin directory and the server app loading it."""
+
+import importlib
+import pathlib
+import sys
+import types
+import typing
+
+import pytest
+
+import osintbuddy.config
+import osintbuddy.plugins
+
+PLUGIN_SOURCE = '''
+import asyncio
+
+import osintbuddy as ob
+from osintbuddy.elements import TextInput
+
+
+class Echo(ob.Plugin):
+    label = "Echo"
+    entity = [TextInput(label="Value")]
+
+    @ob.transform(label="To Many", edge_label="many")
+    async def transform_to_many(self, node, use):
+        return [
+            {"label": "Echo", "value": f"{node.value}-{i}"} for i in range(3)
+        ]
+
+    @ob.transform(label="To Sleep")
+    async def transform_to_sleep(self, node, use):
+        await asyncio.sleep(30)
+        return []
+'''
+
+
+@pytest.fixture(scope="session")
+def server(tmp_path_factory: pytest.TempPathFactory) -> types.ModuleType:
+    """Import `osintbuddy.server` with a test plugin directory."""
+    plugins: pathlib.Path = tmp_path_factory.mktemp("plugins")
+    (plugins / "echo.py").write_text(PLUGIN_SOURCE)
+    osintbuddy.config.settings.plugins_path = str(plugins)
+    osintbuddy.config.settings.watch = False
+    return importlib.import_module("osintbuddy.server")
+
+
+@pytest.fixture
+def registry() -> typing.Iterator[type]:
+    """Restore the plugin registry after a test loads its own plugins."""
+    registry = osintbuddy.plugins.OBRegistry
+    plugins, records = list(registry.plugins), dict(registry.modules)
+    modules = {
+        record.name: sys.modules.get(record.name)
+        for record in records.values()
+    }
+    yield registry
+    registry.swap(plugins)
+    registry.modules = records
+    for name, module in modules.items():
+        if module is not None:
+            sys.modules[name] = module
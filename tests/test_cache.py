@@ -0,0 +1,125 @@
+"""Tests for the transform result cache tiers."""
+
+import asyncio
+import datetime
+import os
+import pathlib
+import time
+import typing
+
+import pytest
+
+import osintbuddy.cache as cache
+import osintbuddy.encoding as encoding
+
+
+def test_sqlite_store_connects_on_first_use(tmp_path: pathlib.Path) -> None:
+    store = cache.SQLiteStore(str(tmp_path / "cache.db"))
+    assert store._db is None
+    store.set("k", b"v", time.time() + 60)
+    assert store.get("k")[1] == b"v"
+    store.close()
+    assert store._db is None
+    assert store.get("k")[1] == b"v"
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="needs os.fork")
+def test_sqlite_store_reconnects_after_fork(tmp_path: pathlib.Path) -> None:
+    store = cache.SQLiteStore(str(tmp_path / "cache.db"))
+    store.set("parent", b"1", time.time() + 60)
+    inherited = store._db
+    pid = os.fork()
+    if pid == 0:
+        code = 1
+        try:
+            store.set("child", b"2", time.time() + 60)
+            code = 0 if store._db is not inherited else 1
+        finally:
+            os._exit(code)
+    _, status = os.waitpid(pid, 0)
+    assert os.waitstatus_to_exitcode(status) == 0
+    assert store._db is inherited
+    assert store.get("child")[1] == b"2"
+
+
+def test_sqlite_store_purge_drops_expired_rows(
+    tmp_path: pathlib.Path,
+) -> None:
+    store = cache.SQLiteStore(str(tmp_path / "cache.db"))
+    store.set("old", b"1", time.time() - 1)
+    store.set("new", b"2", time.time() + 60)
+    assert store.purge() == 1
+    assert store.get("old") is None
+    assert store.get("new") is not None
+
+
+def test_transform_cache_purges_in_background(
+    tmp_path: pathlib.Path,
+) -> None:
+    async def scenario() -> typing.Any:
+        results = cache.TransformCache(
+            disk=cache.SQLiteStore(str(tmp_path / "cache.db"))
+        )
+        results.disk.set("old", b"1", time.time() - 1)
+        await results.start(purge_interval=0.01)
+        await asyncio.sleep(0.1)
+        await results.close()
+        return results
+
+    results = asyncio.run(scenario())
+    assert results.stats["purged"] == 1
+    assert results._purger is None
+    assert results.disk._db is None
+
+
+def test_single_flight_extends_deadline_for_later_callers() -> None:
+    async def scenario() -> typing.Any:
+        flights = cache.SingleFlight()
+        gate = asyncio.Event()
+        seen: list[typing.Optional[float]] = []
+
+        async def work() -> str:
+            await gate.wait()
+            return "done"
+
+        leader = asyncio.ensure_future(
+            flights.do("k", work, deadline=10.0, extend=seen.append)
+        )
+        await asyncio.sleep(0)
+        earlier = asyncio.ensure_future(flights.do("k", work, deadline=5.0))
+        later = asyncio.ensure_future(flights.do("k", work, deadline=20.0))
+        unbounded = asyncio.ensure_future(flights.do("k", work))
+        await asyncio.sleep(0)
+        gate.set()
+        return seen, await asyncio.gather(leader, earlier, later, unbounded)
+
+    seen, results = asyncio.run(scenario())
+    assert seen == [20.0, None]
+    assert results == ["done"] * 4
+
+
+def test_transform_cache_hit_matches_encoded_miss(
+    tmp_path: pathlib.Path,
+) -> None:
+    value = [
+        {
+            "when": datetime.datetime(2024, 1, 2, 3, 4, 5),
+            "tags": {"a"},
+            "big": 2**70,
+        }
+    ]
+    expected = encoding.loads(encoding.dumps(value))
+
+    async def scenario() -> typing.Any:
+        results = cache.TransformCache(
+            disk=cache.SQLiteStore(str(tmp_path / "cache.db"))
+        )
+        await results.set("k", value, 60)
+        hit = await results.get("k")
+        results.memory.clear()
+        return hit, await results.get("k")
+
+    hit, disk_hit = asyncio.run(scenario())
+    assert hit == disk_hit == expected
+    assert expected[0]["when"] == "2024-01-02T03:04:05"
+    assert expected[0]["tags"] == ["a"]
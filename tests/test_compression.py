@@ -0,0 +1,109 @@
+"""Tests for the response compression middleware."""
+
+import asyncio
+import logging
+import typing
+
+import fastapi
+import fastapi.testclient
+import pytest
+
+import osintbuddy.compression as compression
+
+BODY: dict[str, str] = {"data": "x" * 4096}
+
+
+def make_client(**kwargs: object) -> fastapi.testclient.TestClient:
+    app = fastapi.FastAPI()
+
+    @app.get("/big")
+    async def big() -> dict[str, str]:
+        return BODY
+
+    @app.get("/small")
+    async def small() -> dict[str, str]:
+        return {"data": "x"}
+
+    app.add_middleware(compression.CompressionMiddleware, **kwargs)
+    return fastapi.testclient.TestClient(app)
+
+
+@pytest.mark.parametrize("accept_encoding", ["gzip", "identity", ""])
+def test_compressible_responses_vary_on_accept_encoding(
+    accept_encoding: str,
+) -> None:
+    response = make_client().get(
+        "/big", headers={"Accept-Encoding": accept_encoding}
+    )
+    assert response.json() == BODY
+    assert "Accept-Encoding" in response.headers["vary"]
+    expected = "gzip" if accept_encoding == "gzip" else None
+    assert response.headers.get("content-encoding") == expected
+
+
+def test_small_responses_do_not_vary() -> None:
+    response = make_client().get(
+        "/small", headers={"Accept-Encoding": "gzip"}
+    )
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
+
+
+def test_default_encodings_are_installed(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    with caplog.at_level(logging.WARNING, logger=compression.log.name):
+        middleware = compression.CompressionMiddleware(make_client().app)
+    assert middleware.encodings == list(compression.DEFAULT_ENCODINGS)
+    assert set(compression.DEFAULT_ENCODINGS) <= set(compression.CODECS)
+    assert not caplog.records
+
+
+@pytest.mark.parametrize(
+    "media_type", [b"application/x-ndjson", b"text/event-stream"]
+)
+def test_streams_start_before_their_first_chunk(media_type: bytes) -> None:
+    async def scenario() -> list[str]:
+        first_chunk = asyncio.Event()
+        sent: list[str] = []
+
+        async def app(
+            scope: typing.Any, receive: typing.Any, send: typing.Any
+        ) -> None:
+            await send(
+                {
+                    "type": "http.response.start",
+                    "status": 200,
+                    "headers": [(b"content-type", media_type)],
+                }
+            )
+            await first_chunk.wait()
+            await send(
+                {
+                    "type": "http.response.body",
+                    "body": b"{}\n" * 1024,
+                    "more_body": True,
+                }
+            )
+            await send({"type": "http.response.body", "body": b""})
+
+        async def send(message: typing.Any) -> None:
+            sent.append(message["type"])
+
+        async def receive() -> typing.Any:
+            return {"type": "http.request", "body": b""}
+
+        middleware = compression.CompressionMiddleware(app)
+        scope = {"type": "http", "headers": [(b"accept-encoding", b"gzip")]}
+        task = asyncio.create_task(middleware(scope, receive, send))
+        await asyncio.sleep(0.05)
+        assert sent == ["http.response.start"]
+        first_chunk.set()
+        await task
+        return sent
+
+    assert asyncio.run(scenario()) == [
+        "http.response.start",
+        "http.response.body",
+        "http.response.body",
+    ]
@@ -0,0 +1,173 @@
+"""Tests for the browser driver pool, using fake drivers."""
+
+import asyncio
+import time
+import typing
+
+import httpx
+import pytest
+import selenium.common.exceptions
+
+import osintbuddy.utils.deps as deps
+
+
+class FakeDriver:
+    """Stands in for a WebDriver session."""
+
+    def __init__(self) -> None:
+        self.quit_calls = 0
+        self.healthy = True
+
+    def quit(self) -> None:
+        self.quit_calls += 1
+
+
+def make_pool(
+    **kwargs: typing.Any,
+) -> tuple[deps.DriverPool, list[FakeDriver]]:
+    started: list[FakeDriver] = []
+
+    def factory() -> FakeDriver:
+        driver = FakeDriver()
+        started.append(driver)
+        return driver
+
+    pool = deps.DriverPool(
+        factory=factory,
+        health_check=lambda driver: driver.healthy,
+        **kwargs,
+    )
+    return pool, started
+
+
+def test_checkout_reuses_idle_driver() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool(max_size=2)
+        async with pool.checkout() as first:
+            pass
+        async with pool.checkout() as second:
+            assert second is first
+        return pool, started
+
+    pool, started = asyncio.run(scenario())
+    assert len(started) == 1
+    assert pool.metrics()["idle"] == 1
+    assert pool.stats["reused"] == 1
+
+
+def test_checkout_discards_driver_on_error() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool()
+        with pytest.raises(selenium.common.exceptions.WebDriverException):
+            async with pool.checkout():
+                raise selenium.common.exceptions.WebDriverException()
+        return pool, started
+
+    pool, started = asyncio.run(scenario())
+    assert started[0].quit_calls == 1
+    assert pool.metrics()["idle"] == 0
+
+
+def test_checkout_replaces_unhealthy_driver() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool()
+        async with pool.checkout() as driver:
+            driver.healthy = False
+        async with pool.checkout() as driver:
+            assert driver is started[1]
+        return pool, started
+
+    pool, started = asyncio.run(scenario())
+    assert started[0].quit_calls == 1
+    assert pool.stats["unhealthy"] == 1
+
+
+def test_release_recycles_after_max_uses() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool(max_uses=1)
+        async with pool.checkout():
+            pass
+        return pool, started
+
+    pool, started = asyncio.run(scenario())
+    assert started[0].quit_calls == 1
+    assert pool.stats["recycled"] == 1
+
+
+def test_evict_idle_quits_expired_drivers() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool(max_size=2, idle_timeout=60.0)
+        old = await pool.acquire()
+        fresh = await pool.acquire()
+        await pool.release(old)
+        await pool.release(fresh)
+        pool._idle[0].last_used = time.monotonic() - 120.0
+        return pool, started, await pool.evict_idle()
+
+    pool, started, evicted = asyncio.run(scenario())
+    assert evicted == 1
+    assert [driver.quit_calls for driver in started] == [1, 0]
+    assert pool.metrics()["idle"] == 1
+
+
+def test_evict_idle_tolerates_concurrent_checkout() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool(max_size=3, idle_timeout=60.0)
+        drivers = [await pool.acquire() for _ in range(3)]
+        for driver in drivers:
+            await pool.release(driver)
+        for pooled in pool._idle:
+            pooled.last_used = time.monotonic() - 120.0
+        # Checkouts interleave with the awaits inside evict_idle.
+        evicted, *_ = await asyncio.gather(
+            pool.evict_idle(), pool.acquire(), pool.acquire()
+        )
+        return pool, evicted
+
+    pool, evicted = asyncio.run(scenario())
+    assert evicted == 3
+    assert pool.metrics()["in_use"] == 2
+
+
+def test_close_quits_idle_drivers_and_rejects_checkouts() -> None:
+    async def scenario() -> typing.Any:
+        pool, started = make_pool(warm=2, max_size=2)
+        await pool.start()
+        busy = await pool.acquire()
+        await pool.close()
+        assert started[0].quit_calls + started[1].quit_calls == 1
+        await pool.release(busy)
+        with pytest.raises(RuntimeError):
+            await pool.acquire()
+        return started
+
+    started = asyncio.run(scenario())
+    assert [driver.quit_calls for driver in started] == [1, 1]
+
+
+def test_get_driver_quits_its_driver(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    driver = FakeDriver()
+    driver.get = lambda url: None
+    monkeypatch.setattr(deps, "start_driver", lambda options=None: driver)
+    assert deps.get_driver() is None
+    assert driver.quit_calls == 1
+
+
+def test_host_limited_transport_forgets_idle_hosts() -> None:
+    async def scenario() -> typing.Any:
+        transport = deps.HostLimitedTransport(
+            httpx.MockTransport(lambda request: httpx.Response(200)), 2
+        )
+        async with httpx.AsyncClient(transport=transport) as client:
+            for i in range(50):
+                await client.get(f"https://host{i}.example/")
+            async with client.stream("GET", "https://busy.example/"):
+                busy = transport.metrics()
+        return transport, busy
+
+    transport, busy = asyncio.run(scenario())
+    assert busy == {"busy.example": {"in_flight": 1, "waiting": 0}}
+    assert transport.metrics() == {}
+    assert not transport._hosts
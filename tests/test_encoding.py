@@ -0,0 +1,81 @@
+"""Tests for JSON and MessagePack response encoding."""
+
+import dataclasses
+import datetime
+import decimal
+import enum
+import pathlib
+import typing
+import uuid
+
+import fastapi.encoders
+import pydantic
+import pytest
+
+import osintbuddy.encoding as encoding
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+class Point(pydantic.BaseModel):
+    x: int
+    y: int
+
+
+@dataclasses.dataclass
+class Pair:
+    left: int
+    right: str
+
+
+VALUE: dict[str, typing.Any] = {
+    "set": {1},
+    "frozenset": frozenset(["a"]),
+    "tuple": (1, "b"),
+    "bytes": b"raw",
+    "decimal": decimal.Decimal("1.5"),
+    "integral": decimal.Decimal("2"),
+    "path": pathlib.PurePosixPath("/tmp/x"),
+    "uuid": uuid.UUID(int=1),
+    "datetime": datetime.datetime(2024, 1, 2, 3, 4, 5),
+    "date": datetime.date(2024, 1, 2),
+    "timedelta": datetime.timedelta(seconds=90),
+    "enum": Color.RED,
+    "model": Point(x=1, y=2),
+    "dataclass": Pair(1, "r"),
+    "nested": [{"tags": {"x"}}],
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(
+    request: pytest.FixtureRequest, monkeypatch: pytest.MonkeyPatch
+) -> str:
+    if request.param == "json":
+        monkeypatch.setattr(encoding, "orjson", None)
+    elif encoding.orjson is None:
+        pytest.skip("orjson is not installed")
+    return str(request.param)
+
+
+def test_dumps_matches_jsonable_encoder(backend: str) -> None:
+    expected = fastapi.encoders.jsonable_encoder(VALUE)
+    assert encoding.loads(encoding.dumps(VALUE)) == expected
+    assert encoding.loads(encoding.dumps(VALUE, indent=True)) == expected
+
+
+def test_dumps_encodes_big_integers(backend: str) -> None:
+    value = {"big": 2**70, "small": -(2**65)}
+    assert encoding.loads(encoding.dumps(value)) == value
+
+
+@pytest.mark.skipif(not encoding.HAS_MSGPACK, reason="needs msgpack")
+def test_packb_converts_like_json() -> None:
+    value = {"set": {1}, "decimal": decimal.Decimal("0.5"), "b": b"\x00"}
+    assert encoding.unpackb(encoding.packb(value)) == {
+        "set": [1],
+        "decimal": 0.5,
+        "b": b"\x00",
+    }
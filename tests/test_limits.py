@@ -0,0 +1,49 @@
+"""Tests for the transform concurrency bulkheads."""
+
+import asyncio
+import threading
+import typing
+
+import pytest
+
+import osintbuddy.executors as executors
+import osintbuddy.limits as limits
+
+
+def test_hold_releases_slots_on_exit() -> None:
+    async def scenario() -> typing.Any:
+        bulkheads = limits.Bulkheads(global_limit=1)
+        async with bulkheads.hold([("Plugin", 1)]):
+            during = bulkheads.metrics()
+        return during, bulkheads.metrics()
+
+    during, after = asyncio.run(scenario())
+    assert during["Plugin"]["active"] == during["*"]["active"] == 1
+    assert after["Plugin"]["active"] == after["*"]["active"] == 0
+
+
+def test_hold_keeps_slots_while_thread_outlives_timeout() -> None:
+    pools = executors.Executors(thread_workers=2)
+    gate = threading.Event()
+
+    async def scenario() -> typing.Any:
+        bulkheads = limits.Bulkheads()
+        with pytest.raises(TimeoutError):
+            async with asyncio.timeout(0.05):
+                async with bulkheads.hold([("Plugin", 1)]):
+                    await pools.run_in_thread(gate.wait, {})
+        stranded = bulkheads.metrics()["Plugin"]["active"]
+        gate.set()
+        for _ in range(100):
+            if not bulkheads.metrics()["Plugin"]["active"]:
+                break
+            await asyncio.sleep(0.01)
+        return stranded, bulkheads.metrics()["Plugin"]["active"]
+
+    try:
+        stranded, after = asyncio.run(scenario())
+    finally:
+        gate.set()
+        pools.shutdown()
+    assert stranded == 1
+    assert after == 0
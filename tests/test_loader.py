@@ -0,0 +1,67 @@
+"""Tests for statically scanning plugin modules."""
+
+import pathlib
+
+import pytest
+
+import osintbuddy.loader as loader
+
+STATIC = '''
+import osintbuddy as ob
+
+
+class Domain(ob.Plugin):
+    label = "Domain"
+
+    @ob.transform(label="To IP", icon="world")
+    async def transform_to_ip(self, node, use):
+        return []
+'''
+
+DYNAMIC = '''
+import osintbuddy as ob
+
+OPTS = {"label": "To IP"}
+
+
+class Domain(ob.Plugin):
+    label = "Domain"
+
+    @ob.transform(**OPTS)
+    async def transform_to_ip(self, node, use):
+        return []
+'''
+
+
+def test_extract_manifest_reads_literal_declarations() -> None:
+    (manifest,) = loader.extract_manifest(STATIC) or []
+    assert manifest.label == "Domain"
+    assert manifest.transform_labels == [{"label": "To IP", "icon": "world"}]
+
+
+@pytest.mark.parametrize(
+    "decorator",
+    [
+        "@ob.transform(**OPTS)",
+        '@ob.transform(label="To IP", **OPTS)',
+        "@ob.transform(icon='world')",
+        "@ob.transform(label=LABEL)",
+    ],
+)
+def test_extract_manifest_defers_computed_transform_labels(
+    decorator: str,
+) -> None:
+    source = DYNAMIC.replace("@ob.transform(**OPTS)", decorator)
+    assert loader.extract_manifest(source) is None
+
+
+def test_scan_module_leaves_computed_labels_to_execution(
+    tmp_path: pathlib.Path,
+) -> None:
+    (tmp_path / "static.py").write_text(STATIC)
+    (tmp_path / "dynamic.py").write_text(DYNAMIC)
+    static, dynamic = loader.scan_modules(
+        [str(tmp_path / "static.py"), str(tmp_path / "dynamic.py")]
+    )
+    assert static.plugins is not None and static.error is None
+    assert dynamic.plugins is None and dynamic.error is None
@@ -0,0 +1,176 @@
+"""Tests for mapping entity payloads to transform input."""
+
+import copy
+import pickle
+import typing
+
+import pytest
+
+import osintbuddy.elements as elements
+import osintbuddy.errors as errors
+import osintbuddy.plugins as plugins
+import osintbuddy.utils as utils
+
+
+def legacy_map(node: dict[str, typing.Any]) -> dict[str, typing.Any]:
+    """Map an entity the way `OBPlugin` did before `NodeView`."""
+    transform_map: dict[str, typing.Any] = {}
+    for item in node.get("data", {}).get("elements", []):
+        for element in item if isinstance(item, list) else [item]:
+            label = utils.to_snake_case(element.pop("label", ""))
+            transform_map[label] = {}
+            element.pop("icon", None)
+            element_type = element.pop("type", "")
+            element.pop("placeholder", None)
+            element.pop("style", None)
+            element.pop("options", None)
+            for k, v in element.items():
+                if (
+                    isinstance(v, str)
+                    and len(element) == 1
+                    or element_type == "dropdown"
+                ):
+                    transform_map[label] = v
+                else:
+                    transform_map[label][k] = v
+    return transform_map
+
+
+ENTITY: dict[str, typing.Any] = {
+    "label": "Sample",
+    "data": {
+        "elements": [
+            {
+                "label": "Domain",
+                "type": "text",
+                "icon": "world",
+                "placeholder": "example.com",
+                "value": "example.com",
+            },
+            {
+                "label": "Engine",
+                "type": "dropdown",
+                "options": [{"label": "Google"}],
+                "value": {"label": "Google", "url": "https://google.com"},
+            },
+            [
+                {"label": "Latitude", "type": "text", "value": "1.5"},
+                {"label": "Coordinates", "type": "text", "x": 1, "y": 2},
+            ],
+            {"label": "Notes", "type": "title", "title": "T", "subtitle": ""},
+            {"label": "Empty", "type": "dropdown"},
+            {"label": "Count", "type": "number", "value": 3},
+        ]
+    },
+}
+
+
+class Loose(plugins.OBPlugin):
+    label = "Loose"
+    entity: list[typing.Any] = []
+
+
+class Strict(plugins.OBPlugin):
+    label = "Strict"
+    entity: list[typing.Any] = []
+    strict = True
+
+
+@pytest.mark.parametrize("plugin", [Loose, Strict])
+def test_mapper_matches_legacy_mapper(
+    plugin: type[plugins.OBPlugin],
+) -> None:
+    entity = copy.deepcopy(ENTITY)
+    node = plugin._map_to_transform_data(entity)
+    assert entity == ENTITY
+    assert node.model_dump() == legacy_map(copy.deepcopy(ENTITY))
+    assert isinstance(node, plugins.OBNode) == plugin.strict
+
+
+def test_mapper_returns_node_view_by_default() -> None:
+    node = Loose._map_to_transform_data(copy.deepcopy(ENTITY))
+    assert isinstance(node, plugins.NodeView)
+    assert node.domain == node["domain"] == "example.com"
+    assert node.engine == {"label": "Google", "url": "https://google.com"}
+    assert node.empty == {}
+    assert dict(node) == node.model_dump()
+    assert node == Strict._map_to_transform_data(copy.deepcopy(ENTITY))
+
+
+def test_node_view_copies_and_pickles() -> None:
+    node = plugins.NodeView({"domain": "example.com", "tags": ["a"]})
+    shallow = copy.copy(node)
+    shallow.domain = "other.com"
+    assert node.domain == "example.com"
+    assert shallow.tags is node.tags
+    deep = copy.deepcopy(node)
+    assert deep == node
+    assert deep.tags is not node.tags
+    restored = pickle.loads(pickle.dumps(node))
+    assert isinstance(restored, plugins.NodeView)
+    assert restored.model_dump() == node.model_dump()
+
+
+class Declared(plugins.OBPlugin):
+    label = "Declared"
+    entity = [
+        elements.TextInput(label="Domain"),
+        [elements.DropdownInput(label="Search Engine")],
+    ]
+
+
+def test_schema_decodes_declared_entity() -> None:
+    node = Declared._map_to_transform_data(
+        {
+            "data": {
+                "elements": [
+                    {"label": "Domain", "type": "text", "value": "a.b"},
+                    [
+                        {
+                            "label": "search engine",
+                            "type": "dropdown",
+                            "value": {"label": "Google"},
+                        }
+                    ],
+                ]
+            }
+        }
+    )
+    assert node.model_dump() == {
+        "domain": "a.b",
+        "search_engine": {"label": "Google"},
+    }
+
+
+@pytest.mark.parametrize(
+    "element",
+    [
+        {"label": "Unknown", "type": "text", "value": "x"},
+        {"label": "Domain", "type": "dropdown", "value": "x"},
+        "Domain",
+        None,
+    ],
+)
+def test_schema_rejects_mismatched_elements(element: typing.Any) -> None:
+    with pytest.raises(errors.NodeInvalidValueError):
+        Declared._map_to_transform_data({"data": {"elements": [element]}})
+
+
+class WithDisplays(plugins.OBPlugin):
+    label = "With Displays"
+    entity = [
+        elements.Empty(),
+        [elements.TextInput(label="Domain"), elements.Empty()],
+        elements.CopyText(value="x"),
+    ]
+
+
+def test_schema_accepts_its_own_blueprint() -> None:
+    blueprint = WithDisplays.create()
+    node = WithDisplays._map_to_transform_data(copy.deepcopy(blueprint))
+    assert node.domain == ""
+    assert node.model_dump() == legacy_map(blueprint)
+    with pytest.raises(errors.NodeInvalidValueError):
+        WithDisplays._map_to_transform_data(
+            {"data": {"elements": [{"label": "", "type": "text"}]}}
+        )
@@ -0,0 +1,97 @@
+"""Tests for loading, reloading and resolving registered plugins."""
+
+import pathlib
+import threading
+
+import osintbuddy.plugins as plugins
+
+SOURCE = '''
+import osintbuddy as ob
+
+
+class {name}(ob.Plugin):
+    label = "{name}"
+    entity = []
+
+    @ob.transform(label="To Self")
+    async def transform_to_self(self, node, use):
+        return []
+'''
+
+
+def write_plugin(directory: pathlib.Path, name: str) -> None:
+    (directory / f"{name.lower()}.py").write_text(SOURCE.format(name=name))
+
+
+def test_reload_waits_for_registry_lock(
+    registry: type, tmp_path: pathlib.Path
+) -> None:
+    write_plugin(tmp_path, "Waiter")
+    done = threading.Event()
+
+    def reload() -> None:
+        plugins.reload_plugins(str(tmp_path))
+        done.set()
+
+    with plugins.registry_lock:
+        thread = threading.Thread(target=reload)
+        thread.start()
+        assert not done.wait(0.1)
+    thread.join(5)
+    assert done.is_set()
+    assert plugins.OBRegistry.lookup("Waiter") is not None
+
+
+def test_resolve_after_reload_removed_module(
+    registry: type, tmp_path: pathlib.Path
+) -> None:
+    write_plugin(tmp_path, "Gone")
+    plugins.reload_plugins(str(tmp_path), lazy=True)
+    stub = plugins.OBRegistry.lookup("Gone")
+    assert isinstance(stub, plugins.LazyPlugin)
+    (tmp_path / "gone.py").unlink()
+    plugins.reload_plugins(str(tmp_path), lazy=True)
+    assert plugins.OBRegistry.resolve(stub) is None
+    assert plugins.OBRegistry.lookup("Gone") is None
+
+
+SNAPSHOT = '''
+import osintbuddy as ob
+import osintbuddy.plugins
+
+{name}_SEEN = list(ob.Registry.labels)
+osintbuddy.plugins.{name}_SEEN = {name}_SEEN
+'''
+
+
+def test_reload_installs_plugins_in_one_swap(
+    registry: type, tmp_path: pathlib.Path
+) -> None:
+    write_plugin(tmp_path, "Staged")
+    source = (tmp_path / "staged.py").read_text()
+    (tmp_path / "staged.py").write_text(
+        source + SNAPSHOT.format(name="STAGED")
+    )
+    plugins.reload_plugins(str(tmp_path))
+    # The module ran after defining its plugin, yet did not see it.
+    assert "Staged" not in plugins.STAGED_SEEN  # type: ignore[attr-defined]
+    assert plugins.OBRegistry.labels.count("Staged") == 1
+
+
+def test_full_reload_keeps_plugins_visible(
+    registry: type, tmp_path: pathlib.Path
+) -> None:
+    write_plugin(tmp_path, "Kept")
+    plugins.reload_plugins(str(tmp_path))
+    old = plugins.OBRegistry.lookup("Kept")
+    source = (tmp_path / "kept.py").read_text()
+    (tmp_path / "kept.py").write_text(source + SNAPSHOT.format(name="KEPT"))
+    report = plugins.reload_plugins(str(tmp_path), full=True)
+    assert plugins.KEPT_SEEN.count("Kept") == 1  # type: ignore[attr-defined]
+    assert [change.path for change in report.changed] == [
+        str(tmp_path / "kept.py")
+    ]
+    assert plugins.OBRegistry.lookup("Kept") is not old
+    assert plugins.OBRegistry.labels.count("Kept") == 1
+    report = plugins.reload_plugins(str(tmp_path), full=True)
+    assert report.unchanged == 0 and len(report.changed) == 1
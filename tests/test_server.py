@@ -0,0 +1,215 @@
+"""Tests for the plugin server endpoints."""
+
+import asyncio
+import json
+import types
+import typing
+
+import fastapi.testclient
+import pytest
+import starlette.testclient
+
+RUN = {
+    "type": "run",
+    "transform": "to_many",
+    "data": {"label": "Echo", "elements": [{"label": "Value", "value": "a"}]},
+}
+
+
+def receive_until_done(
+    ws: starlette.testclient.WebSocketTestSession, job_id: str
+) -> list[dict[str, typing.Any]]:
+    messages = []
+    while True:
+        message = ws.receive_json()
+        messages.append(message)
+        if message["id"] == job_id and message["type"] in (
+            "done",
+            "error",
+            "cancelled",
+        ):
+            return messages
+
+
+def test_ws_survives_malformed_messages(server: types.ModuleType) -> None:
+    client = fastapi.testclient.TestClient(server.app)
+    with client.websocket_connect("/transforms/ws") as ws:
+        ws.send_text("not json")
+        assert ws.receive_json() == {
+            "type": "error",
+            "id": None,
+            "error": "Expected a JSON message.",
+        }
+        ws.send_bytes(b"\xff")
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json(["not", "an", "object"])
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({**RUN, "id": "a"})
+        messages = receive_until_done(ws, "a")
+    assert [m["type"] for m in messages] == [
+        "queued",
+        "started",
+        "node",
+        "node",
+        "node",
+        "done",
+    ]
+
+
+def test_ws_accepts_binary_json_frames(server: types.ModuleType) -> None:
+    client = fastapi.testclient.TestClient(server.app)
+    with client.websocket_connect("/transforms/ws") as ws:
+        ws.send_bytes(server.osintbuddy.encoding.dumps({**RUN, "id": "b"}))
+        assert receive_until_done(ws, "b")[-1]["count"] == 3
+
+
+def test_ws_rejects_jobs_beyond_pending_cap(
+    server: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server.settings, "ws_max_pending", 2)
+    client = fastapi.testclient.TestClient(server.app)
+    with client.websocket_connect("/transforms/ws") as ws:
+        for job_id in ("1", "2", "3"):
+            ws.send_json({**RUN, "transform": "to_sleep", "id": job_id})
+        rejected = receive_until_done(ws, "3")[-1]
+        assert rejected["type"] == "error"
+        assert rejected["error_type"] == "OBConcurrencyLimitError"
+        ws.send_json({"type": "cancel", "id": "1"})
+        receive_until_done(ws, "1")
+        ws.send_json({**RUN, "id": "4"})
+        assert receive_until_done(ws, "4")[-1]["type"] == "done"
+
+
+@pytest.mark.parametrize("timeout", ["0", "-1", "nan", "inf"])
+def test_transforms_reject_invalid_timeout_header(
+    server: types.ModuleType, timeout: str
+) -> None:
+    client = fastapi.testclient.TestClient(server.app)
+    response = client.post(
+        "/transforms",
+        json={"label": "Echo", **RUN},
+        headers={"X-OSINTBuddy-Timeout": timeout},
+    )
+    assert response.status_code == 422
+
+
+def test_ws_rejects_invalid_timeout(server: types.ModuleType) -> None:
+    client = fastapi.testclient.TestClient(server.app)
+    with client.websocket_connect("/transforms/ws") as ws:
+        ws.send_json({**RUN, "id": "t", "timeout": 0})
+        error = receive_until_done(ws, "t")[-1]
+    assert error["type"] == "error"
+    assert "timeout" in error["error"]
+
+
+@pytest.mark.parametrize(
+    ("accept", "packed"),
+    [
+        (None, False),
+        ("application/msgpack", True),
+        ("application/msgpack, application/json", True),
+        ("application/json, application/msgpack;q=0.5", False),
+        ("application/msgpack;q=0.5, */*", False),
+        ("application/msgpack;q=0.5, application/*", False),
+        ("application/msgpack, */*;q=0.1", True),
+        ("application/msgpack;q=0.5, application/json;q=0.1, */*", True),
+        ("*/*", False),
+    ],
+)
+def test_prefers_msgpack_weighs_wildcards(
+    server: types.ModuleType, accept: str | None, packed: bool
+) -> None:
+    if not server.osintbuddy.encoding.HAS_MSGPACK:
+        pytest.skip("needs msgpack")
+    assert server._prefers_msgpack(accept) is packed
+
+
+def test_packed_blueprint_dropped_with_registry_entry(
+    server: types.ModuleType,
+) -> None:
+    if not server.osintbuddy.encoding.HAS_MSGPACK:
+        pytest.skip("needs msgpack")
+    registry = server.osintbuddy.Registry
+    client = fastapi.testclient.TestClient(server.app)
+    response = client.get(
+        "/blueprint",
+        params={"label": registry.ALL_BLUEPRINTS},
+        headers={"Accept": "application/msgpack"},
+    )
+    assert response.headers["content-type"] == "application/msgpack"
+    assert response.headers["etag"].endswith('-msgpack"')
+    _, etag = registry.blueprints[registry.ALL_BLUEPRINTS]
+    assert etag in registry.packed_blueprints
+    cached = client.get(
+        "/blueprint",
+        params={"label": registry.ALL_BLUEPRINTS},
+        headers={
+            "Accept": "application/msgpack",
+            "If-None-Match": response.headers["etag"],
+        },
+    )
+    assert cached.status_code == 304
+    registry.swap(list(registry.plugins))
+    assert etag not in registry.packed_blueprints
+
+
+class SlowSocket:
+    """WebSocket stand-in whose client reads only once `reading` is set."""
+
+    def __init__(self) -> None:
+        self.incoming: asyncio.Queue[dict[str, typing.Any]] = asyncio.Queue()
+        self.reading = asyncio.Event()
+        self.sent: list[dict[str, typing.Any]] = []
+
+    def push(self, message: typing.Any) -> None:
+        text = message if isinstance(message, str) else json.dumps(message)
+        self.incoming.put_nowait({"type": "websocket.receive", "text": text})
+
+    async def receive(self) -> dict[str, typing.Any]:
+        return await self.incoming.get()
+
+    async def send_text(self, text: str) -> None:
+        await self.reading.wait()
+        self.sent.append(json.loads(text))
+
+
+def test_ws_delivers_replies_and_cancellations_when_backlogged(
+    server: types.ModuleType, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(server.settings, "ws_queue_size", 1)
+
+    async def scenario() -> list[dict[str, typing.Any]]:
+        socket = SlowSocket()
+        channel = server._TransformChannel(socket)
+        serving = asyncio.create_task(channel.serve())
+        for job_id in ("a", "b"):
+            socket.push({**RUN, "transform": "to_sleep", "id": job_id})
+        socket.push({"type": "cancel", "id": "a"})
+        # The outbox is full; replies must not hold up the next cancel.
+        socket.push("not json")
+        socket.push({"type": "cancel", "id": "b"})
+        for _ in range(100):
+            if not channel.jobs or all(
+                task.done() or task.cancelling()
+                for task in channel.jobs.values()
+            ):
+                break
+            await asyncio.sleep(0.01)
+        assert all(task.cancelling() for task in channel.jobs.values())
+        socket.reading.set()
+        for _ in range(100):
+            if not channel.jobs and not channel.replies:
+                break
+            await asyncio.sleep(0.01)
+        await asyncio.sleep(0.05)
+        socket.incoming.put_nowait({"type": "websocket.disconnect"})
+        await serving
+        return socket.sent
+
+    sent = asyncio.run(scenario())
+    terminal = {
+        message["id"]: message["type"]
+        for message in sent
+        if message["type"] in ("done", "error", "cancelled")
+    }
+    assert terminal == {"a": "cancelled", "b": "cancelled", None: "error"}